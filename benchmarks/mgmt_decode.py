@@ -0,0 +1,82 @@
+"""Compare MGMT receive paths under a synthetic Device Found flood.
+
+Run with ``python benchmarks/mgmt_decode.py``. The flood mimics an active
+scan on the same host: every MGMT socket receives each Device Found event,
+while recovery only subscribes to New Settings.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from contextlib import suppress
+import struct
+import timeit
+from unittest.mock import MagicMock
+
+from btsocket import btmgmt_protocol
+
+from bluetooth_auto_recovery.recover import BluetoothMGMTProtocol
+
+DEVICE_FOUND = 0x0012
+NEW_SETTINGS = 0x0006
+
+
+def _event(event_code: int, idx: int, params: bytes) -> bytes:
+    return struct.pack("<HHH", event_code, idx, len(params)) + params
+
+
+def build_flood(frames: int, settings_every: int) -> list[bytes]:
+    """Return ``frames`` events, one in ``settings_every`` being New Settings."""
+    eir = bytes(range(31))
+    device_found = _event(
+        DEVICE_FOUND,
+        0,
+        bytes(6) + struct.pack("<BbIH", 1, -60, 0, len(eir)) + eir,
+    )
+    new_settings = _event(NEW_SETTINGS, 0, struct.pack("<I", 1))
+    return [
+        new_settings if i % settings_every == 0 else device_found for i in range(frames)
+    ]
+
+
+def reader_path(flood: list[bytes]) -> None:
+    """Decode every frame with btsocket, as data_received used to."""
+    with suppress(AttributeError, ValueError):
+        for data in flood:
+            btmgmt_protocol.reader(data)
+
+
+async def _run(frames: int, settings_every: int, repeat: int) -> None:
+    flood = build_flood(frames, settings_every)
+    loop = asyncio.get_running_loop()
+    protocol = BluetoothMGMTProtocol(5, loop.create_future(), MagicMock())
+    protocol.subscribe(btmgmt_protocol.Events.NewSettingsEvent, lambda *_: None)
+
+    def peek_path() -> None:
+        for data in flood:
+            protocol.data_received(data)
+
+    for name, path in (
+        ("btsocket reader", lambda: reader_path(flood)),
+        ("header peek", peek_path),
+    ):
+        best = min(timeit.repeat(path, number=1, repeat=repeat))
+        print(
+            f"{name:>16}: {best * 1000:8.2f} ms per {frames} frames "
+            f"({best / frames * 1e6:.2f} us/frame)"
+        )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=20_000)
+    parser.add_argument("--settings-every", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(_run(args.frames, args.settings_every, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
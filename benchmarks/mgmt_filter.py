@@ -0,0 +1,76 @@
+"""Count MGMT socket wakeups with and without the kernel-side filter.
+
+Run with ``python benchmarks/mgmt_filter.py``. A socketpair stands in for the
+MGMT control channel, since the classic BPF program applies to any datagram
+socket. The flood mimics active scanning on several controllers while one
+controller is recovered.
+"""
+
+from __future__ import annotations
+
+import argparse
+import socket
+import struct
+
+from bluetooth_auto_recovery.bpf import attach_filter, mgmt_event_filter
+from bluetooth_auto_recovery.recover import _FILTERED_EVENTS
+
+DEVICE_FOUND = 0x0012
+NEW_SETTINGS = 0x0006
+COMMAND_COMPLETE = 0x0001
+
+
+def build_flood(frames: int, controllers: int) -> list[bytes]:
+    """Return Device Found events with a few replies and settings changes."""
+    eir = bytes(range(31))
+    device_found = bytes(6) + struct.pack("<BbIH", 1, -60, 0, len(eir)) + eir
+    flood = []
+    set_powered_reply = struct.pack("<HBI", 0x0005, 0, 1)
+    for i in range(frames):
+        idx = (i // 7) % controllers
+        if i % 200 == 0:
+            header = struct.pack("<HHH", COMMAND_COMPLETE, idx, len(set_powered_reply))
+            flood.append(header + set_powered_reply)
+        elif i % 100 == 0:
+            flood.append(struct.pack("<HHHI", NEW_SETTINGS, idx, 4, 1))
+        else:
+            header = struct.pack("<HHH", DEVICE_FOUND, idx, len(device_found))
+            flood.append(header + device_found)
+    return flood
+
+
+def count_wakeups(flood: list[bytes], program: bytes | None) -> int:
+    """Send the flood through a socketpair and count delivered datagrams."""
+    sender, receiver = socket.socketpair(socket.AF_UNIX, socket.SOCK_DGRAM)
+    with sender, receiver:
+        receiver.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 22)
+        receiver.setblocking(False)
+        if program is not None:
+            attach_filter(receiver, program)
+        wakeups = 0
+        for data in flood:
+            sender.send(data)
+            try:
+                while receiver.recv(512):
+                    wakeups += 1
+            except BlockingIOError:
+                pass
+        return wakeups
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=20_000)
+    parser.add_argument("--controllers", type=int, default=4)
+    args = parser.parse_args()
+    flood = build_flood(args.frames, args.controllers)
+    for name, program in (
+        ("unfiltered", None),
+        ("event filter", mgmt_event_filter(_FILTERED_EVENTS)),
+    ):
+        print(f"{name:>13}: {count_wakeups(flood, program):6} wakeups")
+
+
+if __name__ == "__main__":
+    main()
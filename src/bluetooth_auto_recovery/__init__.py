@@ -7,19 +7,59 @@ import importlib
 import sys
 from typing import TYPE_CHECKING
 
+from .config import PRESETS, RecoveryConfig
+from .history import RecoveryTimes, recovery_times
+
 if TYPE_CHECKING:
+    from collections.abc import Iterable
     from types import ModuleType
 
+    from .recover import RecoveryOutcome
+
 _MODULE_CACHE: dict[str, ModuleType] = {}
 
 
-async def recover_adapter(hci: int, mac: str, gone_silent: bool = False) -> bool:
+async def recover_adapter(
+    hci: int,
+    mac: str,
+    gone_silent: bool = False,
+    *,
+    budget: float | None = None,
+    config: RecoveryConfig | None = None,
+) -> bool:
     """Recover the Bluetooth adapter with the given HCI and MAC address.
 
     This function is a wrapper that late imports
     the `bluetooth_auto_recovery.recover` module and calls
     its `recover_adapter` function.
     """
+    recover_module = await _import_recover_module()
+    return await recover_module.recover_adapter(
+        hci, mac, gone_silent, budget=budget, config=config
+    )
+
+
+async def recover_adapters(
+    adapters: Iterable[tuple[int, str, bool]],
+    *,
+    concurrency: int | None = None,
+    budget: float | None = None,
+    config: RecoveryConfig | None = None,
+) -> dict[str, RecoveryOutcome]:
+    """Recover several Bluetooth adapters, given as (hci, mac, gone_silent).
+
+    This function is a wrapper that late imports
+    the `bluetooth_auto_recovery.recover` module and calls
+    its `recover_adapters` function.
+    """
+    recover_module = await _import_recover_module()
+    return await recover_module.recover_adapters(
+        adapters, concurrency=concurrency, budget=budget, config=config
+    )
+
+
+async def _import_recover_module() -> ModuleType:
+    """Import the recover module in the executor, once."""
     recover_module_name = f"{__package__}.recover"
 
     if not (recover_module := _MODULE_CACHE.get(recover_module_name)):
@@ -30,8 +70,16 @@ async def recover_adapter(hci: int, mac: str, gone_silent: bool = False) -> bool
         _MODULE_CACHE[recover_module_name] = recover_module
         this_module = sys.modules[__package__]
         this_module.recover_adapter = recover_module.recover_adapter  # type: ignore[attr-defined]
+        this_module.recover_adapters = recover_module.recover_adapters  # type: ignore[attr-defined]
 
-    return await recover_module.recover_adapter(hci, mac, gone_silent)
+    return recover_module
 
 
-__all__ = ["recover_adapter"]
+__all__ = [
+    "PRESETS",
+    "RecoveryConfig",
+    "RecoveryTimes",
+    "recover_adapter",
+    "recover_adapters",
+    "recovery_times",
+]
@@ -0,0 +1,229 @@
+"""Wait for BlueZ to publish an adapter on D-Bus."""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import suppress
+import logging
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+try:
+    from dbus_fast import BusType, Message, MessageType
+    from dbus_fast.aio import MessageBus
+except ImportError:  # pragma: no cover - dbus-fast is not installed
+    MessageBus = None  # type: ignore[assignment,misc]
+
+from .util import asyncio_timeout
+
+if TYPE_CHECKING:
+    from dbus_fast import Variant
+
+_LOGGER = logging.getLogger(__name__)
+
+BLUEZ_SERVICE = "org.bluez"
+ADAPTER_INTERFACE = "org.bluez.Adapter1"
+OBJECT_MANAGER_INTERFACE = "org.freedesktop.DBus.ObjectManager"
+PROPERTIES_INTERFACE = "org.freedesktop.DBus.Properties"
+BUS_SERVICE = "org.freedesktop.DBus"
+BUS_PATH = "/org/freedesktop/DBus"
+
+# Whether a BlueZ daemon is running is remembered this long, so back-to-back
+# recoveries do not each ask again.
+BLUEZ_PRESENCE_CACHE_TIME = 60
+BLUEZ_PRESENCE_TIMEOUT = 1
+
+_BLUEZ_PRESENCE: dict[str | None, tuple[float, bool]] = {}
+
+_MATCH_RULES = (
+    (
+        f"type='signal',sender='{BLUEZ_SERVICE}',"
+        f"interface='{OBJECT_MANAGER_INTERFACE}',member='InterfacesAdded'"
+    ),
+    (
+        f"type='signal',sender='{BLUEZ_SERVICE}',"
+        f"interface='{PROPERTIES_INTERFACE}',member='PropertiesChanged',"
+        f"arg0='{ADAPTER_INTERFACE}'"
+    ),
+)
+
+
+class _AdapterWatch:
+    """Resolve once BlueZ exports a matching Adapter1 object.
+
+    An adapter matches on its object path or, since a USB reset may move it to
+    a new hci number, on its address. With ``powered`` it must also report
+    Powered, either when it is exported or in a later PropertiesChanged.
+    """
+
+    def __init__(self, hci_name: str, mac: str, powered: bool) -> None:
+        """Initialize the watch."""
+        self.ready: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._paths = {f"/org/bluez/{hci_name}"}
+        self._mac = mac.upper()
+        self._powered = powered
+
+    def check(self, path: str, properties: dict[str, Variant]) -> None:
+        """Check the properties of an exported adapter."""
+        address = properties.get("Address")
+        if path not in self._paths and (
+            address is None or str(address.value).upper() != self._mac
+        ):
+            return
+        self._paths.add(path)
+        powered = properties.get("Powered")
+        if not self._powered or (powered is not None and powered.value is True):
+            self._resolve()
+
+    def on_message(self, message: Any) -> None:
+        """Handle a signal from BlueZ."""
+        if message.message_type is not MessageType.SIGNAL:
+            return
+        if message.member == "InterfacesAdded":
+            path, interfaces = message.body
+            if (properties := interfaces.get(ADAPTER_INTERFACE)) is not None:
+                self.check(path, properties)
+        elif message.member == "PropertiesChanged" and message.path in self._paths:
+            interface, changed, _invalidated = message.body
+            if interface == ADAPTER_INTERFACE:
+                self.check(message.path, changed)
+
+    def _resolve(self) -> None:
+        if not self.ready.done():
+            self.ready.set_result(None)
+
+
+async def wait_for_adapter(
+    hci_name: str,
+    mac: str,
+    timeout: float,
+    *,
+    reappearing: bool = False,
+    bus_address: str | None = None,
+) -> bool | None:
+    """Wait for BlueZ to export the powered Adapter1 object of an adapter.
+
+    Returns True once it is, False if it is not within ``timeout`` seconds
+    and None if D-Bus cannot be used, so the caller can fall back to a fixed
+    wait. An adapter that is ``reappearing`` after a USB reset only has to be
+    exported again: its old object may not be gone yet, so only one exported
+    after the call counts, and it may not be powered.
+    """
+    if MessageBus is None:  # pragma: no cover - dbus-fast is not installed
+        return None
+    watch = _AdapterWatch(hci_name, mac, powered=not reappearing)
+    bus: MessageBus | None = None
+    try:
+        async with asyncio_timeout(timeout):
+            if (bus := await _connect(bus_address)) is None:
+                return None
+            bus.add_message_handler(watch.on_message)
+            for rule in _MATCH_RULES:
+                await bus.call(
+                    Message(
+                        destination=BUS_SERVICE,
+                        path=BUS_PATH,
+                        interface=BUS_SERVICE,
+                        member="AddMatch",
+                        signature="s",
+                        body=[rule],
+                    )
+                )
+            # Subscribed first, so an adapter exported while this reads is
+            # not missed.
+            if not reappearing:
+                await _check_managed_objects(bus, watch)
+            await watch.ready
+            return True
+    except asyncio.TimeoutError:
+        return False
+    finally:
+        if bus is not None:
+            bus.disconnect()
+
+
+async def bluez_running(*, bus_address: str | None = None) -> bool:
+    """Return False only if no BlueZ daemon is running.
+
+    The daemon is looked for as the org.bluez name on the system bus, or as a
+    bluetoothd process when the bus cannot be reached. An answer that cannot
+    be had in time counts as running, so callers keep waiting for BlueZ.
+    """
+    loop = asyncio.get_running_loop()
+    cached = _BLUEZ_PRESENCE.get(bus_address)
+    if cached is not None and loop.time() - cached[0] < BLUEZ_PRESENCE_CACHE_TIME:
+        return cached[1]
+    running = True
+    with suppress(asyncio.TimeoutError):
+        async with asyncio_timeout(BLUEZ_PRESENCE_TIMEOUT):
+            owned = await _bluez_name_owned(bus_address)
+            if owned is None:
+                owned = await loop.run_in_executor(None, _bluetoothd_process_running)
+            running = owned
+    _BLUEZ_PRESENCE[bus_address] = (loop.time(), running)
+    return running
+
+
+async def _bluez_name_owned(bus_address: str | None) -> bool | None:
+    """Return whether org.bluez has an owner, or None without a bus."""
+    if MessageBus is None:  # pragma: no cover - dbus-fast is not installed
+        return None
+    if (bus := await _connect(bus_address)) is None:
+        return None
+    try:
+        reply = await bus.call(
+            Message(
+                destination=BUS_SERVICE,
+                path=BUS_PATH,
+                interface=BUS_SERVICE,
+                member="NameHasOwner",
+                signature="s",
+                body=[BLUEZ_SERVICE],
+            )
+        )
+    finally:
+        bus.disconnect()
+    if reply is None or reply.message_type is not MessageType.METHOD_RETURN:
+        return None
+    return bool(reply.body[0])
+
+
+def _bluetoothd_process_running() -> bool:
+    """Return True if a bluetoothd process is running."""
+    for comm in Path("/proc").glob("[0-9]*/comm"):
+        with suppress(OSError):
+            if comm.read_text().strip() == "bluetoothd":
+                return True
+    return False
+
+
+async def _connect(bus_address: str | None) -> MessageBus | None:
+    """Connect to the system bus, or the bus at ``bus_address``."""
+    try:
+        return await MessageBus(
+            bus_address=bus_address, bus_type=BusType.SYSTEM
+        ).connect()
+    except (OSError, EOFError, ValueError) as ex:
+        _LOGGER.debug("Could not connect to D-Bus: %s", ex)
+        return None
+
+
+async def _check_managed_objects(bus: MessageBus, watch: _AdapterWatch) -> None:
+    """Check the adapters BlueZ already exports."""
+    reply = await bus.call(
+        Message(
+            destination=BLUEZ_SERVICE,
+            path="/",
+            interface=OBJECT_MANAGER_INTERFACE,
+            member="GetManagedObjects",
+        )
+    )
+    if reply is None or reply.message_type is not MessageType.METHOD_RETURN:
+        _LOGGER.debug(
+            "Could not read the objects BlueZ exports: %s",
+            reply.body if reply else None,
+        )
+        return
+    for path, interfaces in reply.body[0].items():
+        if (properties := interfaces.get(ADAPTER_INTERFACE)) is not None:
+            watch.check(path, properties)
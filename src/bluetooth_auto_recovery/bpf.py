@@ -0,0 +1,61 @@
+"""Classic BPF socket filters for the MGMT control channel."""
+
+from __future__ import annotations
+
+import ctypes
+import socket
+import struct
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Collection
+
+# linux/filter.h
+BPF_LD_H_ABS = 0x28  # BPF_LD | BPF_H | BPF_ABS
+BPF_JEQ_K = 0x15  # BPF_JMP | BPF_JEQ | BPF_K
+BPF_RET_K = 0x06  # BPF_RET | BPF_K
+SO_ATTACH_FILTER = 26
+SO_DETACH_FILTER = 27
+
+# The MGMT header field seen by the filter: the event code at offset 0.
+MGMT_EVENT_CODE_OFFSET = 0
+
+ACCEPT = 0x40000
+DROP = 0
+
+_SOCK_FILTER = struct.Struct("HBBI")
+_SOCK_FPROG = struct.Struct("HP")
+
+
+def _be16(value: int) -> int:
+    """Return a little-endian MGMT field as BPF's big-endian halfword load sees it."""
+    return int.from_bytes(value.to_bytes(2, "little"), "big")
+
+
+def mgmt_event_filter(event_codes: Collection[int]) -> bytes:
+    """Build a program admitting only the MGMT events in ``event_codes``."""
+    program: list[tuple[int, int, int, int]] = [
+        (BPF_LD_H_ABS, 0, 0, MGMT_EVENT_CODE_OFFSET)
+    ]
+    # Layout after the code checks: [drop], then [accept].
+    codes = sorted(set(event_codes))
+    for position, code in enumerate(codes):
+        remaining = len(codes) - position - 1
+        program.append((BPF_JEQ_K, remaining + 1, 0, _be16(code)))
+    program.append((BPF_RET_K, 0, 0, DROP))
+    program.append((BPF_RET_K, 0, 0, ACCEPT))
+    return b"".join(_SOCK_FILTER.pack(*instruction) for instruction in program)
+
+
+def attach_filter(sock: socket.socket, program: bytes) -> None:
+    """Attach a classic BPF ``program``, replacing any previous filter."""
+    buffer = ctypes.create_string_buffer(program)
+    fprog = _SOCK_FPROG.pack(
+        len(program) // _SOCK_FILTER.size, ctypes.addressof(buffer)
+    )
+    sock.setsockopt(socket.SOL_SOCKET, SO_ATTACH_FILTER, fprog)
+
+
+def detach_filter(sock: socket.socket) -> None:
+    """Remove the filter attached to ``sock``."""
+    sock.setsockopt(socket.SOL_SOCKET, SO_DETACH_FILTER, 0)
@@ -0,0 +1,84 @@
+"""Cool down adapters that keep failing to recover."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import logging
+from time import monotonic
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .config import RecoveryConfig
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class _AdapterFailures:
+    """Consecutive failed recoveries of one adapter."""
+
+    hci: int
+    count: int = 0
+    cooling_until: float = 0.0
+
+
+class CircuitBreaker:
+    """Stop recovering an adapter for a while after repeated failures.
+
+    Once an adapter has failed to recover ``circuit_breaker_failures`` times
+    in a row, further recoveries are refused for ``circuit_breaker_cooldown``
+    seconds. Each failure after the cooldown doubles it, up to
+    ``circuit_breaker_max_cooldown``. A success, or a sign that the hardware
+    changed, closes the breaker again.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the breaker with no failures."""
+        self._failures: dict[str, _AdapterFailures] = {}
+
+    def cooldown_remaining(self, hci: int, mac: str) -> float:
+        """Return how many seconds recoveries of ``mac`` are still refused.
+
+        An adapter that comes back under another hci number has been
+        re-enumerated, so its failures are forgotten.
+        """
+        if (failures := self._failures.get(mac)) is None:
+            return 0.0
+        if failures.hci != hci:
+            _LOGGER.debug(
+                "The adapter with mac address %s moved from hci%s to hci%s; "
+                "forgetting its failed recoveries",
+                mac,
+                failures.hci,
+                hci,
+            )
+            del self._failures[mac]
+            return 0.0
+        return max(0.0, failures.cooling_until - monotonic())
+
+    def record_failure(self, hci: int, mac: str, config: RecoveryConfig) -> None:
+        """Count a failed recovery and start a cooldown once there are enough."""
+        failures = self._failures.get(mac)
+        if failures is None or failures.hci != hci:
+            failures = self._failures[mac] = _AdapterFailures(hci)
+        failures.count += 1
+        if (excess := failures.count - config.circuit_breaker_failures) < 0:
+            return
+        # The exponent is capped so an adapter that never recovers cannot
+        # overflow it; the maximum cooldown is reached long before.
+        cooldown = min(
+            config.circuit_breaker_cooldown * 2 ** min(excess, 32),
+            config.circuit_breaker_max_cooldown,
+        )
+        failures.cooling_until = monotonic() + cooldown
+        _LOGGER.warning(
+            "Recovering the adapter with mac address %s failed %s times in a row; "
+            "not trying again for %ss",
+            mac,
+            failures.count,
+            cooldown,
+        )
+
+    def reset(self, mac: str) -> None:
+        """Forget the failed recoveries of ``mac``."""
+        self._failures.pop(mac, None)
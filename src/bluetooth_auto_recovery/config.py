@@ -0,0 +1,139 @@
+"""Tunable timings for adapter recovery."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, fields
+
+
+@dataclass(frozen=True, slots=True)
+class RecoveryConfig:
+    """Timings, retries and enabled steps for a recovery.
+
+    The defaults match the module-level constants in
+    ``bluetooth_auto_recovery.recover``; the opt-in features from
+    ``dbus_readiness_probe`` on are set here only. All times are in seconds.
+    """
+
+    # Waits for the adapter to report the power state that was just set
+    power_off_time: float = 2
+    power_on_time: float = 3
+    # Bound on each rfkill read or unblock
+    max_rfkill_time: float = 3
+    # How long to wait, and how often to re-check, for an unblock to clear
+    rfkill_unblock_grace_time: float = 4.5
+    rfkill_unblock_poll_interval: float = 1.5
+    # Settle time for the kernel and BlueZ after a power cycle or USB reset
+    dbus_register_time: float = 3.5
+    # End the settle time as soon as BlueZ exports the adapter on D-Bus; the
+    # full wait remains the fallback when the system bus cannot be reached
+    dbus_readiness_probe: bool = False
+    # Skip the settle time when no BlueZ daemon is running, as on systems that
+    # drive adapters only through raw HCI sockets
+    skip_dbus_wait_without_bluez: bool = False
+    # Pause after each step of bouncing the interface down and up
+    interface_bounce_time: float = 0.5
+    # Lookups for the adapter after a USB reset, and the pause between them
+    post_reset_lookup_attempts: int = 3
+    post_reset_lookup_retry_time: float = 2
+    # Wait for an Index Added event instead of sleeping after a USB reset
+    post_reset_wait_for_index_added: bool = False
+    post_reset_index_added_timeout: float = 10
+    # Read the pre-reset power state from the controller registry
+    pre_reset_use_cached_power_state: bool = False
+    # Filter the MGMT socket down to the events recovery consumes when it is
+    # opened; the pooled socket keeps the filter of the recovery that opened it
+    mgmt_socket_filter: bool = False
+    # Hold a per-adapter file lock, shared with other processes, while
+    # recovering; wait at most adapter_lock_timeout for another holder and,
+    # with adopt_locked_outcome, take its outcome instead of recovering again
+    adapter_lock: bool = False
+    adapter_lock_timeout: float = 60
+    adopt_locked_outcome: bool = False
+    # Refuse to recover an adapter after circuit_breaker_failures failed
+    # recoveries in a row, for circuit_breaker_cooldown seconds, doubled after
+    # each further failure up to circuit_breaker_max_cooldown. A success, or
+    # the adapter being added back or moving to another hci number, ends it
+    circuit_breaker: bool = False
+    circuit_breaker_failures: int = 3
+    circuit_breaker_cooldown: float = 60
+    circuit_breaker_max_cooldown: float = 3600
+    # Answer a call for an adapter recovered within recent_success_window
+    # with that success when a probe, given at most
+    # recent_success_probe_timeout, finds it powered and unblocked
+    recent_success_short_circuit: bool = False
+    recent_success_window: float = 10
+    recent_success_probe_timeout: float = 1
+    # Skip the power cycle or the USB reset when the adapter's latest results
+    # show it working less than adaptive_escalation_min_success_rate of the
+    # time and the other step working at least that often
+    adaptive_escalation: bool = False
+    adaptive_escalation_min_attempts: int = 3
+    adaptive_escalation_min_success_rate: float = 0.25
+    # Append a record of every recovery to history.RECOVERY_HISTORY_PATH
+    recovery_history: bool = False
+    # Shorten the power, rfkill and post-reset lookup timeouts to what this
+    # adapter has been seen to need, never beyond the values above; the times
+    # are kept at tuning.TIMEOUT_TUNING_PATH across restarts
+    self_tuning_timeouts: bool = False
+    # Escalation steps; a disabled step is skipped
+    unblock_rfkill: bool = True
+    power_cycle: bool = True
+    usb_reset: bool = True
+
+    def __post_init__(self) -> None:
+        """Reject values no recovery could run with."""
+        for field in fields(self):
+            value = getattr(self, field.name)
+            if not isinstance(value, bool) and value < 0:
+                msg = f"{field.name} must not be negative, got {value}"
+                raise ValueError(msg)
+        for name in (
+            "post_reset_lookup_attempts",
+            "circuit_breaker_failures",
+            "adaptive_escalation_min_attempts",
+        ):
+            if (value := getattr(self, name)) < 1:
+                msg = f"{name} must be at least 1, got {value}"
+                raise ValueError(msg)
+        if self.adaptive_escalation_min_success_rate > 1:
+            msg = (
+                "adaptive_escalation_min_success_rate must be at most 1, "
+                f"got {self.adaptive_escalation_min_success_rate}"
+            )
+            raise ValueError(msg)
+
+
+DEFAULT_CONFIG = RecoveryConfig()
+# Desktop-class hardware (x86 NUCs and similar) where the adapter re-registers
+# quickly: shorter settle times, faster polling and an event-driven wait after
+# a USB reset.
+FAST_CONFIG = RecoveryConfig(
+    power_off_time=1,
+    power_on_time=2,
+    rfkill_unblock_grace_time=2,
+    rfkill_unblock_poll_interval=0.5,
+    dbus_register_time=1,
+    dbus_readiness_probe=True,
+    interface_bounce_time=0.2,
+    post_reset_lookup_retry_time=1,
+    post_reset_wait_for_index_added=True,
+    post_reset_index_added_timeout=5,
+    pre_reset_use_cached_power_state=True,
+)
+# Slow boards (e.g. a Raspberry Pi 3) that need more time to re-enumerate and
+# re-register the adapter than the defaults allow.
+SLOW_CONFIG = RecoveryConfig(
+    power_off_time=3,
+    power_on_time=5,
+    max_rfkill_time=5,
+    rfkill_unblock_grace_time=7.5,
+    dbus_register_time=5,
+    post_reset_lookup_attempts=5,
+    post_reset_lookup_retry_time=3,
+)
+
+PRESETS: dict[str, RecoveryConfig] = {
+    "default": DEFAULT_CONFIG,
+    "fast": FAST_CONFIG,
+    "slow": SLOW_CONFIG,
+}
@@ -0,0 +1,120 @@
+"""Learn which recovery step brings each adapter back."""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+import logging
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .config import RecoveryConfig
+
+_LOGGER = logging.getLogger(__name__)
+
+POWER_CYCLE = "power_cycle"
+USB_RESET = "usb_reset"
+
+# Only this many of the latest results of each step count, so a change in
+# how the hardware behaves is picked up.
+ESCALATION_HISTORY_SIZE = 10
+# A skipped step records nothing, so every ESCALATION_RETRY_INTERVAL-th
+# recovery that would skip it runs it anyway to see whether it works now.
+ESCALATION_RETRY_INTERVAL = 10
+
+
+class EscalationHistory:
+    """Latest results of each recovery step, by mac address and by USB ID.
+
+    A step whose success rate is below ``adaptive_escalation_min_success_rate``
+    is skipped when the other step's rate is at least that, so an adapter
+    goes straight to the step that works for it. The history of the adapter's
+    mac address is used once it has ``adaptive_escalation_min_attempts``
+    results for a step; until then that of its USB vendor and product ID.
+    A skipped step is retried every ESCALATION_RETRY_INTERVAL recoveries.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty history."""
+        self._results: dict[tuple[str, str], deque[bool]] = {}
+        # Recoveries that skipped each step since it last ran, by mac address
+        self._skips: dict[tuple[str, str], int] = {}
+
+    def plan(self, keys: tuple[str, ...], config: RecoveryConfig) -> EscalationPlan:
+        """Return the steps to skip for an adapter known by ``keys``."""
+        power_cycle = self._success_rate(keys, POWER_CYCLE, config)
+        usb_reset = self._success_rate(keys, USB_RESET, config)
+        threshold = config.adaptive_escalation_min_success_rate
+        skipped: frozenset[str] = frozenset()
+        if power_cycle is None or usb_reset is None:
+            return EscalationPlan(self, keys, skipped)
+        if power_cycle < threshold <= usb_reset:
+            skipped = frozenset({POWER_CYCLE})
+        elif usb_reset < threshold <= power_cycle:
+            skipped = frozenset({USB_RESET})
+        skipped = frozenset(step for step in skipped if not self._retry(keys, step))
+        if skipped:
+            _LOGGER.debug(
+                "Skipping %s for %s: the power cycle worked %.0f%% and the "
+                "USB reset %.0f%% of the time",
+                ", ".join(skipped),
+                keys[0],
+                power_cycle * 100,
+                usb_reset * 100,
+            )
+        return EscalationPlan(self, keys, skipped)
+
+    def _retry(self, keys: tuple[str, ...], step: str) -> bool:
+        """Count a skip of ``step`` and return True if it is time to run it."""
+        skips = self._skips.get((keys[0], step), 0) + 1
+        if skips < ESCALATION_RETRY_INTERVAL:
+            self._skips[(keys[0], step)] = skips
+            return False
+        self._skips.pop((keys[0], step), None)
+        _LOGGER.debug(
+            "Running %s for %s again to see whether it works now", step, keys[0]
+        )
+        return True
+
+    def record(self, keys: tuple[str, ...], step: str, succeeded: bool) -> None:
+        """Record the result of ``step`` under each of ``keys``."""
+        for key in keys:
+            results = self._results.get((key, step))
+            if results is None:
+                results = self._results[(key, step)] = deque(
+                    maxlen=ESCALATION_HISTORY_SIZE
+                )
+            results.append(succeeded)
+
+    def _success_rate(
+        self, keys: tuple[str, ...], step: str, config: RecoveryConfig
+    ) -> float | None:
+        """Return the success rate of the first key with enough results."""
+        for key in keys:
+            results = self._results.get((key, step))
+            if results and len(results) >= config.adaptive_escalation_min_attempts:
+                return sum(results) / len(results)
+        return None
+
+
+@dataclass(frozen=True, slots=True)
+class EscalationPlan:
+    """The steps one recovery skips, and where it records their results."""
+
+    history: EscalationHistory | None
+    keys: tuple[str, ...]
+    skipped: frozenset[str]
+
+    def runs(self, step: str) -> bool:
+        """Return False if ``step`` is skipped."""
+        return step not in self.skipped
+
+    def record(self, step: str, succeeded: bool) -> None:
+        """Record the result of ``step``."""
+        if self.history is not None:
+            self.history.record(self.keys, step, succeeded)
+
+
+# A plan that skips nothing and records nothing, for when adaptive escalation
+# is disabled.
+NO_PLAN = EscalationPlan(None, (), frozenset())
@@ -0,0 +1,169 @@
+"""Append-only history of recoveries, and what it says about recovery times."""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import suppress
+from dataclasses import dataclass
+import json
+import logging
+import math
+from pathlib import Path
+import threading
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+_LOGGER = logging.getLogger(__name__)
+
+RECOVERY_HISTORY_PATH = Path("/var/lib/bluetooth-auto-recovery/history.jsonl")
+# The file is rotated to history.jsonl.1 (and so on) once it grows past this
+# many bytes, keeping RECOVERY_HISTORY_BACKUPS old files.
+RECOVERY_HISTORY_MAX_BYTES = 1024 * 1024
+RECOVERY_HISTORY_BACKUPS = 1
+
+_WRITE_LOCK = threading.Lock()
+
+
+@dataclass(frozen=True, slots=True)
+class RecoveryRecord:
+    """One recovery of one adapter."""
+
+    mac: str
+    hci: int
+    outcome: str
+    duration: float
+    # Time spent in each step, in the order they were first taken
+    steps: dict[str, float]
+    finished: float
+
+    def to_json(self) -> str:
+        """Return the record as one line of JSON."""
+        return json.dumps(
+            {
+                "mac": self.mac,
+                "hci": self.hci,
+                "outcome": self.outcome,
+                "duration": round(self.duration, 3),
+                "steps": {step: round(took, 3) for step, took in self.steps.items()},
+                "finished": round(self.finished, 3),
+            },
+            separators=(",", ":"),
+        )
+
+    @classmethod
+    def from_json(cls, line: str) -> RecoveryRecord | None:
+        """Parse one line of JSON, or return None if it is not a record."""
+        try:
+            data: dict[str, Any] = json.loads(line)
+            return cls(
+                mac=str(data["mac"]),
+                hci=int(data["hci"]),
+                outcome=str(data["outcome"]),
+                duration=float(data["duration"]),
+                steps={str(k): float(v) for k, v in data["steps"].items()},
+                finished=float(data["finished"]),
+            )
+        except (ValueError, KeyError, TypeError, AttributeError):
+            return None
+
+
+@dataclass(frozen=True, slots=True)
+class RecoveryTimes:
+    """How long the successful recoveries of one adapter took, in seconds."""
+
+    count: int
+    p50: float
+    p95: float
+
+
+async def append_record(record: RecoveryRecord, path: Path | None = None) -> None:
+    """Append ``record`` to the history file in the executor.
+
+    Raises OSError if the file cannot be written.
+    """
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(
+        None, _append, path or RECOVERY_HISTORY_PATH, record.to_json()
+    )
+
+
+def _append(path: Path, line: str) -> None:
+    with _WRITE_LOCK:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with suppress(FileNotFoundError):
+            if path.stat().st_size >= RECOVERY_HISTORY_MAX_BYTES:
+                _rotate(path)
+        with path.open("a", encoding="utf-8") as file:
+            file.write(line + "\n")
+
+
+def _rotate(path: Path) -> None:
+    """Shift path.1 .. path.N up by one and move ``path`` to path.1."""
+    if RECOVERY_HISTORY_BACKUPS < 1:
+        path.unlink()
+        return
+    for number in range(RECOVERY_HISTORY_BACKUPS - 1, 0, -1):
+        backup = path.with_name(f"{path.name}.{number}")
+        if backup.exists():
+            backup.replace(path.with_name(f"{path.name}.{number + 1}"))
+    path.replace(path.with_name(f"{path.name}.1"))
+    _LOGGER.debug("Rotated the recovery history %s", path)
+
+
+def read_records(path: Path | None = None) -> Iterator[RecoveryRecord]:
+    """Yield the recorded recoveries, oldest first, one line at a time.
+
+    Rotated files are read before the current one. Lines that cannot be
+    parsed, such as one cut short by a crash, are skipped.
+    """
+    path = path or RECOVERY_HISTORY_PATH
+    files = [
+        path.with_name(f"{path.name}.{number}")
+        for number in range(RECOVERY_HISTORY_BACKUPS, 0, -1)
+    ]
+    files.append(path)
+    for file in files:
+        yield from _read_file(file)
+
+
+def _read_file(file: Path) -> Iterator[RecoveryRecord]:
+    try:
+        lines = file.open(encoding="utf-8")
+    except FileNotFoundError:
+        return
+    with lines:
+        for line in lines:
+            if (record := RecoveryRecord.from_json(line)) is not None:
+                yield record
+
+
+def recovery_times(path: Path | None = None) -> dict[str, RecoveryTimes]:
+    """Return the p50 and p95 time of the successful recoveries, by mac address.
+
+    The history is streamed, so only the durations are held in memory. This
+    reads files; call it from an executor when running in an event loop.
+    """
+    durations: dict[str, list[float]] = {}
+    for record in read_records(path):
+        if record.outcome == "SUCCEEDED":
+            durations.setdefault(record.mac, []).append(record.duration)
+    return {
+        mac: RecoveryTimes(
+            count=len(values),
+            p50=percentile(values, 50),
+            p95=percentile(values, 95),
+        )
+        for mac, values in durations.items()
+    }
+
+
+def percentile(values: list[float], rank: float) -> float:
+    """Return the nearest-rank ``rank`` percentile of ``values``."""
+    if not values:
+        msg = "percentile of no values"
+        raise ValueError(msg)
+    ordered = sorted(values)
+    index = max(0, math.ceil(rank / 100 * len(ordered)) - 1)
+    return ordered[min(index, len(ordered) - 1)]
@@ -0,0 +1,111 @@
+"""Advisory locks that keep processes from recovering one adapter at once."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+from pathlib import Path
+import time
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - platform without fcntl
+    fcntl = None  # type: ignore[assignment]
+
+from .util import asyncio_timeout
+
+_LOGGER = logging.getLogger(__name__)
+
+ADAPTER_LOCK_DIR = Path("/run/bluetooth-auto-recovery")
+ADAPTER_LOCK_POLL_INTERVAL = 0.25
+
+_MAX_RECORD_SIZE = 4096
+
+
+class AdapterLock:
+    """An flock on a per-adapter file under ADAPTER_LOCK_DIR.
+
+    The holder records the outcome of its recovery in the file before
+    unlocking, so a process that waited for the lock can adopt it instead of
+    recovering the adapter again.
+    """
+
+    def __init__(self, mac: str, lock_dir: Path | None = None) -> None:
+        """Initialize the lock for the adapter with ``mac``."""
+        name = mac.upper().replace(":", "")
+        self.path = (lock_dir or ADAPTER_LOCK_DIR) / f"{name}.lock"
+        self._fd: int | None = None
+        self._waiting_since = 0.0
+
+    async def acquire(self, timeout: float) -> bool:
+        """Take the lock, waiting at most ``timeout`` seconds for it.
+
+        Returns False if another holder kept it that long. Raises OSError if
+        the lock file cannot be opened.
+        """
+        loop = asyncio.get_running_loop()
+        self._waiting_since = time.time()
+        fd = await loop.run_in_executor(None, self._open)
+        try:
+            if not self._try_lock(fd):
+                _LOGGER.debug("Waiting for %s held by another process", self.path)
+                async with asyncio_timeout(timeout):
+                    while True:
+                        await asyncio.sleep(ADAPTER_LOCK_POLL_INTERVAL)
+                        if self._try_lock(fd):
+                            break
+        except asyncio.TimeoutError:
+            os.close(fd)
+            return False
+        except BaseException:
+            os.close(fd)
+            raise
+        self._fd = fd
+        return True
+
+    async def outcome_since_acquire(self) -> str | None:
+        """Return an outcome recorded by a holder that finished while we waited."""
+        if self._fd is None:
+            return None
+        loop = asyncio.get_running_loop()
+        data = await loop.run_in_executor(None, os.pread, self._fd, _MAX_RECORD_SIZE, 0)
+        try:
+            record = json.loads(data)
+            outcome, finished = record["outcome"], float(record["finished"])
+        except (ValueError, KeyError, TypeError):
+            return None
+        if finished < self._waiting_since or not isinstance(outcome, str):
+            return None
+        return outcome
+
+    async def release(self, outcome: str | None = None) -> None:
+        """Record ``outcome``, if given, and unlock."""
+        if (fd := self._fd) is None:
+            return
+        self._fd = None
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._release, fd, outcome)
+
+    def _open(self) -> int:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        return os.open(self.path, os.O_RDWR | os.O_CREAT | os.O_CLOEXEC, 0o644)
+
+    @staticmethod
+    def _try_lock(fd: int) -> bool:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return False
+        return True
+
+    @staticmethod
+    def _release(fd: int, outcome: str | None) -> None:
+        try:
+            if outcome is not None:
+                record = json.dumps({"outcome": outcome, "finished": time.time()})
+                os.ftruncate(fd, 0)
+                os.pwrite(fd, record.encode(), 0)
+        finally:
+            os.close(fd)
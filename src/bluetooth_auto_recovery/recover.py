@@ -4,15 +4,19 @@ from __future__ import annotations
 
 import array
 import asyncio
-from contextlib import asynccontextmanager, suppress
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager, suppress
+from contextvars import ContextVar
+import copy
 from dataclasses import dataclass
 from enum import Enum, auto
 import errno
-from functools import cached_property
+from functools import cached_property, partial
 import logging
 from pathlib import Path
 import socket
 import struct
+import time
 
 try:
     from fcntl import ioctl
@@ -30,10 +34,24 @@ from btsocket.btmgmt_socket import AF_BLUETOOTH, BTPROTO_HCI
 import pyric.net.wireless.rfkill_h as rfkh
 from usb_devices import BluetoothDevice, NotAUSBDeviceError
 
+from .bluez import bluez_running, wait_for_adapter
+from .bpf import attach_filter, mgmt_event_filter
+from .breaker import CircuitBreaker
+from .config import RecoveryConfig
+from .escalation import (
+    NO_PLAN,
+    POWER_CYCLE,
+    USB_RESET,
+    EscalationHistory,
+    EscalationPlan,
+)
+from .history import RecoveryRecord, append_record
+from .lock import AdapterLock
+from .tuning import POST_RESET_LOOKUP, POWER_OFF, POWER_ON, RFKILL_UNBLOCK, TimeoutTuner
 from .util import asyncio_timeout
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator
+    from collections.abc import AsyncIterator, Callable, Iterable, Iterator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -54,8 +72,33 @@ RFKILL_UNBLOCK_POLL_INTERVAL = 1.5
 # so we poll for the adapter to reappear instead of giving up after one lookup.
 POST_RESET_LOOKUP_ATTEMPTS = 3
 POST_RESET_LOOKUP_RETRY_TIME = 2
+# Instead of sleeping and polling, keep the pooled MGMT socket open across the
+# USB reset and resume as soon as the kernel announces the adapter again with
+# an Index Added event, waiting at most POST_RESET_INDEX_ADDED_TIMEOUT seconds
+# before falling back to a single lookup.
+POST_RESET_WAIT_FOR_INDEX_ADDED = False
+POST_RESET_INDEX_ADDED_TIMEOUT = 10
+# Serve the pre-reset power read from the controller registry, which mirrors
+# every controller's settings from New Settings events while the pooled MGMT
+# socket is open, instead of a Read Controller Information round trip.
+PRE_RESET_USE_CACHED_POWER_STATE = False
+
+# How many adapters recover_adapters() works on at once. Waits for the kernel
+# and BlueZ to catch up do not count against the limit.
+RECOVER_ADAPTERS_CONCURRENCY = 4
 
 MGMT_PROTOCOL_TIMEOUT = 5
+# How often the power state is re-read while waiting for a New Settings event,
+# which never comes when this process caused the change on the same socket.
+POWER_STATE_POLL_INTERVAL = 0.1
+# A pooled MGMT session stays open this long after its last borrower releases
+# it so back-to-back recoveries (and the lookups within one recovery) reuse the
+# same socket instead of re-opening and re-connecting it every time.
+MGMT_SESSION_IDLE_TIME = 30
+# Attach a classic BPF filter to MGMT sockets so the kernel only wakes us for
+# command replies and the index and settings events recovery consumes. The
+# filter admits every controller, since the pooled socket serves them all.
+MGMT_SOCKET_FILTER = False
 
 # https://git.kernel.org/pub/scm/bluetooth/bluez.git/tree/lib/hci.h
 HCIDEVUP = 0x400448C9  # 201
@@ -70,6 +113,221 @@ class USBResetOutcome(Enum):
     NOT_APPLICABLE = auto()  # adapter is not a USB device
 
 
+class PowerCycleOutcome(Enum):
+    """Outcome of a power cycle attempt."""
+
+    SUCCEEDED = auto()  # the adapter was powered off and back on
+    FAILED = auto()  # the adapter could not be power cycled
+    REMOVED = auto()  # the controller was removed while it was being reset
+
+
+class RecoveryOutcome(Enum):
+    """Outcome of a recovery attempt."""
+
+    SUCCEEDED = auto()  # the adapter was recovered
+    FAILED = auto()  # every step was tried and the adapter was not recovered
+    BUDGET_EXHAUSTED = auto()  # the caller's time budget ran out first
+    COOLING_DOWN = auto()  # not attempted after too many failures in a row
+
+
+@dataclass(slots=True)
+class RoundTripCounter:
+    """Number of MGMT commands sent while the counter was active."""
+
+    count: int = 0
+
+
+_ROUND_TRIP_COUNTERS: ContextVar[tuple[RoundTripCounter, ...]] = ContextVar(
+    "_ROUND_TRIP_COUNTERS", default=()
+)
+
+
+@contextmanager
+def count_mgmt_round_trips() -> Iterator[RoundTripCounter]:
+    """Count the MGMT commands sent by the current task and its children.
+
+    Counters nest: every active counter sees each command, so a caller can
+    wrap recover_adapter() while it keeps counting its own recovery.
+    """
+    counter = RoundTripCounter()
+    token = _ROUND_TRIP_COUNTERS.set((*_ROUND_TRIP_COUNTERS.get(), counter))
+    try:
+        yield counter
+    finally:
+        _ROUND_TRIP_COUNTERS.reset(token)
+
+
+_RECOVERY_STEPS: ContextVar[dict[str, float] | None] = ContextVar(
+    "_RECOVERY_STEPS", default=None
+)
+
+
+# The step being timed, which a step nested in it is not counted against
+_OPEN_STEP: ContextVar[str | None] = ContextVar("_OPEN_STEP", default=None)
+
+
+@contextmanager
+def _timed_step(step: str) -> Iterator[None]:
+    """Add the time spent in ``step`` to the running recovery's step times.
+
+    A step nested in another one is taken out of the enclosing step's time,
+    so the step times stay disjoint.
+    """
+    if (steps := _RECOVERY_STEPS.get()) is None:
+        yield
+        return
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    steps.setdefault(step, 0.0)
+    enclosing = _OPEN_STEP.get()
+    token = _OPEN_STEP.set(step)
+    try:
+        yield
+    finally:
+        _OPEN_STEP.reset(token)
+        took = loop.time() - started
+        steps[step] += took
+        if enclosing is not None:
+            steps[enclosing] -= took
+
+
+@dataclass(slots=True)
+class _FoundAdapter:
+    """The hci number the adapter of a recovery was last found at."""
+
+    hci: int
+
+
+_FOUND_ADAPTER: ContextVar[_FoundAdapter | None] = ContextVar(
+    "_FOUND_ADAPTER", default=None
+)
+
+
+def _found_at(hci_name: str) -> None:
+    """Note that the running recovery found its adapter at ``hci_name``."""
+    if (found := _FOUND_ADAPTER.get()) is not None:
+        found.hci = hci_name_to_number(hci_name)
+
+
+# How long each tuned stage took, or None for one that ran into its timeout
+_STAGE_TIMES: ContextVar[dict[str, float | None] | None] = ContextVar(
+    "_STAGE_TIMES", default=None
+)
+
+
+def _stage_completed(stage: str, took: float) -> None:
+    """Note how long a tuned stage took, when timeouts are self-tuning."""
+    if (stage_times := _STAGE_TIMES.get()) is not None:
+        stage_times[stage] = took
+
+
+def _stage_timed_out(stage: str) -> None:
+    """Note that a tuned stage ran into its timeout, when timeouts are self-tuning.
+
+    A stage the recovery budget cut short says nothing about the adapter.
+    """
+    if (stage_times := _STAGE_TIMES.get()) is not None and not _budget_exhausted():
+        stage_times[stage] = None
+
+
+@dataclass(slots=True)
+class RecoveryBudget:
+    """Time left for a recovery, as a deadline on the event loop clock."""
+
+    deadline: float
+
+    def remaining(self) -> float:
+        """Return the seconds left, never below zero."""
+        return max(0.0, self.deadline - asyncio.get_running_loop().time())
+
+    @property
+    def exhausted(self) -> bool:
+        """Return True once the deadline has passed."""
+        return self.remaining() <= 0
+
+
+_RECOVERY_BUDGET: ContextVar[RecoveryBudget | None] = ContextVar(
+    "_RECOVERY_BUDGET", default=None
+)
+
+
+def _budgeted(seconds: float) -> float:
+    """Shorten a wait so it ends by the recovery deadline, if there is one."""
+    if (budget := _RECOVERY_BUDGET.get()) is None:
+        return seconds
+    return min(seconds, budget.remaining())
+
+
+def _budget_allows(seconds: float) -> bool:
+    """Return True if the recovery budget has at least ``seconds`` left."""
+    budget = _RECOVERY_BUDGET.get()
+    return budget is None or budget.remaining() >= seconds
+
+
+def _budget_exhausted() -> bool:
+    """Return True if the recovery budget has run out."""
+    budget = _RECOVERY_BUDGET.get()
+    return budget is not None and budget.exhausted
+
+
+_RECOVERY_CONFIG: ContextVar[RecoveryConfig | None] = ContextVar(
+    "_RECOVERY_CONFIG", default=None
+)
+
+
+def _config() -> RecoveryConfig:
+    """Return the config of the running recovery.
+
+    Without one, the module-level constants are used so existing overrides of
+    them keep working. Features newer than RecoveryConfig have no constant and
+    keep their defaults.
+    """
+    if (config := _RECOVERY_CONFIG.get()) is not None:
+        return config
+    return RecoveryConfig(
+        power_off_time=POWER_OFF_TIME,
+        power_on_time=POWER_ON_TIME,
+        max_rfkill_time=MAX_RFKILL_TIME,
+        rfkill_unblock_grace_time=RFKILL_UNBLOCK_GRACE_TIME,
+        rfkill_unblock_poll_interval=RFKILL_UNBLOCK_POLL_INTERVAL,
+        dbus_register_time=DBUS_REGISTER_TIME,
+        post_reset_lookup_attempts=POST_RESET_LOOKUP_ATTEMPTS,
+        post_reset_lookup_retry_time=POST_RESET_LOOKUP_RETRY_TIME,
+        post_reset_wait_for_index_added=POST_RESET_WAIT_FOR_INDEX_ADDED,
+        post_reset_index_added_timeout=POST_RESET_INDEX_ADDED_TIMEOUT,
+        pre_reset_use_cached_power_state=PRE_RESET_USE_CACHED_POWER_STATE,
+        mgmt_socket_filter=MGMT_SOCKET_FILTER,
+    )
+
+
+class MGMTCommandError(Exception):
+    """The kernel rejected an MGMT command with a Command Status error."""
+
+    def __init__(
+        self,
+        command: btmgmt_protocol.Commands,
+        controller_idx: int,
+        status: btmgmt_protocol.ErrorCodes,
+    ) -> None:
+        """Initialize the error."""
+        super().__init__(
+            f"{command} for controller index {controller_idx} failed: "
+            f"{status} (0x{status.value:02x})"
+        )
+        self.command = command
+        self.controller_idx = controller_idx
+        self.status = status
+
+
+class ControllerRemovedError(Exception):
+    """The controller was removed while a request for it was outstanding."""
+
+    def __init__(self, controller_idx: int) -> None:
+        """Initialize the error."""
+        super().__init__(f"Controller index {controller_idx} was removed")
+        self.controller_idx = controller_idx
+
+
 @dataclass
 class RFKillInfo:
     """RFKill info."""
@@ -130,22 +388,67 @@ def rfkill_list_bluetooth(adapter: MGMTBluetoothCtl) -> RFKillInfo:
     )
 
 
+_RequestKey = tuple[int, int]
+
+# Every MGMT event starts with a little-endian event code, controller index and
+# parameter length.
+MGMT_EVENT_HEADER = struct.Struct("<HHH")
+_INDEX_EVENTS = {
+    btmgmt_protocol.Events.IndexAddedEvent.value,
+    btmgmt_protocol.Events.IndexRemovedEvent.value,
+}
+# Command Complete and Command Status start their parameters with the opcode
+# of the command they answer.
+MGMT_REPLY_OPCODE = struct.Struct("<H")
+_REPLY_EVENTS = {
+    btmgmt_protocol.Events.CommandCompleteEvent.value,
+    btmgmt_protocol.Events.CommandStatusEvent.value,
+}
+_EVENTS_BY_CODE = {event.value: event for event in btmgmt_protocol.Events}
+_FILTERED_EVENTS = {
+    *_REPLY_EVENTS,
+    *_INDEX_EVENTS,
+    btmgmt_protocol.Events.NewSettingsEvent.value,
+}
+
+
+def _request_key(command: str, controller_idx: int | None) -> _RequestKey:
+    """Return the (opcode, controller index) key a command is answered under."""
+    return (
+        btmgmt_protocol.Commands[command].value,
+        btmgmt_socket.HCI_DEV_NONE if controller_idx is None else controller_idx,
+    )
+
+
 class BluetoothMGMTProtocol(asyncio.Protocol):
-    """Bluetooth MGMT protocol."""
+    """Bluetooth MGMT protocol.
+
+    Outstanding commands are tracked per (opcode, controller index) so many
+    requests can be in flight on one socket and each reply reaches its own
+    waiter. The kernel answers commands on a socket in order, so waiters
+    sharing a key are resolved first-in, first-out.
+    """
 
     def __init__(
         self,
         timeout: float,
         connection_mode_future: asyncio.Future[None],
         sock: socket.socket,
+        on_connection_lost: Callable[[Exception | None], None] | None = None,
     ) -> None:
         """Initialize the protocol."""
-        self.future: asyncio.Future[btmgmt_protocol.Response] | None = None
+        self.requests: dict[
+            _RequestKey, deque[asyncio.Future[btmgmt_protocol.Response]]
+        ] = {}
+        self.listeners: dict[
+            btmgmt_protocol.Events, list[Callable[[int, Any], None]]
+        ] = {}
         self.transport: asyncio.Transport | None = None
         self.timeout = timeout
         self.connection_mode_future = connection_mode_future
         self.loop = asyncio.get_running_loop()
         self.sock = sock
+        self.on_connection_lost = on_connection_lost
 
     def connection_made(self, transport: asyncio.BaseTransport) -> None:
         """Handle connection made."""
@@ -154,24 +457,137 @@ class BluetoothMGMTProtocol(asyncio.Protocol):
         self.transport = cast("asyncio.Transport", transport)
 
     def data_received(self, data: bytes) -> None:
-        """Handle data received."""
+        """Handle data received.
+
+        The kernel broadcasts every event to every MGMT socket, so the header
+        is peeked first and only replies somebody waits for and events
+        somebody subscribed to are decoded by btsocket.
+        """
+        view = memoryview(data)
         try:
-            if (
-                self.future
-                and not self.future.done()
-                and (response := btmgmt_protocol.reader(data))
-                and response.cmd_response_frame
+            event_code, controller_idx, _ = MGMT_EVENT_HEADER.unpack_from(view)
+            wanted = self._wants_frame(view, event_code, controller_idx)
+        except struct.error as ex:
+            _LOGGER.debug("Error parsing response: %s", ex)
+            return
+        if event_code == btmgmt_protocol.Events.IndexRemovedEvent.value:
+            self._fail_controller_requests(controller_idx)
+        if not wanted:
+            return
+        if event_code in _INDEX_EVENTS:
+            # btsocket has no frame shape for these parameterless events.
+            self._notify(btmgmt_protocol.Events(event_code), controller_idx, None)
+            return
+        try:
+            response = btmgmt_protocol.reader(data)
+            event = response.header.event_code
+            if event in (
+                btmgmt_protocol.Events.CommandCompleteEvent,
+                btmgmt_protocol.Events.CommandStatusEvent,
             ):
-                self.future.set_result(response)
-        except ValueError as ex:
+                self._resolve_request(response)
+            elif event in self.listeners:
+                self._notify(
+                    event,
+                    response.header.controller_idx,
+                    copy.copy(response.event_frame),
+                )
+        except (AttributeError, ValueError) as ex:
             # ValueError: 47 is not a valid Events may happen on newer kernels
-            # and we need to ignore these events
+            # and we need to ignore these events. btsocket also has no frame
+            # shape for some parameterless events and raises AttributeError for
+            # them; letting it escape would make the transport close the
+            # (possibly pooled) socket.
             _LOGGER.debug("Error parsing response: %s", ex)
 
+    def _wants_frame(
+        self, view: memoryview, event_code: int, controller_idx: int
+    ) -> bool:
+        """Return whether a waiter or listener is interested in a frame."""
+        if event_code not in _REPLY_EVENTS:
+            return _EVENTS_BY_CODE.get(event_code) in self.listeners
+        (opcode,) = MGMT_REPLY_OPCODE.unpack_from(view, MGMT_EVENT_HEADER.size)
+        if (opcode, controller_idx) in self.requests:
+            return True
+        _LOGGER.debug(
+            "Dropping unsolicited reply to opcode 0x%04x for index %s",
+            opcode,
+            controller_idx,
+        )
+        return False
+
+    def _fail_controller_requests(self, controller_idx: int) -> None:
+        """Fail every request outstanding for a controller that went away."""
+        for (_, request_idx), waiters in self.requests.items():
+            if request_idx != controller_idx:
+                continue
+            for future in waiters:
+                if not future.done():
+                    future.set_exception(ControllerRemovedError(controller_idx))
+
+    def _notify(
+        self, event: btmgmt_protocol.Events, controller_idx: int, event_frame: Any
+    ) -> None:
+        """Call the listeners subscribed to ``event``."""
+        for listener in list(self.listeners.get(event, ())):
+            listener(controller_idx, event_frame)
+
+    def subscribe(
+        self,
+        event: btmgmt_protocol.Events,
+        listener: Callable[[int, Any], None],
+    ) -> Callable[[], None]:
+        """Call ``listener(controller_idx, event_frame)`` for each ``event``.
+
+        Returns a callable that removes the listener.
+        """
+        listeners = self.listeners.setdefault(event, [])
+        listeners.append(listener)
+
+        def _unsubscribe() -> None:
+            with suppress(ValueError):
+                listeners.remove(listener)
+
+        return _unsubscribe
+
+    def _resolve_request(self, response: btmgmt_protocol.Response) -> None:
+        """Hand a command reply to the oldest waiter for its key.
+
+        A Command Status carrying an error fails the waiter immediately with
+        MGMTCommandError instead of leaving it to time out.
+        """
+        command = response.event_frame.command_opcode
+        key = (command.value, response.header.controller_idx)
+        waiters = self.requests.get(key)
+        while waiters:
+            future = waiters.popleft()
+            if future.done():
+                continue
+            status = response.event_frame.status
+            if (
+                response.header.event_code is btmgmt_protocol.Events.CommandStatusEvent
+                and status.value != 0x00  # 0x00 - Success
+            ):
+                future.set_exception(
+                    MGMTCommandError(command, response.header.controller_idx, status)
+                )
+            else:
+                # btsocket decodes into shared module-level frames, so the next
+                # reader() call would overwrite this reply before the waiter
+                # runs; hand over a snapshot instead.
+                future.set_result(
+                    btmgmt_protocol.Response(
+                        response.header,
+                        copy.copy(response.event_frame),
+                        copy.copy(response.cmd_response_frame),
+                    )
+                )
+            return
+        _LOGGER.debug("Dropping unsolicited reply %s", response.header)
+
     async def send(self, *args: Any) -> btmgmt_protocol.Response:
         """Send command."""
         pkt_objs = btmgmt_protocol.command(*args)
-        self.future = self.loop.create_future()
         if self.transport is None:
             msg = "Connection was closed"
             raise btmgmt_socket.BluetoothSocketError(msg)
@@ -182,15 +598,24 @@ class BluetoothMGMTProtocol(asyncio.Protocol):
         # See: https://github.com/Bluetooth-Devices/habluetooth/pull/303
         # See: https://github.com/home-assistant/core/issues/152204
         data = b"".join(frame.octets for frame in pkt_objs if frame)
-        self.sock.send(data)
+        key = _request_key(args[0], args[1])
+        future: asyncio.Future[btmgmt_protocol.Response] = self.loop.create_future()
+        waiters = self.requests.setdefault(key, deque())
+        waiters.append(future)
         cancel_timeout = self.loop.call_later(
-            self.timeout, self._timeout_future, self.future
+            self.timeout, self._timeout_future, future
         )
+        for counter in _ROUND_TRIP_COUNTERS.get():
+            counter.count += 1
         try:
-            return await self.future
+            self.sock.send(data)
+            return await future
         finally:
             cancel_timeout.cancel()
-            self.future = None
+            with suppress(ValueError):
+                waiters.remove(future)
+            if not waiters and self.requests.get(key) is waiters:
+                del self.requests[key]
 
     def _timeout_future(self, future: asyncio.Future[btmgmt_protocol.Response]) -> None:
         if future and not future.done():
@@ -201,6 +626,379 @@ class BluetoothMGMTProtocol(asyncio.Protocol):
         if exc:
             _LOGGER.warning("Bluetooth management socket connection lost: %s", exc)
         self.transport = None
+        # Nothing will answer the outstanding requests on this socket anymore.
+        for waiters in self.requests.values():
+            for future in waiters:
+                if not future.done():
+                    future.set_exception(
+                        btmgmt_socket.BluetoothSocketError("Connection was closed")
+                    )
+        if self.on_connection_lost is not None:
+            self.on_connection_lost(exc)
+
+
+def _attach_mgmt_filter(sock: socket.socket) -> None:
+    """Filter ``sock`` down to the events recovery consumes, if enabled."""
+    if not _config().mgmt_socket_filter:
+        return
+    try:
+        attach_filter(sock, mgmt_event_filter(_FILTERED_EVENTS))
+    except OSError as ex:
+        _LOGGER.debug("Could not attach a filter to the MGMT socket: %s", ex)
+
+
+async def _open_mgmt_connection(
+    timeout: float,
+    on_connection_lost: Callable[[Exception | None], None] | None = None,
+) -> tuple[socket.socket, BluetoothMGMTProtocol]:
+    """Open an MGMT control socket and connect a protocol to it."""
+    sock = btmgmt_socket.open()
+    _attach_mgmt_filter(sock)
+    loop = asyncio.get_running_loop()
+    connection_made_future: asyncio.Future[None] = loop.create_future()
+    try:
+        async with asyncio_timeout(5):
+            # _create_connection_transport accessed directly to avoid SOCK_STREAM check
+            # see https://bugs.python.org/issue38285
+            _, protocol = await loop._create_connection_transport(  # type: ignore[attr-defined]  # noqa: SLF001
+                sock,
+                lambda: BluetoothMGMTProtocol(
+                    timeout, connection_made_future, sock, on_connection_lost
+                ),
+                None,
+                None,
+            )
+            await connection_made_future
+    except asyncio.TimeoutError:
+        btmgmt_socket.close(sock)
+        raise
+    if not isinstance(protocol, BluetoothMGMTProtocol):
+        msg = (
+            "Unexpected protocol type from connection transport: "
+            f"{type(protocol).__name__}"
+        )
+        raise TypeError(msg)
+    return sock, protocol
+
+
+class ControllerRegistry:
+    """In-memory map of controller addresses, indexes and settings.
+
+    The registry is seeded once from the controller index list and then kept
+    current from Index Added, Index Removed and New Settings events, so
+    looking up the index of an address needs no kernel round trip. It is
+    bound to one protocol: events missed while a socket was down are not
+    replayed, so a reconnected session starts a fresh registry.
+    """
+
+    def __init__(self, protocol: BluetoothMGMTProtocol) -> None:
+        """Subscribe to the index and settings events."""
+        self._protocol = protocol
+        self.index_by_mac: dict[str, int] = {}
+        self.mac_by_index: dict[int, str] = {}
+        self.settings: dict[int, dict[btmgmt_protocol.SupportedSettings, bool]] = {}
+        self.seeded = False
+        self._seed_lock = asyncio.Lock()
+        self._lookups: dict[int, asyncio.Task[None]] = {}
+        events = btmgmt_protocol.Events
+        self._unsubscribers = [
+            protocol.subscribe(events.IndexAddedEvent, self._on_index_added),
+            protocol.subscribe(events.IndexRemovedEvent, self._on_index_removed),
+            protocol.subscribe(events.NewSettingsEvent, self._on_new_settings),
+        ]
+
+    def index_of(self, mac: str) -> int | None:
+        """Return the controller index currently carrying ``mac``."""
+        return self.index_by_mac.get(mac)
+
+    async def seed(self) -> bool:
+        """Read every controller once; return False if the list is unreadable."""
+        async with self._seed_lock:
+            if self.seeded:
+                return True
+            try:
+                idxdata = await self._protocol.send("ReadControllerIndexList", None)
+            except (
+                MGMTCommandError,
+                btmgmt_socket.BluetoothSocketError,
+                asyncio.TimeoutError,
+            ) as ex:
+                _LOGGER.debug("Seeding the controller registry failed: %s", ex)
+                return False
+            if idxdata.event_frame.status.value != 0x00:  # 0x00 - Success
+                return False
+            response = idxdata.cmd_response_frame
+            hci_idx_list = (
+                getattr(response, "controller_index[i]")
+                if response.num_controllers
+                else []
+            )
+            await asyncio.gather(*(self._refresh(idx) for idx in hci_idx_list))
+            self.seeded = True
+            _LOGGER.debug("Seeded the controller registry: %s", self.mac_by_index)
+            return True
+
+    async def _refresh(self, controller_idx: int) -> None:
+        """Read one controller and record its address and settings."""
+        try:
+            info = await self._protocol.send(
+                "ReadControllerInformation", controller_idx
+            )
+        except (
+            MGMTCommandError,
+            ControllerRemovedError,
+            btmgmt_socket.BluetoothSocketError,
+            asyncio.TimeoutError,
+        ) as ex:
+            _LOGGER.debug("Reading controller index %s failed: %s", controller_idx, ex)
+            return
+        if info.event_frame.status.value != 0x00:  # 0x00 - Success
+            return
+        response = info.cmd_response_frame
+        self._forget(controller_idx)
+        mac: str = response.address.upper()
+        self.index_by_mac[mac] = controller_idx
+        self.mac_by_index[controller_idx] = mac
+        self.settings[controller_idx] = dict(response.current_settings)
+
+    def _forget(self, controller_idx: int) -> None:
+        mac = self.mac_by_index.pop(controller_idx, None)
+        if mac is not None and self.index_by_mac.get(mac) == controller_idx:
+            del self.index_by_mac[mac]
+        self.settings.pop(controller_idx, None)
+
+    def _on_index_added(self, controller_idx: int, _event_frame: Any) -> None:
+        self._cancel_lookup(controller_idx)
+        task = self._protocol.loop.create_task(self._refresh(controller_idx))
+        self._lookups[controller_idx] = task
+        task.add_done_callback(partial(self._lookup_done, controller_idx))
+
+    def _lookup_done(self, controller_idx: int, task: asyncio.Task[None]) -> None:
+        if self._lookups.get(controller_idx) is task:
+            del self._lookups[controller_idx]
+        if not task.cancelled() and (mac := self.mac_by_index.get(controller_idx)):
+            _adapter_added(self._protocol.loop, mac)
+
+    def _on_index_removed(self, controller_idx: int, _event_frame: Any) -> None:
+        self._cancel_lookup(controller_idx)
+        self._forget(controller_idx)
+
+    def _on_new_settings(self, controller_idx: int, event_frame: Any) -> None:
+        self.update_settings(controller_idx, event_frame.current_settings)
+
+    def update_settings(
+        self,
+        controller_idx: int,
+        current_settings: dict[btmgmt_protocol.SupportedSettings, bool],
+    ) -> None:
+        """Record the current settings of a tracked controller.
+
+        Replies to our own commands are fed in here as well, since the kernel
+        does not send New Settings to the socket that caused the change.
+        """
+        if controller_idx in self.mac_by_index:
+            self.settings[controller_idx] = dict(current_settings)
+
+    def powered(self, controller_idx: int) -> bool | None:
+        """Return the last known Powered bit of a controller, if tracked."""
+        if (settings := self.settings.get(controller_idx)) is None:
+            return None
+        return settings.get(btmgmt_protocol.SupportedSettings.Powered)
+
+    def _cancel_lookup(self, controller_idx: int) -> None:
+        if (task := self._lookups.pop(controller_idx, None)) is not None:
+            task.cancel()
+
+    def close(self) -> None:
+        """Stop following events."""
+        for unsubscribe in self._unsubscribers:
+            unsubscribe()
+        for task in self._lookups.values():
+            task.cancel()
+        self._lookups.clear()
+
+
+class MGMTSession:
+    """An MGMT control socket shared by every recovery on one event loop.
+
+    Borrowers are reference counted. While at least one borrower holds the
+    session a lost connection is re-established in the background; once the
+    last borrower releases it the socket lingers for MGMT_SESSION_IDLE_TIME
+    seconds before it is closed and the session is dropped from the pool. A
+    session whose event loop was closed before then is closed by the next
+    borrow on another loop.
+    """
+
+    def __init__(self, timeout: float) -> None:
+        """Initialize the session."""
+        self.timeout = timeout
+        self.sock: socket.socket | None = None
+        self.protocol: BluetoothMGMTProtocol | None = None
+        self.refcount = 0
+        self._connect_lock = asyncio.Lock()
+        self._idle_handle: asyncio.TimerHandle | None = None
+        self._reconnect_task: asyncio.Task[None] | None = None
+        self._registry: ControllerRegistry | None = None
+        self._closing = False
+
+    @property
+    def connected(self) -> bool:
+        """Return if the session has a usable transport."""
+        protocol = self.protocol
+        return (
+            protocol is not None
+            and protocol.transport is not None
+            and not protocol.transport.is_closing()
+        )
+
+    def acquire(self) -> None:
+        """Take a reference on the session."""
+        self.refcount += 1
+        if self._idle_handle is not None:
+            self._idle_handle.cancel()
+            self._idle_handle = None
+
+    def release(self) -> None:
+        """Drop a reference, closing the session once it has been idle."""
+        self.refcount -= 1
+        if self.refcount > 0:
+            return
+        if self.sock is None:
+            # Never connected (or already torn down); nothing to linger for.
+            _drop_session(self)
+            return
+        self._idle_handle = asyncio.get_running_loop().call_later(
+            MGMT_SESSION_IDLE_TIME, self._idle_close
+        )
+
+    def controller_registry(self) -> ControllerRegistry | None:
+        """Return the registry bound to the current connection, if any."""
+        if self.protocol is None:
+            return None
+        if self._registry is None:
+            self._registry = ControllerRegistry(self.protocol)
+        return self._registry
+
+    def _drop_registry(self) -> None:
+        if self._registry is not None:
+            self._registry.close()
+            self._registry = None
+
+    async def ensure_connected(self) -> BluetoothMGMTProtocol:
+        """Return a connected protocol, (re)connecting if the socket is unhealthy."""
+        async with self._connect_lock:
+            if not self.connected:
+                self._close_socket()
+                self._closing = False
+                self.sock, self.protocol = await _open_mgmt_connection(
+                    self.timeout, self._connection_lost
+                )
+                _LOGGER.debug("Opened pooled Bluetooth management socket")
+            return cast("BluetoothMGMTProtocol", self.protocol)
+
+    def _connection_lost(self, exc: Exception | None) -> None:
+        """Handle the transport going away underneath the session."""
+        if self._closing:
+            return
+        _LOGGER.debug("Pooled Bluetooth management socket lost: %s", exc)
+        self._drop_registry()
+        self.protocol = None
+        self._close_socket()
+        if self.refcount > 0 and self._reconnect_task is None:
+            self._reconnect_task = asyncio.get_running_loop().create_task(
+                self._reconnect()
+            )
+
+    async def _reconnect(self) -> None:
+        """Re-open the socket for the current borrowers."""
+        try:
+            await self.ensure_connected()
+        except (
+            btmgmt_socket.BluetoothSocketError,
+            asyncio.TimeoutError,
+            OSError,
+        ) as ex:
+            # The next borrower retries via ensure_connected.
+            _LOGGER.warning("Reconnecting Bluetooth management socket failed: %s", ex)
+        finally:
+            self._reconnect_task = None
+
+    def _idle_close(self) -> None:
+        self._idle_handle = None
+        if self.refcount == 0:
+            self.close()
+
+    def close(self) -> None:
+        """Close the socket and drop the session from the pool."""
+        self._closing = True
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+            self._reconnect_task = None
+        self._drop_registry()
+        if self.protocol and self.protocol.transport:
+            self.protocol.transport.close()
+        self.protocol = None
+        self._close_socket()
+        _drop_session(self)
+
+    def abandon(self) -> None:
+        """Close the socket of a session whose event loop is already closed.
+
+        Nothing can run on that loop anymore, so the transport, registry and
+        timers are let go of instead of being closed through it.
+        """
+        self._closing = True
+        self._idle_handle = None
+        self._reconnect_task = None
+        self._registry = None
+        self.protocol = None
+        self._close_socket()
+
+    def _close_socket(self) -> None:
+        if self.sock is not None:
+            sock, self.sock = self.sock, None
+            with suppress(OSError):
+                btmgmt_socket.close(sock)
+
+
+_SESSIONS: dict[asyncio.AbstractEventLoop, MGMTSession] = {}
+# The outcome of the recovery in progress for each adapter, by loop and mac.
+_IN_FLIGHT: dict[
+    tuple[asyncio.AbstractEventLoop, str], asyncio.Future[RecoveryOutcome]
+] = {}
+_CIRCUIT_BREAKER = CircuitBreaker()
+# When each adapter, by mac address, was last recovered, in event loop time
+_RECENT_SUCCESSES: dict[str, float] = {}
+_ESCALATION_HISTORY = EscalationHistory()
+_TIMEOUT_TUNER = TimeoutTuner()
+
+
+def _acquire_session() -> MGMTSession:
+    """Borrow the pooled MGMT session for the running loop."""
+    loop = asyncio.get_running_loop()
+    _drop_closed_loop_sessions()
+    if (session := _SESSIONS.get(loop)) is None:
+        session = _SESSIONS[loop] = MGMTSession(MGMT_PROTOCOL_TIMEOUT)
+    session.acquire()
+    return session
+
+
+def _drop_closed_loop_sessions() -> None:
+    """Close the sessions of event loops that have been closed.
+
+    The idle timer of such a session can never fire, e.g. once asyncio.run()
+    has returned, so it would otherwise keep its socket open for good.
+    """
+    for loop in [loop for loop in _SESSIONS if loop.is_closed()]:
+        _LOGGER.debug("Closing the MGMT session of a closed event loop")
+        _SESSIONS.pop(loop).abandon()
+
+
+def _drop_session(session: MGMTSession) -> None:
+    """Remove a session from the pool if it is still the pooled one."""
+    for loop, pooled in list(_SESSIONS.items()):
+        if pooled is session:
+            del _SESSIONS[loop]
 
 
 class MGMTBluetoothCtl:
@@ -222,6 +1020,10 @@ class MGMTBluetoothCtl:
         self.protocol: BluetoothMGMTProtocol | None = None
         self.presented_list: dict[int, str] = {}
         self.sock: socket.socket | None = None
+        self.session: MGMTSession | None = None
+        # Powered bit from the current settings returned by the last
+        # successful Set Powered command, None if unknown.
+        self.powered_after_set: bool | None = None
 
     @cached_property
     def name(self) -> str:
@@ -237,7 +1039,15 @@ class MGMTBluetoothCtl:
         single accessor avoids the ``assert self.protocol is not None`` pattern
         at every call site — asserts are stripped under ``python -O`` and a
         ``NoneType has no attribute 'send'`` is a worse error than a typed one.
+
+        A pooled session replaces its protocol when it reconnects, so the
+        current one is picked up from the session on every access.
         """
+        if self.session is not None:
+            self.protocol = self.session.protocol
+            if self.protocol is None:
+                msg = "Bluetooth management session is reconnecting"
+                raise btmgmt_socket.BluetoothSocketError(msg)
         if self.protocol is None:
             msg = f"{type(self).__name__}.setup() has not been called"
             raise RuntimeError(msg)
@@ -268,97 +1078,174 @@ class MGMTBluetoothCtl:
         return self.hci_name
 
     async def close(self) -> None:
-        """Close the management interface."""
+        """Close the management interface.
+
+        A borrowed session is left open for the pool to reuse.
+        """
+        if self.session is not None:
+            self.session = None
+            self.protocol = None
+            self.sock = None
+            return
         if self.protocol and self.protocol.transport:
             self.protocol.transport.close()
             self.protocol = None
         btmgmt_socket.close(self.sock)
 
-    async def setup(self) -> None:
-        """Set up management interface."""
-        sock = btmgmt_socket.open()
-        self.sock = sock
-        loop = asyncio.get_running_loop()
-        connection_made_future: asyncio.Future[None] = loop.create_future()
-        try:
-            async with asyncio_timeout(5):
-                # _create_connection_transport accessed directly to avoid SOCK_STREAM check
-                # see https://bugs.python.org/issue38285
-                _, protocol = await loop._create_connection_transport(  # type: ignore[attr-defined]  # noqa: SLF001
-                    sock,
-                    lambda: BluetoothMGMTProtocol(
-                        self.timeout, connection_made_future, sock
-                    ),
-                    None,
-                    None,
-                )
-                await connection_made_future
-        except asyncio.TimeoutError:
-            btmgmt_socket.close(sock)
-            raise
-        if not isinstance(protocol, BluetoothMGMTProtocol):
-            msg = (
-                "Unexpected protocol type from connection transport: "
-                f"{type(protocol).__name__}"
-            )
-            raise TypeError(msg)
-        self.protocol = protocol
+    async def setup(self, session: MGMTSession | None = None) -> None:
+        """Set up management interface.
+
+        With a ``session`` the pooled socket is used instead of opening a
+        dedicated one.
+        """
+        if session is not None:
+            self.protocol = await session.ensure_connected()
+            self.sock = session.sock
+            self.session = session
+        else:
+            self.sock, self.protocol = await _open_mgmt_connection(self.timeout)
         await self._find_controller()
 
     async def _find_controller(self) -> None:
-        """Find the controller."""
-        if await self._match_from_hci_adapters():
+        """Find the controller.
+
+        A pooled session answers from its controller registry. Otherwise the
+        adapter almost always still sits at the expected hci number, so that
+        index is probed first. On a miss the hci device list is read in
+        the executor while the MGMT controller index list is scanned, and a
+        MAC match from either path ends discovery at once. Without one, a
+        match by hci name is preferred over falling back to the expected hci
+        number in the MGMT list.
+        """
+        if await self._match_from_registry() or await self._probe_expected_index():
+            return
+        loop = asyncio.get_running_loop()
+        hci_lookup = loop.run_in_executor(None, get_adapters_from_hci)
+        mgmt_scan = asyncio.ensure_future(self._match_from_controller_index_list())
+        adapters_from_hci: dict[int, dict[str, Any]] = {}
+        pending: set[asyncio.Future[Any]] = {hci_lookup, mgmt_scan}
+        try:
+            while pending and self.idx is None:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                if hci_lookup in done:
+                    adapters_from_hci = hci_lookup.result()
+                    self._match_from_hci_adapters(adapters_from_hci, by_mac=True)
+        finally:
+            for future in pending:
+                future.cancel()
+        if self.idx is not None:
             return
-        if not await self._match_from_controller_index_list():
+        scan_error = mgmt_scan.exception()
+        if self._match_from_hci_adapters(adapters_from_hci, by_mac=False):
             return
-        self._fallback_by_expected_hci_name()
+        if scan_error is not None:
+            raise scan_error
+        if mgmt_scan.result():
+            self._fallback_by_expected_hci_name()
 
-    async def _match_from_hci_adapters(self) -> bool:
-        """Try to identify the controller via the hci device list.
+    async def _match_from_registry(self) -> bool:
+        """Look the bdaddr up in the session's controller registry.
 
         Returns True when a match has been recorded on ``self``.
         """
-        loop = asyncio.get_running_loop()
-        adapters_from_hci = await loop.run_in_executor(None, get_adapters_from_hci)
+        if self.session is None:
+            return False
+        registry = self.session.controller_registry()
+        if registry is None or not await registry.seed():
+            return False
+        if (idx := registry.index_of(self._expected_bdaddr)) is None:
+            return False
+        _LOGGER.debug(
+            "Found adapter %s at controller idx %s in the registry",
+            self._expected_bdaddr,
+            idx,
+        )
+        self.idx = idx
+        self.hci_name = f"hci{idx}"
+        self.mac = self._expected_bdaddr
+        return True
+
+    async def _probe_expected_index(self) -> bool:
+        """Check whether the expected hci number still carries the bdaddr.
+
+        Returns True when a match has been recorded on ``self``.
+        """
+        idx = hci_name_to_number(self._expected_hci_name)
+        try:
+            hci_info = await self._require_protocol.send(
+                "ReadControllerInformation", idx
+            )
+        except (MGMTCommandError, ControllerRemovedError, asyncio.TimeoutError) as ex:
+            _LOGGER.debug("Probing expected controller idx %s failed: %s", idx, ex)
+            return False
+        if hci_info.event_frame.status.value != 0x00:  # 0x00 - Success
+            return False
+        mac = hci_info.cmd_response_frame.address
+        if not isinstance(mac, str) or mac.upper() != self._expected_bdaddr:
+            _LOGGER.debug(
+                "Expected controller idx %s has address %s, enumerating", idx, mac
+            )
+            return False
+        _LOGGER.debug("Found adapter %s at expected controller idx %s", mac, idx)
+        self.idx = idx
+        self.hci_name = f"hci{idx}"
+        self.mac = self._expected_bdaddr
+        return True
+
+    def _match_from_hci_adapters(
+        self, adapters_from_hci: dict[int, dict[str, Any]], by_mac: bool
+    ) -> bool:
+        """Try to identify the controller via the hci device list.
+
+        Matches on the expected bdaddr when ``by_mac`` is set, otherwise on
+        the expected hci name. Returns True when a match has been recorded on
+        ``self``.
+        """
         if not adapters_from_hci:
             return False
-        _LOGGER.debug("Found adapters from hci: %s", adapters_from_hci)
+        if by_mac:
+            _LOGGER.debug("Found adapters from hci: %s", adapters_from_hci)
         for adapter in adapters_from_hci.values():
-            if adapter["bdaddr"] == self._expected_bdaddr:
-                self.idx = adapter["dev_id"]
-                self.hci_name = adapter["name"]
-                self.mac = adapter["bdaddr"]
+            if by_mac and adapter["bdaddr"] == self._expected_bdaddr:
                 _LOGGER.debug(
                     "Found adapter %s by mac in hci device as %s",
-                    self.mac,
-                    self.idx,
+                    adapter["bdaddr"],
+                    adapter["dev_id"],
                 )
-                return True
-
-        for adapter in adapters_from_hci.values():
-            if adapter["name"] == self._expected_hci_name:
-                self.idx = adapter["dev_id"]
-                self.hci_name = adapter["name"]
-                self.mac = adapter["bdaddr"]
+            elif not by_mac and adapter["name"] == self._expected_hci_name:
                 _LOGGER.debug(
                     "Found adapter %s by name as hci device %s as %s",
-                    self.mac,
+                    adapter["bdaddr"],
                     self._expected_hci_name,
-                    self.idx,
+                    adapter["dev_id"],
                 )
-                return True
+            else:
+                continue
+            self.idx = adapter["dev_id"]
+            self.hci_name = adapter["name"]
+            self.mac = adapter["bdaddr"]
+            return True
         return False
 
     async def _match_from_controller_index_list(self) -> bool:
         """Populate ``presented_list`` from the MGMT controller index list.
 
+        Every listed controller is queried concurrently and the remaining
+        queries are cancelled as soon as the expected bdaddr is seen.
+
         Returns False when the index list could not be read or is empty
         (caller should stop). Returns True otherwise — a successful match
         is recorded on ``self``; absence of a match leaves the caller free
         to attempt the hci-name fallback.
         """
         protocol = self._require_protocol
-        idxdata = await protocol.send("ReadControllerIndexList", None)
+        try:
+            idxdata = await protocol.send("ReadControllerIndexList", None)
+        except MGMTCommandError as ex:
+            _LOGGER.warning("Unable to get hci controllers index list! %s", ex)
+            return False
         if idxdata.event_frame.status.value != 0x00:  # 0x00 - Success
             _LOGGER.error(
                 "Unable to get hci controllers index list! Event frame status: %s",
@@ -370,26 +1257,53 @@ class MGMTBluetoothCtl:
             return False
         hci_idx_list = getattr(idxdata.cmd_response_frame, "controller_index[i]")
         _LOGGER.debug("hci_idx_list: %s", hci_idx_list)
-        for idx in hci_idx_list:
-            hci_info = await protocol.send("ReadControllerInformation", idx)
-            _LOGGER.debug("controller idx %s: %s", idx, hci_info)
-            response = hci_info.cmd_response_frame
-            mac: str = response.address.upper()
-            self.presented_list[idx] = mac
-            if self._expected_bdaddr == mac:
-                _LOGGER.debug(
-                    "Found adapter %s by mac by reading controller info %s", mac, idx
+        lookups = {
+            asyncio.ensure_future(self._read_controller_address(idx)): idx
+            for idx in hci_idx_list
+        }
+        pending = set(lookups)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
                 )
-                self.idx = idx
-                self.hci_name = f"hci{idx}"
-                self.mac = mac
-                break
+                for lookup in done:
+                    mac = lookup.result()
+                    if mac != self._expected_bdaddr:
+                        continue
+                    idx = lookups[lookup]
+                    _LOGGER.debug(
+                        "Found adapter %s by mac by reading controller info %s",
+                        mac,
+                        idx,
+                    )
+                    self.idx = idx
+                    self.hci_name = f"hci{idx}"
+                    self.mac = mac
+                    return True
+        finally:
+            for lookup in pending:
+                lookup.cancel()
         return True
 
+    async def _read_controller_address(self, idx: int) -> str | None:
+        """Read the address of one controller and record it in presented_list."""
+        try:
+            hci_info = await self._require_protocol.send(
+                "ReadControllerInformation", idx
+            )
+        except (MGMTCommandError, ControllerRemovedError, asyncio.TimeoutError) as ex:
+            # e.g. Invalid Index for a controller that went away meanwhile, or
+            # a phantom index that never answers; either way the others count.
+            _LOGGER.debug("Skipping controller idx %s: %s", idx, ex)
+            return None
+        _LOGGER.debug("controller idx %s: %s", idx, hci_info)
+        mac: str = hci_info.cmd_response_frame.address.upper()
+        self.presented_list[idx] = mac
+        return mac
+
     def _fallback_by_expected_hci_name(self) -> None:
         """Match by expected hci name when no bdaddr match was found."""
-        if self.idx is not None:
-            return
         expected_hci = hci_name_to_number(self._expected_hci_name)
         if maybe_mac := self.presented_list.get(expected_hci):
             _LOGGER.warning(
@@ -403,162 +1317,851 @@ class MGMTBluetoothCtl:
             self.hci_name = self._expected_hci_name
             self.mac = maybe_mac
 
-    async def get_powered(self) -> bool | None:
-        """Powered state of the interface."""
+    @property
+    def _registry(self) -> ControllerRegistry | None:
+        """Return the controller registry of the borrowed session, if any."""
+        if self.session is None:
+            return None
+        return self.session.controller_registry()
+
+    async def get_powered(self, cached_ok: bool = False) -> bool | None:
+        """Powered state of the interface.
+
+        With ``cached_ok`` the state mirrored by the session's controller
+        registry is returned without a round trip when it tracks this
+        controller.
+        """
         protocol = self._require_protocol
-        if self.idx is not None:
-            response = await protocol.send("ReadControllerInformation", self.idx)
-            return response.cmd_response_frame.current_settings.get(
-                btmgmt_protocol.SupportedSettings.Powered
-            )
-        return None
+        if self.idx is None:
+            return None
+        registry = self._registry
+        if (
+            cached_ok
+            and registry is not None
+            and (powered := registry.powered(self.idx)) is not None
+        ):
+            return powered
+        response = await protocol.send("ReadControllerInformation", self.idx)
+        settings = response.cmd_response_frame.current_settings
+        if registry is not None:
+            registry.update_settings(self.idx, settings)
+        return settings.get(btmgmt_protocol.SupportedSettings.Powered)
 
     async def set_powered(self, new_state: bool) -> bool:
-        """Set the powered state of the interface."""
-        response = await self._require_protocol.send(
-            "SetPowered", self.idx, int(new_state is True)
-        )
-        return response.event_frame.status.value == 0x00  # 0x00 - Success
+        """Set the powered state of the interface.
+
+        The reply carries the controller's current settings once the change
+        has completed; its Powered bit is kept in powered_after_set so callers
+        do not need another Read Controller Information to confirm it.
+        """
+        self.powered_after_set = None
+        try:
+            response = await self._require_protocol.send(
+                "SetPowered", self.idx, int(new_state is True)
+            )
+        except MGMTCommandError as ex:
+            _LOGGER.debug("Setting power of %s failed: %s", self.name, ex)
+            return False
+        if response.event_frame.status.value != 0x00:  # 0x00 - Success
+            return False
+        settings = getattr(response.cmd_response_frame, "current_settings", None)
+        if isinstance(settings, dict):
+            if self.idx is not None and (registry := self._registry) is not None:
+                registry.update_settings(self.idx, settings)
+            powered = settings.get(btmgmt_protocol.SupportedSettings.Powered)
+            if isinstance(powered, bool):
+                self.powered_after_set = powered
+        return True
 
     async def wait_for_power_state(
         self, new_state: bool, timeout: float
     ) -> bool | None:
-        """Wait for the adapter to be powered on or off."""
-        _ = self._require_protocol
+        """Wait for the adapter to be powered on or off.
+
+        The kernel announces every change of the Powered bit with a New
+        Settings event, so the wait resolves as soon as that event arrives.
+        The event is not sent to the socket whose own command caused the
+        change, which a pooled socket often is, so the state is also re-read
+        every POWER_STATE_POLL_INTERVAL seconds.
+
+        Raises ControllerRemovedError as soon as the controller is removed.
+        """
+        protocol = self._require_protocol
+        reached, unsubscribers = self._watch_power_state(protocol, new_state)
         current_state: bool | None = not new_state
         try:
             async with asyncio_timeout(timeout):
+                # Subscribed first, so a change racing a read is not lost.
                 while True:
                     current_state = await self.get_powered()
                     if current_state == new_state:
                         return current_state
-                    await asyncio.sleep(0.1)
+                    await asyncio.wait((reached,), timeout=POWER_STATE_POLL_INTERVAL)
+                    if reached.done():
+                        reached.result()
+                        return new_state
         except asyncio.TimeoutError:
             return current_state
+        finally:
+            for unsubscribe in unsubscribers:
+                unsubscribe()
+
+    def _watch_power_state(
+        self, protocol: BluetoothMGMTProtocol, new_state: bool
+    ) -> tuple[asyncio.Future[None], list[Callable[[], None]]]:
+        """Return a future resolved by a New Settings event with ``new_state``.
+
+        It fails with ControllerRemovedError when the controller is removed.
+        The callables returned with it stop the watch.
+        """
+        reached: asyncio.Future[None] = protocol.loop.create_future()
+
+        def _on_new_settings(controller_idx: int, event_frame: Any) -> None:
+            if (
+                controller_idx == self.idx
+                and not reached.done()
+                and event_frame.current_settings.get(
+                    btmgmt_protocol.SupportedSettings.Powered
+                )
+                is new_state
+            ):
+                reached.set_result(None)
+
+        def _on_index_removed(controller_idx: int, _event_frame: Any) -> None:
+            if controller_idx == self.idx and not reached.done():
+                reached.set_exception(ControllerRemovedError(controller_idx))
+
+        unsubscribers = [
+            protocol.subscribe(
+                btmgmt_protocol.Events.NewSettingsEvent, _on_new_settings
+            ),
+            protocol.subscribe(
+                btmgmt_protocol.Events.IndexRemovedEvent, _on_index_removed
+            ),
+        ]
+        return reached, unsubscribers
+
+
+class _ReappearanceWatcher:
+    """Wait for an adapter to be announced again with an Index Added event.
+
+    Every Index Added is followed by a Read Controller Information for the new
+    index; the wait resolves with the first index whose address is ``mac``.
+    """
+
+    def __init__(self, protocol: BluetoothMGMTProtocol, mac: str) -> None:
+        """Subscribe to Index Added events."""
+        self._protocol = protocol
+        self._mac = mac
+        self._found: asyncio.Future[int] = protocol.loop.create_future()
+        self._lookups: set[asyncio.Task[None]] = set()
+        self._unsubscribe = protocol.subscribe(
+            btmgmt_protocol.Events.IndexAddedEvent, self._on_index_added
+        )
+
+    def _on_index_added(self, controller_idx: int, _event_frame: Any) -> None:
+        _LOGGER.debug("Controller index %s added", controller_idx)
+        task = self._protocol.loop.create_task(self._check_index(controller_idx))
+        self._lookups.add(task)
+        task.add_done_callback(self._lookups.discard)
+
+    async def _check_index(self, controller_idx: int) -> None:
+        try:
+            info = await self._protocol.send(
+                "ReadControllerInformation", controller_idx
+            )
+        except (
+            MGMTCommandError,
+            ControllerRemovedError,
+            btmgmt_socket.BluetoothSocketError,
+            asyncio.TimeoutError,
+            OSError,
+        ) as ex:
+            _LOGGER.debug(
+                "Reading added controller index %s failed: %s", controller_idx, ex
+            )
+            return
+        if (
+            info.event_frame.status.value == 0x00  # 0x00 - Success
+            and info.cmd_response_frame.address.upper() == self._mac
+            and not self._found.done()
+        ):
+            self._found.set_result(controller_idx)
+
+    async def wait(self, timeout: float) -> int | None:
+        """Return the index the adapter reappeared at, or None on timeout."""
+        try:
+            async with asyncio_timeout(timeout):
+                return await self._found
+        except asyncio.TimeoutError:
+            _LOGGER.debug(
+                "Adapter with mac address %s was not added back within %ss",
+                self._mac,
+                timeout,
+            )
+            return None
+
+    def close(self) -> None:
+        """Stop watching."""
+        self._unsubscribe()
+        for task in self._lookups:
+            task.cancel()
+
+
+@contextmanager
+def _watch_for_reappearance(
+    adapter: MGMTBluetoothCtl, mac: str
+) -> Iterator[_ReappearanceWatcher | None]:
+    """Watch for ``mac`` to be added back, or yield None if not enabled."""
+    if not _config().post_reset_wait_for_index_added:
+        yield None
+        return
+    watcher = _ReappearanceWatcher(adapter._require_protocol, mac)  # noqa: SLF001
+    try:
+        yield watcher
+    finally:
+        watcher.close()
+
+
+async def _check_rfkill(adapter: MGMTBluetoothCtl) -> RFKillInfo:
+    """Check if rfkill is blocked."""
+    loop = asyncio.get_running_loop()
+    timeout = _budgeted(_config().max_rfkill_time)
+    try:
+        async with asyncio_timeout(timeout):
+            return await loop.run_in_executor(None, rfkill_list_bluetooth, adapter)
+    except asyncio.TimeoutError:
+        _LOGGER.warning(
+            "Checking rfkill for %s timed out after %s seconds!",
+            adapter.name,
+            timeout,
+        )
+
+    return RFKillInfo(None, None, None)
+
+
+async def _unblock_rfkill(adapter: MGMTBluetoothCtl, rfkill_idx: int) -> bool:
+    """Try to unblock an adapter."""
+    loop = asyncio.get_running_loop()
+    timeout = _budgeted(_config().max_rfkill_time)
+    try:
+        async with asyncio_timeout(timeout):
+            return await loop.run_in_executor(None, rfkill_unblock, adapter, rfkill_idx)
+    except asyncio.TimeoutError:
+        _LOGGER.warning(
+            "Unblocking rfkill for %s with idx:%s timed out after %s seconds!",
+            adapter.name,
+            rfkill_idx,
+            timeout,
+        )
+
+    return False
+
+
+async def _check_or_unblock_rfkill(adapter: MGMTBluetoothCtl) -> bool:
+    """Check if rfkill is blocked, and try to unblock if possible.
+
+    Returns False if the adapter is blocked or the state
+    could not be determined.
+    """
+    rfkill_info = await _check_rfkill(adapter)
+    if rfkill_info.idx is None:
+        _LOGGER.debug(
+            "Could not determine rfkill_idx of %s: %s", adapter.name, rfkill_info
+        )
+        return True
+
+    _LOGGER.debug("rfkill_idx of %s is %s", adapter.name, rfkill_info.idx)
+
+    if rfkill_info.hard_block:
+        _LOGGER.warning(
+            "Bluetooth adapter %s is hard blocked by rfkill; hardware reboot required: %s",
+            adapter.name,
+            rfkill_info,
+        )
+        return False
+
+    if not rfkill_info.soft_block:
+        _LOGGER.debug(
+            "Bluetooth adapter %s is NOT soft blocked by rfkill: %s",
+            adapter.name,
+            rfkill_info,
+        )
+        return True
+
+    _LOGGER.debug(
+        "Bluetooth adapter %s is soft blocked by rfkill; trying to unblock",
+        adapter.name,
+    )
+    loop = asyncio.get_running_loop()
+    unblock_started = loop.time()
+    await _unblock_rfkill(adapter, rfkill_info.idx)
+
+    # The kernel does not clear the rfkill block synchronously. A single fixed
+    # wait is both wasteful when the block clears quickly and too short on slow
+    # systems (Pi/HA), where the adapter is still reported blocked after the
+    # wait and is then falsely declared "could not be unblocked". Poll instead:
+    # return as soon as the block clears, re-checking every
+    # RFKILL_UNBLOCK_POLL_INTERVAL seconds, with the whole poll bounded by
+    # RFKILL_UNBLOCK_GRACE_TIME of wall-clock time so the worst case stays
+    # capped regardless of how long each re-check takes.
+    #
+    # This is NOT a busy wait: each iteration sleeps for
+    # RFKILL_UNBLOCK_POLL_INTERVAL seconds with `await asyncio.sleep(...)`, and
+    # `_check_rfkill` runs in an executor under its own timeout, so the event
+    # loop is yielded for the entire duration of the poll.
+    config = _config()
+    with suppress(asyncio.TimeoutError):
+        async with asyncio_timeout(_budgeted(config.rfkill_unblock_grace_time)):
+            while True:
+                rfkill_info = await _check_rfkill(adapter)
+                # Require an explicit unblocked reading. A timed-out check
+                # returns RFKillInfo(None, None, None); `not None` is truthy, so
+                # treating None as "unblocked" would falsely report success on an
+                # unknown state. Keep polling until both blocks are explicitly
+                # False (or the grace expires and we report failure below).
+                if rfkill_info.soft_block is False and rfkill_info.hard_block is False:
+                    _LOGGER.debug(
+                        "Bluetooth adapter %s was successfully unblocked",
+                        adapter.name,
+                    )
+                    _stage_completed(RFKILL_UNBLOCK, loop.time() - unblock_started)
+                    return True
+                _LOGGER.debug(
+                    "Waiting %ss for kernel to catch up after rfkill unblock of %s",
+                    config.rfkill_unblock_poll_interval,
+                    adapter.name,
+                )
+                await asyncio.sleep(config.rfkill_unblock_poll_interval)
+
+    _stage_timed_out(RFKILL_UNBLOCK)
+    _LOGGER.warning(
+        "Bluetooth adapter %s is blocked by rfkill and could not be unblocked",
+        adapter.name,
+    )
+    return False
+
+
+async def recover_adapter(
+    hci: int,
+    mac: str,
+    gone_silent: bool = False,
+    *,
+    budget: float | None = None,
+    config: RecoveryConfig | None = None,
+) -> bool:
+    """Reset the bluetooth adapter.
+
+    With ``budget`` the recovery returns within that many seconds; see
+    recover_adapter_outcome() to tell a budget that ran out from a failure.
+    ``config`` replaces the module-level timings for this recovery.
+    """
+    outcome = await recover_adapter_outcome(
+        hci, mac, gone_silent, budget=budget, config=config
+    )
+    return outcome is RecoveryOutcome.SUCCEEDED
+
+
+async def recover_adapter_outcome(
+    hci: int,
+    mac: str,
+    gone_silent: bool = False,
+    *,
+    budget: float | None = None,
+    config: RecoveryConfig | None = None,
+) -> RecoveryOutcome:
+    """Reset the bluetooth adapter and report how the attempt ended.
+
+    Every wait is shortened to fit the ``budget`` seconds that remain, the
+    power off is skipped when there is no time to power back on, and the
+    attempt is abandoned once the budget runs out.
+
+    While a recovery of the same adapter is in progress, this waits for its
+    outcome instead of starting another one. If that recovery is cancelled,
+    the callers waiting for it start their own.
+    """
+    mac = mac.upper()
+    loop = asyncio.get_running_loop()
+    key = (loop, mac)
+    outcome, budget = await _join_in_flight(key, mac, budget)
+    if outcome is not None:
+        return outcome
+    resolved = config if config is not None else _config()
+    if _cooling_down(hci, mac, resolved):
+        return RecoveryOutcome.COOLING_DOWN
+    # Claimed before the first await, so concurrent callers join this one.
+    _IN_FLIGHT[key] = future = loop.create_future()
+    try:
+        if resolved.recent_success_short_circuit:
+            started = loop.time()
+            if await _recently_recovered(hci, mac, budget, resolved):
+                future.set_result(RecoveryOutcome.SUCCEEDED)
+                return RecoveryOutcome.SUCCEEDED
+            if budget is not None:
+                budget = max(0.0, budget - (loop.time() - started))
+        outcome = await _run_locked_recovery(hci, mac, gone_silent, budget, config)
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except BaseException as ex:
+        future.set_exception(ex)
+        # Joined callers re-raise it; nobody has to.
+        future.exception()
+        raise
+    else:
+        future.set_result(outcome)
+        _record_outcome(hci, mac, outcome, resolved)
+        return outcome
+    finally:
+        _IN_FLIGHT.pop(key, None)
+
+
+def _cooling_down(hci: int, mac: str, config: RecoveryConfig) -> bool:
+    """Return True if the circuit breaker refuses to recover the adapter."""
+    if not config.circuit_breaker or not (
+        cooldown := _CIRCUIT_BREAKER.cooldown_remaining(hci, mac)
+    ):
+        return False
+    _LOGGER.debug(
+        "Not recovering the adapter with mac address %s for another %.1fs "
+        "after repeated failures",
+        mac,
+        cooldown,
+    )
+    return True
+
+
+def _record_outcome(
+    hci: int, mac: str, outcome: RecoveryOutcome, config: RecoveryConfig
+) -> None:
+    """Remember a success, and count a failure towards the cooldown.
+
+    A budget that ran out says nothing about the adapter and is not counted.
+    """
+    if outcome is RecoveryOutcome.SUCCEEDED:
+        if config.recent_success_short_circuit:
+            _RECENT_SUCCESSES[mac] = asyncio.get_running_loop().time()
+        if config.circuit_breaker:
+            _CIRCUIT_BREAKER.reset(mac)
+    elif outcome is RecoveryOutcome.FAILED:
+        _RECENT_SUCCESSES.pop(mac, None)
+        if config.circuit_breaker:
+            _CIRCUIT_BREAKER.record_failure(hci, mac, config)
+
+
+async def _recently_recovered(
+    hci: int, mac: str, budget: float | None, config: RecoveryConfig
+) -> bool:
+    """Return True if the adapter was recovered moments ago and still looks fine.
+
+    Answering such a call with another reset would knock the adapter that was
+    just brought back offline again.
+    """
+    recovered_at = _RECENT_SUCCESSES.get(mac)
+    loop = asyncio.get_running_loop()
+    if (
+        recovered_at is None
+        or loop.time() - recovered_at > config.recent_success_window
+    ):
+        return False
+    timeout = config.recent_success_probe_timeout
+    if budget is not None:
+        timeout = min(timeout, budget)
+    config_token = _RECOVERY_CONFIG.set(config)
+    try:
+        async with asyncio_timeout(timeout):
+            healthy = await _probe_adapter_health(f"hci{hci}", mac)
+    except asyncio.TimeoutError:
+        healthy = False
+    finally:
+        _RECOVERY_CONFIG.reset(config_token)
+    _LOGGER.debug(
+        "The adapter with mac address %s was recovered %.1fs ago and %s",
+        mac,
+        loop.time() - recovered_at,
+        "still looks healthy" if healthy else "no longer looks healthy",
+    )
+    return healthy
+
+
+async def _probe_adapter_health(hci_name: str, mac: str) -> bool:
+    """Return True if the adapter is powered and not blocked by rfkill."""
+    async with _get_adapter(hci_name, mac) as adapter:
+        if not adapter:
+            return False
+        try:
+            powered = await adapter.get_powered(cached_ok=True)
+        except (
+            MGMTCommandError,
+            ControllerRemovedError,
+            btmgmt_socket.BluetoothSocketError,
+        ) as ex:
+            _LOGGER.debug("Reading the power state of %s failed: %s", adapter.name, ex)
+            return False
+        if not powered:
+            return False
+        rfkill_info = await _check_rfkill(adapter)
+        return rfkill_info.soft_block is not True and rfkill_info.hard_block is not True
+
+
+def _adapter_added(loop: asyncio.AbstractEventLoop, mac: str) -> None:
+    """End the cooldown of an adapter the kernel announced again.
+
+    A new Index Added means the hardware was replugged or re-enumerated,
+    unless it is the adapter coming back from our own USB reset.
+    """
+    if (loop, mac) not in _IN_FLIGHT:
+        _CIRCUIT_BREAKER.reset(mac)
+
+
+async def _join_in_flight(
+    key: tuple[asyncio.AbstractEventLoop, str], mac: str, budget: float | None
+) -> tuple[RecoveryOutcome | None, float | None]:
+    """Wait for the outcome of the recovery of ``key`` in progress, if any.
+
+    Returns None and what remains of ``budget`` once no recovery that is
+    still going to have an outcome is in progress.
+    """
+    loop = key[0]
+    while (in_flight := _IN_FLIGHT.get(key)) is not None:
+        joined = loop.time()
+        if (outcome := await _join_recovery(in_flight, mac, budget)) is not None:
+            return outcome, budget
+        if budget is not None:
+            budget = max(0.0, budget - (loop.time() - joined))
+    return None, budget
+
+
+async def _join_recovery(
+    in_flight: asyncio.Future[RecoveryOutcome], mac: str, budget: float | None
+) -> RecoveryOutcome | None:
+    """Wait, within ``budget``, for the outcome of a recovery in progress.
+
+    Returns None if that recovery was cancelled before it had an outcome.
+    """
+    _LOGGER.debug(
+        "Recovery of the adapter with mac address %s is already in progress; "
+        "waiting for its outcome",
+        mac,
+    )
+    try:
+        async with asyncio_timeout(budget):
+            return await asyncio.shield(in_flight)
+    except asyncio.TimeoutError:
+        if budget is None:
+            raise
+        return RecoveryOutcome.BUDGET_EXHAUSTED
+    except asyncio.CancelledError:
+        # Only the recovery being joined was cancelled, not this caller.
+        if not in_flight.cancelled():
+            raise
+        _LOGGER.debug(
+            "The recovery of the adapter with mac address %s that was joined "
+            "was cancelled; recovering it again",
+            mac,
+        )
+        return None
+
+
+async def _run_locked_recovery(
+    hci: int,
+    mac: str,
+    gone_silent: bool,
+    budget: float | None,
+    config: RecoveryConfig | None,
+) -> RecoveryOutcome:
+    """Recover the adapter while holding its cross-process lock, if enabled."""
+    resolved = config if config is not None else _config()
+    if not resolved.adapter_lock:
+        return await _run_recovery(hci, mac, gone_silent, budget, config)
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    lock = AdapterLock(mac)
+    lock_timeout = resolved.adapter_lock_timeout
+    if budget is not None:
+        lock_timeout = min(lock_timeout, budget)
+    try:
+        locked = await lock.acquire(lock_timeout)
+    except OSError as ex:
+        _LOGGER.warning(
+            "Could not lock %s, recovering without the lock: %s", lock.path, ex
+        )
+        return await _run_recovery(hci, mac, gone_silent, budget, config)
+    if not locked:
+        _LOGGER.warning(
+            "Another process kept recovering the adapter with mac address %s "
+            "for more than %ss",
+            mac,
+            lock_timeout,
+        )
+        if budget is not None and lock_timeout == budget:
+            return RecoveryOutcome.BUDGET_EXHAUSTED
+        return RecoveryOutcome.FAILED
+    outcome: RecoveryOutcome | None = None
+    try:
+        if resolved.adopt_locked_outcome and (
+            adopted := _parse_outcome(await lock.outcome_since_acquire())
+        ):
+            _LOGGER.debug(
+                "Another process recovered the adapter with mac address %s "
+                "while waiting for the lock: %s",
+                mac,
+                adopted.name,
+            )
+            return adopted
+        if budget is not None:
+            budget = max(0.0, budget - (loop.time() - started))
+        outcome = await _run_recovery(hci, mac, gone_silent, budget, config)
+        return outcome
+    finally:
+        try:
+            await lock.release(outcome.name if outcome in _ADOPTABLE_OUTCOMES else None)
+        except OSError as ex:
+            _LOGGER.warning("Could not release %s: %s", lock.path, ex)
+
+
+# What a recovery found out about the adapter, which a process that waited for
+# the lock can adopt. Any other outcome only says how the holder's call went.
+_ADOPTABLE_OUTCOMES = frozenset({RecoveryOutcome.SUCCEEDED, RecoveryOutcome.FAILED})
+
+
+def _parse_outcome(name: str | None) -> RecoveryOutcome | None:
+    """Return the adoptable outcome with ``name``, if there is one."""
+    if name is None:
+        return None
+    try:
+        outcome = RecoveryOutcome[name]
+    except KeyError:
+        return None
+    return outcome if outcome in _ADOPTABLE_OUTCOMES else None
+
+
+async def _run_recovery(
+    hci: int,
+    mac: str,
+    gone_silent: bool,
+    budget: float | None,
+    config: RecoveryConfig | None,
+) -> RecoveryOutcome:
+    """Recover the adapter with the pooled session, budget and config."""
+    hci_name = f"hci{hci}"
+    _LOGGER.debug(
+        "Attempting to recover bluetooth adapter %s with mac address %s (gone_silent=%s)",
+        hci_name,
+        mac,
+        gone_silent,
+    )
+    # Hold the pooled MGMT session for the whole recovery so the pre- and
+    # post-reset lookups share one socket and a dropped connection is
+    # re-established eagerly.
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    resolved = config if config is not None else _config()
+    stage_times: dict[str, float | None] | None = None
+    if resolved.self_tuning_timeouts:
+        config = await _TIMEOUT_TUNER.tuned_config(mac, resolved)
+        stage_times = {}
+    recovery_budget = None if budget is None else RecoveryBudget(started + budget)
+    token = _RECOVERY_BUDGET.set(recovery_budget)
+    config_token = _RECOVERY_CONFIG.set(config)
+    steps: dict[str, float] = {}
+    steps_token = _RECOVERY_STEPS.set(steps)
+    stage_times_token = _STAGE_TIMES.set(stage_times)
+    found = _FoundAdapter(hci)
+    found_token = _FOUND_ADAPTER.set(found)
+    session = _acquire_session()
+    try:
+        with count_mgmt_round_trips() as round_trips:
+            try:
+                async with asyncio_timeout(budget):
+                    recovered = await _recover_adapter(hci_name, mac, gone_silent)
+            except asyncio.TimeoutError:
+                if budget is None:
+                    raise
+                recovered = False
+            finally:
+                _LOGGER.debug(
+                    "Recovery of %s used %s MGMT round trips",
+                    hci_name,
+                    round_trips.count,
+                )
+    finally:
+        session.release()
+        _FOUND_ADAPTER.reset(found_token)
+        _STAGE_TIMES.reset(stage_times_token)
+        _RECOVERY_STEPS.reset(steps_token)
+        _RECOVERY_CONFIG.reset(config_token)
+        _RECOVERY_BUDGET.reset(token)
+
+    if recovered:
+        outcome = RecoveryOutcome.SUCCEEDED
+    elif recovery_budget is not None and recovery_budget.exhausted:
+        _LOGGER.warning("Recovery of %s ran out of its %ss budget", hci_name, budget)
+        outcome = RecoveryOutcome.BUDGET_EXHAUSTED
+    else:
+        outcome = RecoveryOutcome.FAILED
+    if stage_times:
+        await _observe_stage_times(mac, stage_times)
+    if resolved.recovery_history:
+        await _record_history(
+            RecoveryRecord(
+                mac=mac,
+                hci=found.hci,
+                outcome=outcome.name,
+                duration=loop.time() - started,
+                steps=steps,
+                finished=time.time(),
+            )
+        )
+    return outcome
 
 
-async def _check_rfkill(adapter: MGMTBluetoothCtl) -> RFKillInfo:
-    """Check if rfkill is blocked."""
-    loop = asyncio.get_running_loop()
+async def _observe_stage_times(mac: str, stage_times: dict[str, float | None]) -> None:
+    """Feed the stage times of a recovery to the tuner, logging when that fails."""
     try:
-        async with asyncio_timeout(MAX_RFKILL_TIME):
-            return await loop.run_in_executor(None, rfkill_list_bluetooth, adapter)
-    except asyncio.TimeoutError:
-        _LOGGER.warning(
-            "Checking rfkill for %s timed out after %s seconds!",
-            adapter.name,
-            MAX_RFKILL_TIME,
-        )
-
-    return RFKillInfo(None, None, None)
+        await _TIMEOUT_TUNER.observe(mac, stage_times)
+    except OSError as ex:
+        _LOGGER.warning("Could not save the tuned timeouts of %s: %s", mac, ex)
 
 
-async def _unblock_rfkill(adapter: MGMTBluetoothCtl, rfkill_idx: int) -> bool:
-    """Try to unblock an adapter."""
-    loop = asyncio.get_running_loop()
+async def _record_history(record: RecoveryRecord) -> None:
+    """Append a recovery to the history file, logging when that fails."""
     try:
-        async with asyncio_timeout(MAX_RFKILL_TIME):
-            return await loop.run_in_executor(None, rfkill_unblock, adapter, rfkill_idx)
-    except asyncio.TimeoutError:
-        _LOGGER.warning(
-            "Unblocking rfkill for %s with idx:%s timed out after %s seconds!",
-            adapter.name,
-            rfkill_idx,
-            MAX_RFKILL_TIME,
-        )
+        await append_record(record)
+    except OSError as ex:
+        _LOGGER.warning("Could not record the recovery of %s: %s", record.mac, ex)
 
-    return False
 
+class _WorkSlot:
+    """One of the slots limiting how many adapters are recovered at once."""
 
-async def _check_or_unblock_rfkill(adapter: MGMTBluetoothCtl) -> bool:
-    """Check if rfkill is blocked, and try to unblock if possible.
+    def __init__(self, semaphore: asyncio.Semaphore) -> None:
+        """Initialize the slot."""
+        self._semaphore = semaphore
+        self._held = False
 
-    Returns False if the adapter is blocked or the state
-    could not be determined.
-    """
-    rfkill_info = await _check_rfkill(adapter)
-    if rfkill_info.idx is None:
-        _LOGGER.debug(
-            "Could not determine rfkill_idx of %s: %s", adapter.name, rfkill_info
-        )
-        return True
+    async def acquire(self) -> None:
+        """Wait for a free slot."""
+        await self._semaphore.acquire()
+        self._held = True
 
-    _LOGGER.debug("rfkill_idx of %s is %s", adapter.name, rfkill_info.idx)
+    def release(self) -> None:
+        """Give the slot back, if it is held."""
+        if self._held:
+            self._held = False
+            self._semaphore.release()
 
-    if rfkill_info.hard_block:
-        _LOGGER.warning(
-            "Bluetooth adapter %s is hard blocked by rfkill; hardware reboot required: %s",
-            adapter.name,
-            rfkill_info,
-        )
-        return False
 
-    if not rfkill_info.soft_block:
-        _LOGGER.debug(
-            "Bluetooth adapter %s is NOT soft blocked by rfkill: %s",
-            adapter.name,
-            rfkill_info,
-        )
-        return True
+_WORK_SLOT: ContextVar[_WorkSlot | None] = ContextVar("_WORK_SLOT", default=None)
 
-    _LOGGER.debug(
-        "Bluetooth adapter %s is soft blocked by rfkill; trying to unblock",
-        adapter.name,
-    )
-    await _unblock_rfkill(adapter, rfkill_info.idx)
 
-    # The kernel does not clear the rfkill block synchronously. A single fixed
-    # wait is both wasteful when the block clears quickly and too short on slow
-    # systems (Pi/HA), where the adapter is still reported blocked after the
-    # wait and is then falsely declared "could not be unblocked". Poll instead:
-    # return as soon as the block clears, re-checking every
-    # RFKILL_UNBLOCK_POLL_INTERVAL seconds, with the whole poll bounded by
-    # RFKILL_UNBLOCK_GRACE_TIME of wall-clock time so the worst case stays
-    # capped regardless of how long each re-check takes.
-    #
-    # This is NOT a busy wait: each iteration sleeps for
-    # RFKILL_UNBLOCK_POLL_INTERVAL seconds with `await asyncio.sleep(...)`, and
-    # `_check_rfkill` runs in an executor under its own timeout, so the event
-    # loop is yielded for the entire duration of the poll.
-    with suppress(asyncio.TimeoutError):
-        async with asyncio_timeout(RFKILL_UNBLOCK_GRACE_TIME):
-            while True:
-                rfkill_info = await _check_rfkill(adapter)
-                # Require an explicit unblocked reading. A timed-out check
-                # returns RFKillInfo(None, None, None); `not None` is truthy, so
-                # treating None as "unblocked" would falsely report success on an
-                # unknown state. Keep polling until both blocks are explicitly
-                # False (or the grace expires and we report failure below).
-                if rfkill_info.soft_block is False and rfkill_info.hard_block is False:
-                    _LOGGER.debug(
-                        "Bluetooth adapter %s was successfully unblocked",
-                        adapter.name,
-                    )
-                    return True
-                _LOGGER.debug(
-                    "Waiting %ss for kernel to catch up after rfkill unblock of %s",
-                    RFKILL_UNBLOCK_POLL_INTERVAL,
-                    adapter.name,
-                )
-                await asyncio.sleep(RFKILL_UNBLOCK_POLL_INTERVAL)
+@asynccontextmanager
+async def _work_slot_released() -> AsyncIterator[None]:
+    """Let another adapter use this recovery's slot while it only waits."""
+    if (slot := _WORK_SLOT.get()) is None:
+        yield
+        return
+    slot.release()
+    yield
+    # Not retaken when the wait failed or was cancelled: the recovery is over.
+    await slot.acquire()
+
+
+async def recover_adapters(
+    adapters: Iterable[tuple[int, str, bool]],
+    *,
+    concurrency: int | None = None,
+    budget: float | None = None,
+    config: RecoveryConfig | None = None,
+) -> dict[str, RecoveryOutcome]:
+    """Recover several adapters, given as (hci, mac, gone_silent) tuples.
+
+    The controllers are enumerated once on the pooled MGMT session, which all
+    the recoveries share. At most ``concurrency`` adapters, by default
+    RECOVER_ADAPTERS_CONCURRENCY, are worked on at a time, while the waits for
+    the kernel and BlueZ overlap freely. ``budget`` bounds the whole call.
+    Returns the outcome for each mac address.
+
+    Raises ValueError if a mac address is given more than once.
+    """
+    if concurrency is None:
+        concurrency = RECOVER_ADAPTERS_CONCURRENCY
+    if concurrency < 1:
+        msg = f"concurrency must be at least 1, got {concurrency}"
+        raise ValueError(msg)
+    requested: dict[str, tuple[int, bool]] = {}
+    for hci, mac, gone_silent in adapters:
+        if (upper := mac.upper()) in requested:
+            msg = f"the adapter with mac address {upper} is given more than once"
+            raise ValueError(msg)
+        requested[upper] = (hci, gone_silent)
+    loop = asyncio.get_running_loop()
+    deadline = None if budget is None else loop.time() + budget
+    semaphore = asyncio.Semaphore(concurrency)
 
-    _LOGGER.warning(
-        "Bluetooth adapter %s is blocked by rfkill and could not be unblocked",
-        adapter.name,
-    )
-    return False
+    async def _recover_one(hci: int, mac: str, gone_silent: bool) -> RecoveryOutcome:
+        slot = _WorkSlot(semaphore)
+        try:
+            async with asyncio_timeout(
+                None if deadline is None else deadline - loop.time()
+            ):
+                await slot.acquire()
+        except asyncio.TimeoutError:
+            return RecoveryOutcome.BUDGET_EXHAUSTED
+        token = _WORK_SLOT.set(slot)
+        try:
+            return await recover_adapter_outcome(
+                hci,
+                mac,
+                gone_silent,
+                budget=None if deadline is None else max(0.0, deadline - loop.time()),
+                config=config,
+            )
+        except Exception:
+            _LOGGER.exception("Recovering the adapter with mac address %s failed", mac)
+            return RecoveryOutcome.FAILED
+        finally:
+            _WORK_SLOT.reset(token)
+            slot.release()
 
+    session = _acquire_session()
+    try:
+        await _enumerate_controllers(session, config)
+        outcomes = await asyncio.gather(
+            *(
+                _recover_one(hci, mac, gone_silent)
+                for mac, (hci, gone_silent) in requested.items()
+            )
+        )
+    finally:
+        session.release()
+    return dict(zip(requested, outcomes, strict=True))
 
-async def recover_adapter(hci: int, mac: str, gone_silent: bool = False) -> bool:
-    """Reset the bluetooth adapter."""
-    mac = mac.upper()
-    hci_name = f"hci{hci}"
-    _LOGGER.debug(
-        "Attempting to recover bluetooth adapter %s with mac address %s (gone_silent=%s)",
-        hci_name,
-        mac,
-        gone_silent,
-    )
+
+async def _enumerate_controllers(
+    session: MGMTSession, config: RecoveryConfig | None
+) -> None:
+    """Seed the session's controller registry so every lookup is answered."""
+    # The pooled socket may be opened here, and filtered as ``config`` says.
+    config_token = _RECOVERY_CONFIG.set(config)
+    try:
+        await session.ensure_connected()
+    except (
+        btmgmt_socket.BluetoothSocketError,
+        asyncio.TimeoutError,
+        OSError,
+    ) as ex:
+        # Each recovery reports its own failure to get the adapter.
+        _LOGGER.debug("Could not enumerate the controllers: %s", ex)
+        return
+    finally:
+        _RECOVERY_CONFIG.reset(config_token)
+    if (registry := session.controller_registry()) is not None:
+        await registry.seed()
+
+
+async def _recover_adapter(hci_name: str, mac: str, gone_silent: bool) -> bool:
+    """Run the recovery escalation while the pooled session is held."""
     async with _get_adapter(hci_name, mac) as adapter:
         if (
             not adapter
@@ -582,25 +2185,95 @@ async def recover_adapter(hci: int, mac: str, gone_silent: bool = False) -> bool
             _LOGGER.warning(
                 "Adapter with name %s mac address resolved to %s", hci_name, mac
             )
+        _found_at(hci_name)
+
+        config = _config()
+        if config.unblock_rfkill:
+            with _timed_step("rfkill"):
+                unblocked = await _check_or_unblock_rfkill(adapter)
+            if not unblocked:
+                _LOGGER.warning(
+                    "rfkill has blocked %s, and could not be unblocked", adapter.name
+                )
 
-        if not await _check_or_unblock_rfkill(adapter):
-            _LOGGER.warning(
-                "rfkill has blocked %s, and could not be unblocked", adapter.name
-            )
+        if _budget_exhausted():
+            return False
 
-        power_cycle_ok = await _power_cycle_adapter(adapter)
-        # If the adapter has not gone silent, a successful power cycle is enough.
-        if power_cycle_ok and not gone_silent:
-            # Give Dbus some time to catch up
-            _LOGGER.debug(
-                "Waiting %ss for kernel and Dbus to catch up after successful power cycle",
-                DBUS_REGISTER_TIME,
-            )
-            await asyncio.sleep(DBUS_REGISTER_TIME)
-            return True
+        return await _escalate(adapter, hci_name, mac, gone_silent)
 
-        # The adapter has gone silent (or the power cycle failed), so escalate to
-        # a USB reset. This may also move the adapter to a new hci number.
+
+async def _escalate(
+    adapter: MGMTBluetoothCtl, hci_name: str, mac: str, gone_silent: bool
+) -> bool:
+    """Power cycle the adapter and, if that is not enough, USB reset it."""
+    config = _config()
+    plan = await _escalation_plan(hci_name, mac)
+    power_cycle = config.power_cycle and plan.runs(POWER_CYCLE)
+    usb_reset = config.usb_reset and plan.runs(USB_RESET)
+    power_cycled = PowerCycleOutcome.FAILED
+    if power_cycle:
+        with _timed_step(POWER_CYCLE):
+            power_cycled = await _power_cycle_adapter(adapter)
+        if power_cycled is PowerCycleOutcome.REMOVED:
+            # The controller already left the bus, as a USB reset would have
+            # made it; wait for it to come back instead.
+            return await _await_removed_adapter(adapter, hci_name, mac)
+        # A silent adapter is USB reset after a successful power cycle as a
+        # matter of course, so that says nothing about the power cycle.
+        if power_cycled is PowerCycleOutcome.FAILED or not gone_silent:
+            plan.record(POWER_CYCLE, power_cycled is PowerCycleOutcome.SUCCEEDED)
+    power_cycle_ok = power_cycled is PowerCycleOutcome.SUCCEEDED
+    # If the adapter has not gone silent, a successful power cycle is enough.
+    # It is also as far as recovery can go when USB resets are disabled.
+    if power_cycle_ok and (not gone_silent or not usb_reset):
+        await _wait_for_dbus_registration("successful power cycle", hci_name, mac)
+        return True
+
+    # The adapter has gone silent (or the power cycle failed), so escalate to
+    # a USB reset. This may also move the adapter to a new hci number.
+    if not usb_reset or _budget_exhausted():
+        return False
+    with _timed_step(USB_RESET):
+        return await _escalate_to_usb_reset(
+            adapter, hci_name, mac, power_cycle_ok, plan
+        )
+
+
+async def _escalation_plan(hci_name: str, mac: str) -> EscalationPlan:
+    """Return the steps this recovery of the adapter skips, from its history."""
+    config = _config()
+    if not config.adaptive_escalation:
+        return NO_PLAN
+    loop = asyncio.get_running_loop()
+    keys: tuple[str, ...] = (mac,)
+    if usb_id := await loop.run_in_executor(None, _read_usb_id, hci_name):
+        keys = (mac, usb_id)
+    return _ESCALATION_HISTORY.plan(keys, config)
+
+
+def _read_usb_id(hci_name: str) -> str | None:
+    """Return the vendor:product ID of a USB adapter, or None for other ones."""
+    dev = BluetoothDevice(hci_name_to_number(hci_name))
+    try:
+        dev.setup()
+    except (NotAUSBDeviceError, OSError) as ex:
+        _LOGGER.debug("Could not read the USB ID of %s: %s", hci_name, ex)
+        return None
+    usb_device = dev.usb_device
+    if usb_device is None or not usb_device.vendor_id or not usb_device.product_id:
+        return None
+    return f"{usb_device.vendor_id}:{usb_device.product_id}"
+
+
+async def _escalate_to_usb_reset(
+    adapter: MGMTBluetoothCtl,
+    hci_name: str,
+    mac: str,
+    power_cycle_ok: bool,
+    plan: EscalationPlan = NO_PLAN,
+) -> bool:
+    """USB reset the adapter and wait for it to come back."""
+    with _watch_for_reappearance(adapter, mac) as watcher:
         usb_reset = await _usb_reset_adapter(adapter)
         if usb_reset is USBResetOutcome.NOT_APPLICABLE:
             # A USB reset is not applicable because the adapter is not a USB
@@ -614,26 +2287,109 @@ async def recover_adapter(hci: int, mac: str, gone_silent: bool = False) -> bool
                 "power cycle for recovery",
                 adapter.name,
             )
-            await asyncio.sleep(DBUS_REGISTER_TIME)
+            await _wait_for_dbus_registration("successful power cycle", hci_name, mac)
             return True
         if usb_reset is USBResetOutcome.FAILED:
+            plan.record(USB_RESET, False)
             return False
 
+        # We just did a USB reset which causes the adapter to disconnect and
+        # re-enumerate (and possibly move to a different hci number), so wait
+        # for it to reappear.
+        recovered = await _await_reappearance(
+            watcher, "successful USB reset", hci_name, mac
+        )
+    plan.record(USB_RESET, recovered)
+    return recovered
+
+
+async def _await_removed_adapter(
+    adapter: MGMTBluetoothCtl, hci_name: str, mac: str
+) -> bool:
+    """Wait for a controller removed during its power cycle to come back."""
+    with _timed_step("reappearance"), _watch_for_reappearance(adapter, mac) as watcher:
+        return await _await_reappearance(
+            watcher, "removal of the controller", hci_name, mac
+        )
+
+
+async def _await_reappearance(
+    watcher: _ReappearanceWatcher | None, after: str, hci_name: str, mac: str
+) -> bool:
+    """Wait for an adapter that left the bus to be back, after ``after``."""
+    config = _config()
+    lookup_attempts = config.post_reset_lookup_attempts
+    if watcher is None:
         # Give Dbus some time to catch up in case
         # the adapter is going to move to a new hci number.
+        await _wait_for_dbus_registration(after, hci_name, mac, reappearing=True)
+    else:
+        timeout = _budgeted(config.post_reset_index_added_timeout)
+        async with _work_slot_released():
+            idx = await watcher.wait(timeout)
+        if idx is not None:
+            hci_name = f"hci{idx}"
+        # The event (or the deadline passing) replaces the retry loop.
+        lookup_attempts = 1
+    return await _await_adapter_after_usb_reset(hci_name, mac, lookup_attempts)
+
+
+async def _wait_for_dbus_registration(
+    after: str, hci_name: str, mac: str, *, reappearing: bool = False
+) -> None:
+    """Give the kernel and BlueZ time to catch up after ``after``.
+
+    Other adapters of a bulk recovery may use this one's slot meanwhile.
+    """
+    with _timed_step("dbus_registration"):
+        async with _work_slot_released():
+            await _wait_for_bluez(after, hci_name, mac, reappearing=reappearing)
+
+
+async def _wait_for_bluez(
+    after: str, hci_name: str, mac: str, *, reappearing: bool
+) -> None:
+    """Wait for BlueZ to register the adapter.
+
+    With the readiness probe enabled this ends as soon as BlueZ exports the
+    adapter, powered unless it is ``reappearing`` after a USB reset. Without
+    a BlueZ daemon there is nothing to wait for, so it can also be skipped.
+    """
+    config = _config()
+    dbus_register_time = config.dbus_register_time
+    if config.skip_dbus_wait_without_bluez and not await bluez_running():
         _LOGGER.debug(
-            "Waiting %ss for kernel and Dbus to catch up after successful USB reset",
-            DBUS_REGISTER_TIME,
+            "No BlueZ daemon is running; not waiting for %s to register after %s",
+            hci_name,
+            after,
         )
-        await asyncio.sleep(DBUS_REGISTER_TIME)
-
-    # We just did a USB reset which causes the adapter to disconnect and
-    # re-enumerate (and possibly move to a different hci number), so wait for
-    # it to reappear.
-    return await _await_adapter_after_usb_reset(hci_name, mac)
+        return
+    if config.dbus_readiness_probe:
+        ready = await wait_for_adapter(
+            hci_name,
+            mac,
+            _budgeted(dbus_register_time),
+            reappearing=reappearing,
+        )
+        if ready is not None:
+            _LOGGER.debug(
+                "BlueZ %s adapter %s after %s",
+                "registered" if ready else "did not register",
+                hci_name,
+                after,
+            )
+            return
+    _LOGGER.debug(
+        "Waiting %ss for kernel and Dbus to catch up after %s",
+        dbus_register_time,
+        after,
+    )
+    await asyncio.sleep(_budgeted(dbus_register_time))
 
 
-async def _await_adapter_after_usb_reset(hci_name: str, mac: str) -> bool:
+async def _await_adapter_after_usb_reset(
+    hci_name: str, mac: str, attempts: int | None = None
+) -> bool:
     """Wait for an adapter to reappear after a USB reset.
 
     A USB reset disconnects the adapter and triggers a re-enumeration that may
@@ -643,9 +2399,15 @@ async def _await_adapter_after_usb_reset(hci_name: str, mac: str) -> bool:
     reporting failure after a single lookup.
 
     Returns True once the adapter is back (and rfkill, if newly blocked, was
-    cleared), or False if it never reappears or stays rfkill-blocked.
+    cleared), or False if it never reappears within ``attempts`` lookups or
+    stays rfkill-blocked.
     """
-    for attempt in range(1, POST_RESET_LOOKUP_ATTEMPTS + 1):
+    config = _config()
+    if attempts is None:
+        attempts = config.post_reset_lookup_attempts
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    for attempt in range(1, attempts + 1):
         async with _get_adapter(hci_name, mac) as adapter:
             if adapter and adapter.idx is not None and adapter.hci_name is not None:
                 if adapter.hci_name != hci_name:
@@ -656,27 +2418,34 @@ async def _await_adapter_after_usb_reset(hci_name: str, mac: str) -> bool:
 
                 # After the reset, rfkill may be blocked so we need
                 # to check and unblock it.
-                if not await _check_or_unblock_rfkill(adapter):
+                if config.unblock_rfkill and not await _check_or_unblock_rfkill(
+                    adapter
+                ):
                     _LOGGER.warning(
                         "rfkill has blocked %s, and could not be unblocked",
                         adapter.name,
                     )
                     return False
 
+                _found_at(hci_name)
+                _stage_completed(POST_RESET_LOOKUP, loop.time() - started)
                 return True
 
-        if attempt < POST_RESET_LOOKUP_ATTEMPTS:
-            _LOGGER.debug(
-                "Adapter with mac address %s (%s) has not reappeared after the "
-                "USB reset yet (attempt %s/%s); waiting %ss before retrying",
-                mac,
-                hci_name,
-                attempt,
-                POST_RESET_LOOKUP_ATTEMPTS,
-                POST_RESET_LOOKUP_RETRY_TIME,
-            )
-            await asyncio.sleep(POST_RESET_LOOKUP_RETRY_TIME)
+        if attempt == attempts or _budget_exhausted():
+            break
+        _LOGGER.debug(
+            "Adapter with mac address %s (%s) has not reappeared after the "
+            "USB reset yet (attempt %s/%s); waiting %ss before retrying",
+            mac,
+            hci_name,
+            attempt,
+            attempts,
+            config.post_reset_lookup_retry_time,
+        )
+        async with _work_slot_released():
+            await asyncio.sleep(_budgeted(config.post_reset_lookup_retry_time))
 
+    _stage_timed_out(POST_RESET_LOOKUP)
     _LOGGER.warning(
         "Could not find adapter with mac address %s or %s after USB reset",
         mac,
@@ -689,13 +2458,14 @@ async def _await_adapter_after_usb_reset(hci_name: str, mac: str) -> bool:
 async def _get_adapter(
     hci_name: str, mac: str
 ) -> AsyncIterator[MGMTBluetoothCtl | None]:
-    """Get the adapter."""
+    """Get the adapter using the pooled MGMT session."""
     name = f"{hci_name} [{mac}]"
     _LOGGER.debug("Attempting to power cycle bluetooth adapter %s", name)
     adapter = None
+    session = _acquire_session()
     try:
         adapter = MGMTBluetoothCtl(hci_name, mac, MGMT_PROTOCOL_TIMEOUT)
-        await adapter.setup()
+        await adapter.setup(session)
         _LOGGER.debug(
             "_get_adapter: %s (hci_name=%s) (mac=%s) (idx=%s)",
             name,
@@ -715,6 +2485,9 @@ async def _get_adapter(
             ex,
         )
         yield None
+    except ControllerRemovedError as ex:
+        _LOGGER.warning("Getting Bluetooth adapter %s failed: %s", name, ex)
+        yield None
     except asyncio.TimeoutError:
         # On Python 3.11+ asyncio.TimeoutError is an alias of the builtin
         # TimeoutError, which subclasses OSError, so this must precede the
@@ -730,12 +2503,22 @@ async def _get_adapter(
                 await adapter.close()
             except Exception as ex:  # noqa: BLE001
                 _LOGGER.warning("Closing Bluetooth adapter %s failed: %s", name, ex)
+        session.release()
 
 
-async def _power_cycle_adapter(adapter: MGMTBluetoothCtl) -> bool:
+async def _power_cycle_adapter(adapter: MGMTBluetoothCtl) -> PowerCycleOutcome:
     _LOGGER.debug("Attempting to power cycle bluetooth adapter %s", adapter.name)
     try:
-        return await _execute_reset(adapter)
+        reset = await _execute_reset(adapter)
+    except ControllerRemovedError as ex:
+        # Nothing left to power cycle, and no sysfs device left to USB reset;
+        # the caller waits for the adapter to come back.
+        _LOGGER.warning(
+            "Bluetooth adapter %s was removed while it was being reset: %s",
+            adapter.name,
+            ex,
+        )
+        return PowerCycleOutcome.REMOVED
     except btmgmt_socket.BluetoothSocketError as ex:
         _LOGGER.warning(
             "Bluetooth adapter %s could not be reset "
@@ -743,7 +2526,7 @@ async def _power_cycle_adapter(adapter: MGMTBluetoothCtl) -> bool:
             adapter.name,
             ex,
         )
-        return False
+        return PowerCycleOutcome.FAILED
     except asyncio.TimeoutError:
         # On Python 3.11+ asyncio.TimeoutError is an alias of the builtin
         # TimeoutError, which subclasses OSError, so this must precede the
@@ -753,10 +2536,11 @@ async def _power_cycle_adapter(adapter: MGMTBluetoothCtl) -> bool:
             adapter.name,
             adapter.timeout,
         )
-        return False
+        return PowerCycleOutcome.FAILED
     except OSError as ex:
         _LOGGER.warning("Bluetooth adapter %s could not be reset: %s", adapter.name, ex)
-        return False
+        return PowerCycleOutcome.FAILED
+    return PowerCycleOutcome.SUCCEEDED if reset else PowerCycleOutcome.FAILED
 
 
 def hci_name_to_number(hci_name: str) -> int:
@@ -826,10 +2610,10 @@ async def _bounce_adapter_interface(
         _LOGGER.debug("Bouncing Bluetooth adapter hci%i", idx)
         if down:
             await _set_adapter_up_down(adapter, sock, loop, HCIDEVDOWN, "down")
-            await asyncio.sleep(0.5)
+            await asyncio.sleep(_config().interface_bounce_time)
         if up:
             await _set_adapter_up_down(adapter, sock, loop, HCIDEVUP, "up")
-            await asyncio.sleep(0.5)
+            await asyncio.sleep(_config().interface_bounce_time)
         _LOGGER.debug("Finished bouncing hci%i", adapter.idx)
     finally:
         await loop.run_in_executor(None, raw_close, sock)
@@ -854,7 +2638,14 @@ async def _read_power_state_for_reset(
 ) -> PreResetPowerState:
     """Read the adapter power state before a reset."""
     try:
-        return PreResetPowerState(await adapter.get_powered(), timed_out=False)
+        return PreResetPowerState(
+            await adapter.get_powered(
+                cached_ok=_config().pre_reset_use_cached_power_state
+            ),
+            timed_out=False,
+        )
+    except ControllerRemovedError:
+        raise
     except AttributeError as ex:
         _LOGGER.warning(
             "Could not determine the power state of the Bluetooth adapter %s: %s",
@@ -868,6 +2659,12 @@ async def _read_power_state_for_reset(
             adapter.timeout,
         )
         return PreResetPowerState(None, timed_out=True)
+    except MGMTCommandError as ex:
+        _LOGGER.warning(
+            "Could not determine the power state of the Bluetooth adapter %s: %s",
+            adapter.name,
+            ex,
+        )
     except Exception:  # pylint: disable=broad-except
         # _LOGGER.exception already records the traceback, so no extra %s is needed.
         _LOGGER.exception(
@@ -903,27 +2700,30 @@ async def _bring_adapter_up(adapter: MGMTBluetoothCtl) -> bool:
 
 
 async def _execute_reset(adapter: MGMTBluetoothCtl) -> bool:
-    """Execute the reset."""
+    """Execute the reset.
+
+    Once the adapter may have been powered off or taken down, the reset is
+    finished even if the recovery is cancelled meanwhile, so a deadline never
+    leaves the adapter off; its waits are still cut short by the budget.
+    """
     pre_reset = await _read_power_state_for_reset(adapter)
-    power_state_before_reset = pre_reset.power_state
+    reset = asyncio.ensure_future(_reset_power_and_interface(adapter, pre_reset))
+    try:
+        return await asyncio.shield(reset)
+    except asyncio.CancelledError:
+        await asyncio.wait((reset,))
+        if not reset.cancelled():
+            # Retrieved so it is not logged; the cancellation wins.
+            reset.exception()
+        raise
 
-    # Do not attempt to power off if it timed out getting the power state
-    # as it likely means the adapter interface is frozen and will not respond to
-    # power off commands so we need to proceed to bounce the interface
-    if not pre_reset.timed_out:
-        try:
-            await _execute_power_off(adapter, power_state_before_reset)
-        except asyncio.TimeoutError:
-            _LOGGER.warning(
-                "Could not reset the power state of the Bluetooth adapter %s due to timeout after %s seconds",
-                adapter.name,
-                adapter.timeout,
-            )
-        except Exception:
-            _LOGGER.exception(
-                "Could not reset the power state of the Bluetooth adapter %s",
-                adapter.name,
-            )
+
+async def _reset_power_and_interface(
+    adapter: MGMTBluetoothCtl, pre_reset: PreResetPowerState
+) -> bool:
+    """Power the adapter off, bounce its interface and power it back on."""
+    power_state_before_reset = pre_reset.power_state
+    await _power_off_for_reset(adapter, pre_reset)
 
     try:
         await _bounce_adapter_interface(adapter, down=True, up=True)
@@ -934,6 +2734,8 @@ async def _execute_reset(adapter: MGMTBluetoothCtl) -> bool:
 
     try:
         power_on_ok = await _execute_power_on(adapter, power_state_before_reset)
+    except ControllerRemovedError:
+        raise
     except asyncio.TimeoutError:
         _LOGGER.warning(
             "Could not reset the power state of the Bluetooth adapter %s due to timeout after %s seconds",
@@ -941,6 +2743,13 @@ async def _execute_reset(adapter: MGMTBluetoothCtl) -> bool:
             adapter.timeout,
         )
         return False
+    except MGMTCommandError as ex:
+        _LOGGER.warning(
+            "Could not reset the power state of the Bluetooth adapter %s: %s",
+            adapter.name,
+            ex,
+        )
+        return False
     except Exception:
         _LOGGER.exception(
             "Could not reset the power state of the Bluetooth adapter %s", adapter.name
@@ -953,12 +2762,61 @@ async def _execute_reset(adapter: MGMTBluetoothCtl) -> bool:
     return await _bring_adapter_up(adapter)
 
 
+async def _power_off_for_reset(
+    adapter: MGMTBluetoothCtl, pre_reset: PreResetPowerState
+) -> None:
+    """Power the adapter off before its interface is bounced.
+
+    Failures are logged and the reset carries on; only the removal of the
+    controller is raised.
+    """
+    # Do not attempt to power off if it timed out getting the power state
+    # as it likely means the adapter interface is frozen and will not respond to
+    # power off commands so we need to proceed to bounce the interface
+    if pre_reset.timed_out:
+        return
+    # Without time to bounce the interface and power the adapter back on,
+    # leave it as it is rather than run the reset past the budget.
+    config = _config()
+    if not _budget_allows(
+        config.power_off_time + config.power_on_time + 2 * config.interface_bounce_time
+    ):
+        _LOGGER.debug(
+            "Not powering off %s: the recovery budget cannot cover powering it back on",
+            adapter.name,
+        )
+        return
+    try:
+        await _execute_power_off(adapter, pre_reset.power_state)
+    except ControllerRemovedError:
+        raise
+    except asyncio.TimeoutError:
+        _LOGGER.warning(
+            "Could not reset the power state of the Bluetooth adapter %s due to timeout after %s seconds",
+            adapter.name,
+            adapter.timeout,
+        )
+    except MGMTCommandError as ex:
+        _LOGGER.warning(
+            "Could not reset the power state of the Bluetooth adapter %s: %s",
+            adapter.name,
+            ex,
+        )
+    except Exception:
+        _LOGGER.exception(
+            "Could not reset the power state of the Bluetooth adapter %s",
+            adapter.name,
+        )
+
+
 async def _execute_power_on(
     adapter: MGMTBluetoothCtl, power_state_before_reset: bool | None
 ) -> bool:
     """Execute the power off."""
+    loop = asyncio.get_running_loop()
+    started = loop.time()
     try:
-        await adapter.set_powered(True)
+        accepted = await adapter.set_powered(True)
     except AttributeError as ex:
         _LOGGER.warning(
             "Could not re-enable power after cycle of the Bluetooth adapter %s: %s",
@@ -966,11 +2824,26 @@ async def _execute_power_on(
             ex,
         )
         return False
+    if not accepted:
+        # The kernel rejected the command, so the adapter will not power on.
+        _LOGGER.warning(
+            "Could not re-enable power after cycle of the Bluetooth adapter %s: "
+            "the command was rejected",
+            adapter.name,
+        )
+        return False
 
-    pstate_after = await adapter.wait_for_power_state(True, POWER_ON_TIME)
+    pstate_after = adapter.powered_after_set
+    if pstate_after is not True:
+        pstate_after = await adapter.wait_for_power_state(
+            True, _budgeted(_config().power_on_time)
+        )
+        if pstate_after is not True:
+            _stage_timed_out(POWER_ON)
 
     # Check the state after the reset
     if pstate_after is True:
+        _stage_completed(POWER_ON, loop.time() - started)
         if power_state_before_reset is False:
             _LOGGER.debug(
                 "Bluetooth adapter %s successfully turned back ON", adapter.name
@@ -1001,14 +2874,31 @@ async def _execute_power_off(
     """Execute the power off."""
     if power_state_before_reset is True:
         _LOGGER.debug("Current power state of bluetooth adapter is ON.")
+        loop = asyncio.get_running_loop()
+        started = loop.time()
         try:
-            await adapter.set_powered(False)
+            accepted = await adapter.set_powered(False)
         except AttributeError as ex:
             _LOGGER.warning(
                 "Could not power cycle the Bluetooth adapter %s: %s", adapter.name, ex
             )
             return False
-        await adapter.wait_for_power_state(False, POWER_OFF_TIME)
+        if not accepted:
+            _LOGGER.warning(
+                "Could not power off the Bluetooth adapter %s: "
+                "the command was rejected",
+                adapter.name,
+            )
+            return False
+        powered = adapter.powered_after_set
+        if powered is not False:
+            powered = await adapter.wait_for_power_state(
+                False, _budgeted(_config().power_off_time)
+            )
+        if powered is False:
+            _stage_completed(POWER_OFF, loop.time() - started)
+        else:
+            _stage_timed_out(POWER_OFF)
     elif power_state_before_reset is False:
         _LOGGER.debug(
             "Current power state of bluetooth adapter %s is OFF, trying to turn it back ON",
@@ -0,0 +1,161 @@
+"""Derive recovery timeouts from how long each adapter actually takes."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from dataclasses import replace
+import json
+import logging
+from pathlib import Path
+import threading
+from typing import TYPE_CHECKING, Any
+
+from .history import percentile
+
+if TYPE_CHECKING:
+    from .config import RecoveryConfig
+
+_LOGGER = logging.getLogger(__name__)
+
+TIMEOUT_TUNING_PATH = Path("/var/lib/bluetooth-auto-recovery/timeouts.json")
+# The latest TIMEOUT_TUNING_SAMPLES completion times of each stage are kept,
+# and a stage is tuned once it has TIMEOUT_TUNING_MIN_SAMPLES of them. Its
+# timeout is then the TIMEOUT_TUNING_PERCENTILE of those times, multiplied by
+# TIMEOUT_TUNING_MARGIN.
+TIMEOUT_TUNING_SAMPLES = 20
+TIMEOUT_TUNING_MIN_SAMPLES = 5
+TIMEOUT_TUNING_PERCENTILE = 95
+TIMEOUT_TUNING_MARGIN = 1.5
+
+POWER_OFF = "power_off"
+POWER_ON = "power_on"
+RFKILL_UNBLOCK = "rfkill_unblock"
+POST_RESET_LOOKUP = "post_reset_lookup"
+
+# The config field each stage tunes. The configured value is the ceiling, so
+# a tuned timeout is never longer than it would otherwise be.
+_TUNED_FIELDS = {
+    POWER_OFF: "power_off_time",
+    POWER_ON: "power_on_time",
+    RFKILL_UNBLOCK: "rfkill_unblock_grace_time",
+    POST_RESET_LOOKUP: "post_reset_lookup_retry_time",
+}
+# No stage is given less than this, however fast it has been. The rfkill floor
+# leaves room for one re-check at the default poll interval.
+TIMEOUT_TUNING_FLOORS = {
+    POWER_OFF: 0.5,
+    POWER_ON: 0.5,
+    RFKILL_UNBLOCK: 1.5,
+    POST_RESET_LOOKUP: 0.5,
+}
+
+_WRITE_LOCK = threading.Lock()
+
+
+class TimeoutTuner:
+    """Rolling completion times of each recovery stage, by mac address.
+
+    The times are read from TIMEOUT_TUNING_PATH on first use and written back
+    after every recovery that adds to them, so they survive restarts.
+    """
+
+    def __init__(self) -> None:
+        """Initialize a tuner that has not read its file yet."""
+        self._samples: dict[str, dict[str, deque[float]]] | None = None
+
+    async def tuned_config(self, mac: str, config: RecoveryConfig) -> RecoveryConfig:
+        """Return ``config`` with the stage timeouts tuned for ``mac``."""
+        samples = (await self._load()).get(mac, {})
+        changes: dict[str, Any] = {}
+        for stage, field in _TUNED_FIELDS.items():
+            times = samples.get(stage)
+            if not times or len(times) < TIMEOUT_TUNING_MIN_SAMPLES:
+                continue
+            timeout = percentile(list(times), TIMEOUT_TUNING_PERCENTILE)
+            timeout *= TIMEOUT_TUNING_MARGIN
+            if stage == POST_RESET_LOOKUP:
+                # The retry time is paid between lookups, so the adapter has
+                # that many of them to reappear in.
+                timeout /= max(1, config.post_reset_lookup_attempts - 1)
+            ceiling = getattr(config, field)
+            changes[field] = min(ceiling, max(TIMEOUT_TUNING_FLOORS[stage], timeout))
+        if not changes:
+            return config
+        _LOGGER.debug("Tuned the timeouts of %s: %s", mac, changes)
+        return replace(config, **changes)
+
+    async def observe(self, mac: str, completed: dict[str, float | None]) -> None:
+        """Add the completion times of a recovery's stages and save them.
+
+        A stage given as None ran into its timeout. Its times are dropped, so
+        it gets the configured timeout again until it has enough new ones.
+
+        Raises OSError if they cannot be saved.
+        """
+        samples = await self._load()
+        adapter = samples.setdefault(mac, {})
+        for stage, took in completed.items():
+            if took is None:
+                adapter.pop(stage, None)
+                continue
+            times = adapter.get(stage)
+            if times is None:
+                times = adapter[stage] = deque(maxlen=TIMEOUT_TUNING_SAMPLES)
+            times.append(round(took, 3))
+        data = json.dumps(
+            {
+                mac: {stage: list(times) for stage, times in stages.items()}
+                for mac, stages in samples.items()
+            },
+            separators=(",", ":"),
+        )
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, _write, TIMEOUT_TUNING_PATH, data)
+
+    async def _load(self) -> dict[str, dict[str, deque[float]]]:
+        if self._samples is None:
+            loop = asyncio.get_running_loop()
+            data = await loop.run_in_executor(None, _read, TIMEOUT_TUNING_PATH)
+            # Another recovery may have read the file meanwhile.
+            if self._samples is None:
+                self._samples = _parse(data)
+        return self._samples
+
+
+def _read(path: Path) -> Any:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as ex:
+        _LOGGER.warning("Could not read the tuned timeouts from %s: %s", path, ex)
+        return {}
+
+
+def _parse(data: Any) -> dict[str, dict[str, deque[float]]]:
+    """Keep the well-formed completion times of known stages."""
+    samples: dict[str, dict[str, deque[float]]] = {}
+    if not isinstance(data, dict):
+        return samples
+    for mac, stages in data.items():
+        if not isinstance(stages, dict):
+            continue
+        samples[mac] = {
+            stage: deque(
+                (float(took) for took in times if isinstance(took, int | float)),
+                maxlen=TIMEOUT_TUNING_SAMPLES,
+            )
+            for stage, times in stages.items()
+            if stage in _TUNED_FIELDS and isinstance(times, list)
+        }
+    return samples
+
+
+def _write(path: Path, data: str) -> None:
+    """Replace the file at ``path`` with ``data`` in one step."""
+    with _WRITE_LOCK:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = path.with_name(f"{path.name}.tmp")
+        temporary.write_text(data, encoding="utf-8")
+        temporary.replace(path)
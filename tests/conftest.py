@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from contextlib import asynccontextmanager
+import struct
 from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, MagicMock
 
@@ -36,3 +37,24 @@ async def adapter_cm(
 ) -> AsyncIterator[MGMTBluetoothCtl | None]:
     """Yield a value as an async context manager (stand-in for _get_adapter)."""
     yield value
+
+
+def mgmt_event(event_code: int, idx: int, params: bytes = b"") -> bytes:
+    """Build a raw MGMT event as the kernel writes it to the control socket."""
+    return struct.pack("<HHH", event_code, idx, len(params)) + params
+
+
+def cmd_complete(opcode: int, idx: int, status: int = 0, params: bytes = b"") -> bytes:
+    """Build a raw MGMT Command Complete event."""
+    return mgmt_event(0x0001, idx, struct.pack("<HB", opcode, status) + params)
+
+
+def cmd_status(opcode: int, idx: int, status: int) -> bytes:
+    """Build a raw MGMT Command Status event."""
+    return mgmt_event(0x0002, idx, struct.pack("<HB", opcode, status))
+
+
+def controller_info(address: str, settings: int = 0) -> bytes:
+    """Build Read Controller Information reply parameters."""
+    bdaddr = bytes(int(part, 16) for part in reversed(address.split(":")))
+    return bdaddr + struct.pack("<BHII", 9, 2, 0xFFFF, settings) + bytes(3 + 249 + 11)
@@ -0,0 +1,199 @@
+"""Tests for the BlueZ readiness probe, against a private D-Bus daemon."""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+import shutil
+import subprocess
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock, patch
+
+from dbus_fast import BusType
+from dbus_fast.aio import MessageBus
+
+# Needed at runtime: dbus-fast reads the D-Bus signature from the annotations.
+from dbus_fast.annotations import DBusBool, DBusStr  # noqa: TC002
+from dbus_fast.service import PropertyAccess, ServiceInterface, dbus_property
+import pytest
+
+from bluetooth_auto_recovery import bluez
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterator
+
+MAC = "AA:BB:CC:DD:EE:FF"
+
+
+class FakeAdapter(ServiceInterface):
+    """An org.bluez.Adapter1 object."""
+
+    def __init__(self, address: str, powered: bool) -> None:
+        super().__init__(bluez.ADAPTER_INTERFACE)
+        self._address = address
+        self._powered = powered
+
+    @dbus_property(access=PropertyAccess.READ)
+    def Address(self) -> DBusStr:  # noqa: N802
+        return self._address
+
+    @dbus_property(access=PropertyAccess.READ)
+    def Powered(self) -> DBusBool:  # noqa: N802
+        return self._powered
+
+    def set_powered(self, powered: bool) -> None:
+        self._powered = powered
+        self.emit_properties_changed({"Powered": powered})
+
+
+@pytest.fixture
+def bus_address() -> Iterator[str]:
+    if (daemon := shutil.which("dbus-daemon")) is None:
+        pytest.skip("dbus-daemon is not installed")
+    process = subprocess.Popen(  # noqa: S603
+        [daemon, "--session", "--nofork", "--print-address"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+    )
+    assert process.stdout is not None
+    address = process.stdout.readline().strip()
+    yield address
+    process.terminate()
+    process.wait()
+    process.stdout.close()
+
+
+@asynccontextmanager
+async def _bluez(address: str) -> AsyncIterator[MessageBus]:
+    bus = await MessageBus(bus_address=address, bus_type=BusType.SESSION).connect()
+    await bus.request_name(bluez.BLUEZ_SERVICE)
+    try:
+        yield bus
+    finally:
+        bus.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_adapter_already_exported(bus_address: str) -> None:
+    async with _bluez(bus_address) as bus:
+        bus.export("/org/bluez/hci0", FakeAdapter(MAC, powered=True))
+        assert await bluez.wait_for_adapter("hci0", MAC, 5, bus_address=bus_address)
+
+
+@pytest.mark.asyncio
+async def test_adapter_powered_later(bus_address: str) -> None:
+    async with _bluez(bus_address) as bus:
+        adapter = FakeAdapter(MAC, powered=False)
+        bus.export("/org/bluez/hci0", adapter)
+        wait = asyncio.create_task(
+            bluez.wait_for_adapter("hci0", MAC, 5, bus_address=bus_address)
+        )
+        await asyncio.sleep(0.2)
+        assert not wait.done()
+        adapter.set_powered(True)
+        assert await wait
+
+
+@pytest.mark.asyncio
+async def test_reappearing_adapter_matched_by_address(bus_address: str) -> None:
+    async with _bluez(bus_address) as bus:
+        # A stale object for the old index does not count.
+        bus.export("/org/bluez/hci0", FakeAdapter(MAC, powered=True))
+        wait = asyncio.create_task(
+            bluez.wait_for_adapter(
+                "hci0", MAC, 5, reappearing=True, bus_address=bus_address
+            )
+        )
+        await asyncio.sleep(0.2)
+        assert not wait.done()
+        bus.export("/org/bluez/hci1", FakeAdapter(MAC.lower(), powered=False))
+        assert await wait
+
+
+@pytest.mark.asyncio
+async def test_other_adapter_times_out(bus_address: str) -> None:
+    async with _bluez(bus_address) as bus:
+        bus.export("/org/bluez/hci1", FakeAdapter("11:22:33:44:55:66", powered=True))
+        assert (
+            await bluez.wait_for_adapter("hci0", MAC, 0.3, bus_address=bus_address)
+            is False
+        )
+
+
+@pytest.mark.asyncio
+async def test_no_bluez_on_bus_times_out(bus_address: str) -> None:
+    assert (
+        await bluez.wait_for_adapter("hci0", MAC, 0.3, bus_address=bus_address) is False
+    )
+
+
+@pytest.mark.asyncio
+async def test_unreachable_bus() -> None:
+    assert (
+        await bluez.wait_for_adapter(
+            "hci0", MAC, 1, bus_address="unix:path=/nonexistent/bus"
+        )
+        is None
+    )
+
+
+@pytest.mark.asyncio
+async def test_bluez_running_when_name_is_owned(bus_address: str) -> None:
+    async with _bluez(bus_address):
+        with patch.dict(bluez._BLUEZ_PRESENCE, clear=True):
+            assert await bluez.bluez_running(bus_address=bus_address) is True
+
+
+@pytest.mark.asyncio
+async def test_bluez_not_running_is_cached(bus_address: str) -> None:
+    with patch.dict(bluez._BLUEZ_PRESENCE, clear=True):
+        assert await bluez.bluez_running(bus_address=bus_address) is False
+        async with _bluez(bus_address):
+            # Still the cached answer until it expires.
+            assert await bluez.bluez_running(bus_address=bus_address) is False
+            with patch.object(bluez, "BLUEZ_PRESENCE_CACHE_TIME", 0):
+                assert await bluez.bluez_running(bus_address=bus_address) is True
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("process_running", [True, False])
+async def test_bluez_running_without_a_bus_looks_for_the_process(
+    process_running: bool,
+) -> None:
+    with (
+        patch.dict(bluez._BLUEZ_PRESENCE, clear=True),
+        patch.object(
+            bluez, "_bluetoothd_process_running", return_value=process_running
+        ),
+    ):
+        assert (
+            await bluez.bluez_running(bus_address="unix:path=/nonexistent/bus")
+            is process_running
+        )
+
+
+@pytest.mark.asyncio
+async def test_bluez_running_when_the_check_times_out() -> None:
+    async def _never_answers(_bus_address: str | None) -> bool:
+        await asyncio.Event().wait()
+        return False
+
+    with (
+        patch.dict(bluez._BLUEZ_PRESENCE, clear=True),
+        patch.object(bluez, "BLUEZ_PRESENCE_TIMEOUT", 0.05),
+        patch.object(bluez, "_bluez_name_owned", _never_answers),
+    ):
+        assert await bluez.bluez_running() is True
+
+
+def test_bluetoothd_process_running() -> None:
+    comm = MagicMock()
+    comm.read_text.return_value = "bluetoothd\n"
+    unreadable = MagicMock()
+    unreadable.read_text.side_effect = OSError
+    with patch.object(bluez, "Path") as path:
+        path.return_value.glob.return_value = [unreadable, comm]
+        assert bluez._bluetoothd_process_running() is True
+        path.return_value.glob.return_value = [unreadable]
+        assert bluez._bluetoothd_process_running() is False
@@ -0,0 +1,76 @@
+"""Tests for the MGMT socket filters."""
+
+from __future__ import annotations
+
+import socket
+import struct
+from typing import TYPE_CHECKING
+
+import pytest
+
+from bluetooth_auto_recovery.bpf import attach_filter, detach_filter, mgmt_event_filter
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+COMMAND_COMPLETE = 0x0001
+INDEX_ADDED = 0x0004
+NEW_SETTINGS = 0x0006
+DEVICE_FOUND = 0x0012
+
+
+@pytest.fixture
+def pair() -> Iterator[tuple[socket.socket, socket.socket]]:
+    sender, receiver = socket.socketpair(socket.AF_UNIX, socket.SOCK_DGRAM)
+    receiver.setblocking(False)
+    yield sender, receiver
+    sender.close()
+    receiver.close()
+
+
+def _deliver(
+    pair: tuple[socket.socket, socket.socket], frames: list[tuple[int, int]]
+) -> list[tuple[int, int]]:
+    """Send MGMT headers through the pair and return those that arrive."""
+    sender, receiver = pair
+    for event_code, idx in frames:
+        sender.send(struct.pack("<HHH", event_code, idx, 2) + b"\x00\x00")
+    received: list[tuple[int, int]] = []
+    while True:
+        try:
+            data = receiver.recv(64)
+        except BlockingIOError:
+            return received
+        received.append(struct.unpack_from("<HH", data))
+
+
+def test_event_filter_admits_listed_events_for_any_controller(
+    pair: tuple[socket.socket, socket.socket],
+) -> None:
+    attach_filter(pair[1], mgmt_event_filter({COMMAND_COMPLETE, NEW_SETTINGS}))
+    frames = [
+        (DEVICE_FOUND, 0),
+        (NEW_SETTINGS, 0),
+        (NEW_SETTINGS, 3),
+        (INDEX_ADDED, 1),
+        (COMMAND_COMPLETE, 0xFFFF),
+        (0x0100, 0),
+    ]
+    assert _deliver(pair, frames) == [
+        (NEW_SETTINGS, 0),
+        (NEW_SETTINGS, 3),
+        (COMMAND_COMPLETE, 0xFFFF),
+    ]
+
+
+def test_attach_replaces_and_detach_removes_filter(
+    pair: tuple[socket.socket, socket.socket],
+) -> None:
+    attach_filter(pair[1], mgmt_event_filter({NEW_SETTINGS}))
+    attach_filter(pair[1], mgmt_event_filter({DEVICE_FOUND}))
+    assert _deliver(pair, [(NEW_SETTINGS, 0), (DEVICE_FOUND, 0)]) == [(DEVICE_FOUND, 0)]
+    detach_filter(pair[1])
+    assert _deliver(pair, [(NEW_SETTINGS, 0), (DEVICE_FOUND, 0)]) == [
+        (NEW_SETTINGS, 0),
+        (DEVICE_FOUND, 0),
+    ]
@@ -0,0 +1,69 @@
+"""Tests for the recovery circuit breaker."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from bluetooth_auto_recovery import breaker
+from bluetooth_auto_recovery.breaker import CircuitBreaker
+from bluetooth_auto_recovery.config import RecoveryConfig
+
+MAC = "AA:BB:CC:DD:EE:FF"
+CONFIG = RecoveryConfig(
+    circuit_breaker=True,
+    circuit_breaker_failures=2,
+    circuit_breaker_cooldown=10,
+    circuit_breaker_max_cooldown=25,
+)
+
+
+def test_cooldown_starts_after_enough_failures() -> None:
+    circuit = CircuitBreaker()
+    with patch.object(breaker, "monotonic", return_value=100):
+        circuit.record_failure(0, MAC, CONFIG)
+        assert circuit.cooldown_remaining(0, MAC) == 0
+        circuit.record_failure(0, MAC, CONFIG)
+        assert circuit.cooldown_remaining(0, MAC) == 10
+        assert circuit.cooldown_remaining(0, "11:22:33:44:55:66") == 0
+    with patch.object(breaker, "monotonic", return_value=104):
+        assert circuit.cooldown_remaining(0, MAC) == 6
+    with patch.object(breaker, "monotonic", return_value=110):
+        assert circuit.cooldown_remaining(0, MAC) == 0
+
+
+@pytest.mark.parametrize(
+    ("failures", "cooldown"), [(2, 10), (3, 20), (4, 25), (5000, 25)]
+)
+def test_cooldown_doubles_up_to_the_maximum(failures: int, cooldown: float) -> None:
+    circuit = CircuitBreaker()
+    with patch.object(breaker, "monotonic", return_value=0):
+        for _ in range(failures):
+            circuit.record_failure(0, MAC, CONFIG)
+        assert circuit.cooldown_remaining(0, MAC) == cooldown
+
+
+def test_reset_ends_the_cooldown() -> None:
+    circuit = CircuitBreaker()
+    for _ in range(3):
+        circuit.record_failure(0, MAC, CONFIG)
+    assert circuit.cooldown_remaining(0, MAC) > 0
+    circuit.reset(MAC)
+    assert circuit.cooldown_remaining(0, MAC) == 0
+    circuit.record_failure(0, MAC, CONFIG)
+    assert circuit.cooldown_remaining(0, MAC) == 0
+    circuit.reset(MAC)
+    circuit.reset(MAC)
+
+
+def test_adapter_under_another_hci_is_forgotten() -> None:
+    circuit = CircuitBreaker()
+    for _ in range(3):
+        circuit.record_failure(0, MAC, CONFIG)
+    assert circuit.cooldown_remaining(1, MAC) == 0
+    assert circuit.cooldown_remaining(0, MAC) == 0
+    circuit.record_failure(0, MAC, CONFIG)
+    # A failure under a new hci number starts counting afresh.
+    circuit.record_failure(1, MAC, CONFIG)
+    assert circuit.cooldown_remaining(1, MAC) == 0
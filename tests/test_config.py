@@ -0,0 +1,62 @@
+"""Tests for the recovery config."""
+
+from __future__ import annotations
+
+import dataclasses
+from typing import Any
+
+import pytest
+
+from bluetooth_auto_recovery import recover
+from bluetooth_auto_recovery.config import (
+    DEFAULT_CONFIG,
+    FAST_CONFIG,
+    PRESETS,
+    SLOW_CONFIG,
+    RecoveryConfig,
+)
+
+
+def test_defaults_match_module_constants() -> None:
+    assert recover._config() == DEFAULT_CONFIG
+
+
+def test_config_is_frozen() -> None:
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        DEFAULT_CONFIG.power_on_time = 1  # type: ignore[misc]
+
+
+@pytest.mark.parametrize("name", ["power_on_time", "dbus_register_time"])
+def test_negative_times_are_rejected(name: str) -> None:
+    changes: dict[str, Any] = {name: -1}
+    with pytest.raises(ValueError, match=name):
+        RecoveryConfig(**changes)
+
+
+def test_lookup_attempts_must_be_positive() -> None:
+    with pytest.raises(ValueError, match="post_reset_lookup_attempts"):
+        RecoveryConfig(post_reset_lookup_attempts=0)
+
+
+def test_presets() -> None:
+    assert PRESETS == {
+        "default": DEFAULT_CONFIG,
+        "fast": FAST_CONFIG,
+        "slow": SLOW_CONFIG,
+    }
+    assert FAST_CONFIG.dbus_register_time < DEFAULT_CONFIG.dbus_register_time
+    assert SLOW_CONFIG.dbus_register_time > DEFAULT_CONFIG.dbus_register_time
+    assert (
+        SLOW_CONFIG.post_reset_lookup_attempts
+        > DEFAULT_CONFIG.post_reset_lookup_attempts
+    )
+
+
+def test_circuit_breaker_failures_must_be_positive() -> None:
+    with pytest.raises(ValueError, match="circuit_breaker_failures"):
+        RecoveryConfig(circuit_breaker_failures=0)
+
+
+def test_adaptive_escalation_min_success_rate_is_a_rate() -> None:
+    with pytest.raises(ValueError, match="adaptive_escalation_min_success_rate"):
+        RecoveryConfig(adaptive_escalation_min_success_rate=1.5)
@@ -0,0 +1,81 @@
+"""Tests for the adaptive escalation history."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from bluetooth_auto_recovery import escalation
+from bluetooth_auto_recovery.config import RecoveryConfig
+from bluetooth_auto_recovery.escalation import (
+    NO_PLAN,
+    POWER_CYCLE,
+    USB_RESET,
+    EscalationHistory,
+)
+
+MAC = "AA:BB:CC:DD:EE:FF"
+USB_ID = "0a12:0001"
+CONFIG = RecoveryConfig(adaptive_escalation=True)
+
+
+def _history(
+    key: str, power_cycle: list[bool], usb_reset: list[bool]
+) -> EscalationHistory:
+    history = EscalationHistory()
+    for succeeded in power_cycle:
+        history.record((key,), POWER_CYCLE, succeeded)
+    for succeeded in usb_reset:
+        history.record((key,), USB_RESET, succeeded)
+    return history
+
+
+@pytest.mark.parametrize(
+    ("power_cycle", "usb_reset", "skipped"),
+    [
+        ([False] * 3, [True] * 3, {POWER_CYCLE}),
+        ([True] * 3, [False] * 3, {USB_RESET}),
+        ([False] * 3, [False] * 3, set()),
+        ([True] * 3, [True] * 3, set()),
+        # Not enough results to judge the USB reset yet.
+        ([False] * 3, [True] * 2, set()),
+        ([False, False, False, True], [True] * 3, set()),
+    ],
+)
+def test_poor_step_is_skipped(
+    power_cycle: list[bool], usb_reset: list[bool], skipped: set[str]
+) -> None:
+    history = _history(MAC, power_cycle, usb_reset)
+    plan = history.plan((MAC,), CONFIG)
+    assert plan.skipped == skipped
+    assert plan.runs(POWER_CYCLE) is (POWER_CYCLE not in skipped)
+
+
+def test_usb_id_history_is_used_until_the_mac_has_enough() -> None:
+    history = _history(USB_ID, [False] * 3, [True] * 3)
+    assert history.plan((MAC, USB_ID), CONFIG).skipped == {POWER_CYCLE}
+    plan = history.plan((MAC, USB_ID), CONFIG)
+    for _ in range(3):
+        plan.record(POWER_CYCLE, True)
+    assert history.plan((MAC, USB_ID), CONFIG).skipped == set()
+    assert history.plan(("11:22:33:44:55:66",), CONFIG).skipped == set()
+
+
+def test_only_the_latest_results_count() -> None:
+    with patch.object(escalation, "ESCALATION_HISTORY_SIZE", 3):
+        history = _history(MAC, [True] * 5 + [False] * 3, [True] * 3)
+    assert history.plan((MAC,), CONFIG).skipped == {POWER_CYCLE}
+
+
+def test_skipped_step_is_retried_now_and_then() -> None:
+    history = _history(MAC, [False] * 3, [True] * 3)
+    with patch.object(escalation, "ESCALATION_RETRY_INTERVAL", 3):
+        runs = [history.plan((MAC,), CONFIG).runs(POWER_CYCLE) for _ in range(6)]
+    assert runs == [False, False, True, False, False, True]
+
+
+def test_no_plan_skips_and_records_nothing() -> None:
+    assert NO_PLAN.runs(POWER_CYCLE)
+    assert NO_PLAN.runs(USB_RESET)
+    NO_PLAN.record(POWER_CYCLE, False)
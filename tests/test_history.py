@@ -0,0 +1,119 @@
+"""Tests for the recovery history file."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+from bluetooth_auto_recovery import history
+from bluetooth_auto_recovery.history import (
+    RecoveryRecord,
+    RecoveryTimes,
+    append_record,
+    percentile,
+    read_records,
+    recovery_times,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+MAC = "AA:BB:CC:DD:EE:FF"
+
+
+def _record(
+    duration: float, outcome: str = "SUCCEEDED", mac: str = MAC
+) -> RecoveryRecord:
+    return RecoveryRecord(
+        mac=mac,
+        hci=0,
+        outcome=outcome,
+        duration=duration,
+        steps={"rfkill": 0.0123456, "power_cycle": duration},
+        finished=1700000000.5,
+    )
+
+
+@pytest.mark.asyncio
+async def test_records_round_trip(tmp_path: Path) -> None:
+    path = tmp_path / "lib" / "history.jsonl"
+    await append_record(_record(5.25), path)
+    await append_record(_record(1, "FAILED"), path)
+    assert path.read_text().splitlines()[0] == (
+        '{"mac":"AA:BB:CC:DD:EE:FF","hci":0,"outcome":"SUCCEEDED",'
+        '"duration":5.25,"steps":{"rfkill":0.012,"power_cycle":5.25},'
+        '"finished":1700000000.5}'
+    )
+    records = list(read_records(path))
+    assert [record.outcome for record in records] == ["SUCCEEDED", "FAILED"]
+    assert list(records[0].steps) == ["rfkill", "power_cycle"]
+
+
+@pytest.mark.asyncio
+async def test_default_path(tmp_path: Path) -> None:
+    with patch.object(history, "RECOVERY_HISTORY_PATH", tmp_path / "history.jsonl"):
+        await append_record(_record(1))
+        assert len(list(read_records())) == 1
+
+
+def test_unparsable_lines_are_skipped(tmp_path: Path) -> None:
+    path = tmp_path / "history.jsonl"
+    path.write_text(
+        "\n".join(
+            [
+                _record(1).to_json(),
+                "[]",
+                '{"mac": "AA:BB:CC:DD:EE:FF"}',
+                '{"mac":"AA:BB:CC:DD:EE:FF","hci":0,"outcome":"SUCC',
+            ]
+        )
+    )
+    assert [record.duration for record in read_records(path)] == [1]
+
+
+@pytest.mark.parametrize("backups", [0, 1, 2])
+def test_rotation(tmp_path: Path, backups: int) -> None:
+    path = tmp_path / "history.jsonl"
+    line_size = len(_record(1).to_json()) + 1
+    with (
+        patch.object(history, "RECOVERY_HISTORY_MAX_BYTES", 2 * line_size),
+        patch.object(history, "RECOVERY_HISTORY_BACKUPS", backups),
+    ):
+        for duration in range(1, 8):
+            history._append(path, _record(duration).to_json())
+        durations = [record.duration for record in read_records(path)]
+    # Two records per file; the newest file holds the seventh.
+    assert durations == list(range(7 - 2 * backups, 8))
+    assert sorted(file.name for file in tmp_path.iterdir()) == [
+        "history.jsonl",
+        *(f"history.jsonl.{number}" for number in range(1, backups + 1)),
+    ]
+
+
+def test_recovery_times(tmp_path: Path) -> None:
+    path = tmp_path / "history.jsonl"
+    path.write_text(
+        "".join(
+            f"{record.to_json()}\n"
+            for record in (
+                *(_record(duration) for duration in range(20, 0, -1)),
+                _record(100, "FAILED"),
+                _record(3, mac="11:22:33:44:55:66"),
+            )
+        )
+    )
+    assert recovery_times(path) == {
+        MAC: RecoveryTimes(count=20, p50=10, p95=19),
+        "11:22:33:44:55:66": RecoveryTimes(count=1, p50=3, p95=3),
+    }
+    assert recovery_times(tmp_path / "missing.jsonl") == {}
+
+
+def test_percentile() -> None:
+    assert percentile([3, 1, 2], 50) == 2
+    assert percentile([3, 1, 2], 95) == 3
+    assert percentile([3, 1, 2], 0) == 1
+    with pytest.raises(ValueError, match="no values"):
+        percentile([], 50)
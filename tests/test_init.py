@@ -8,6 +8,7 @@ from bluetooth_auto_recovery import recover
 # Capture the package-level wrapper before any test rebinds the name on the
 # package module (test_recover_adapter rebinds it).
 _RECOVER_ADAPTER_WRAPPER = bluetooth_auto_recovery.recover_adapter
+_RECOVER_ADAPTERS_WRAPPER = bluetooth_auto_recovery.recover_adapters
 
 
 def test_init():
@@ -46,4 +47,29 @@ async def test_recover_adapter_uses_cached_module():
             bluetooth_auto_recovery._MODULE_CACHE[key] = prev
 
     assert result is True
-    mock_module.recover_adapter.assert_awaited_once_with(1, "AA:BB:CC:DD:EE:FF", True)
+    mock_module.recover_adapter.assert_awaited_once_with(
+        1, "AA:BB:CC:DD:EE:FF", True, budget=None, config=None
+    )
+
+
+@pytest.mark.asyncio
+async def test_recover_adapters_uses_cached_module():
+    """The bulk wrapper forwards to the cached recover module."""
+    key = f"{bluetooth_auto_recovery.__name__}.recover"
+    mock_module = MagicMock()
+    mock_module.recover_adapters = AsyncMock(return_value={})
+
+    prev = bluetooth_auto_recovery._MODULE_CACHE.get(key)
+    bluetooth_auto_recovery._MODULE_CACHE[key] = mock_module
+    try:
+        result = await _RECOVER_ADAPTERS_WRAPPER([(0, "AA:BB:CC:DD:EE:FF", False)])
+    finally:
+        if prev is None:
+            bluetooth_auto_recovery._MODULE_CACHE.pop(key, None)
+        else:
+            bluetooth_auto_recovery._MODULE_CACHE[key] = prev
+
+    assert result == {}
+    mock_module.recover_adapters.assert_awaited_once_with(
+        [(0, "AA:BB:CC:DD:EE:FF", False)], concurrency=None, budget=None, config=None
+    )
@@ -0,0 +1,79 @@
+"""Tests for the cross-process adapter lock."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+from bluetooth_auto_recovery import lock
+from bluetooth_auto_recovery.lock import AdapterLock
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+MAC = "aa:bb:cc:dd:ee:ff"
+
+
+def test_lock_path(tmp_path: Path) -> None:
+    assert AdapterLock(MAC, tmp_path).path == tmp_path / "AABBCCDDEEFF.lock"
+    with patch.object(lock, "ADAPTER_LOCK_DIR", tmp_path / "run"):
+        assert AdapterLock(MAC).path == tmp_path / "run" / "AABBCCDDEEFF.lock"
+
+
+@pytest.mark.asyncio
+async def test_uncontended_lock_has_no_outcome(tmp_path: Path) -> None:
+    holder = AdapterLock(MAC, tmp_path / "locks")
+    assert await holder.acquire(1)
+    await holder.release("SUCCEEDED")
+
+    # An outcome recorded before this holder started waiting is stale.
+    holder = AdapterLock(MAC, tmp_path / "locks")
+    assert await holder.acquire(1)
+    assert await holder.outcome_since_acquire() is None
+    await holder.release()
+
+
+@pytest.mark.asyncio
+async def test_waiter_sees_outcome_of_holder(tmp_path: Path) -> None:
+    holder = AdapterLock(MAC, tmp_path)
+    waiter = AdapterLock(MAC, tmp_path)
+    assert await holder.acquire(1)
+    with patch.object(lock, "ADAPTER_LOCK_POLL_INTERVAL", 0.01):
+        acquiring = asyncio.create_task(waiter.acquire(1))
+        await asyncio.sleep(0.05)
+        assert not acquiring.done()
+        await holder.release("SUCCEEDED")
+        assert await acquiring
+    assert await waiter.outcome_since_acquire() == "SUCCEEDED"
+    await waiter.release()
+
+
+@pytest.mark.asyncio
+async def test_acquire_times_out(tmp_path: Path) -> None:
+    holder = AdapterLock(MAC, tmp_path)
+    assert await holder.acquire(1)
+    with patch.object(lock, "ADAPTER_LOCK_POLL_INTERVAL", 0.01):
+        assert await AdapterLock(MAC, tmp_path).acquire(0.05) is False
+    await holder.release()
+    assert await AdapterLock(MAC, tmp_path).acquire(0.05)
+
+
+@pytest.mark.asyncio
+async def test_garbled_record_is_ignored(tmp_path: Path) -> None:
+    (tmp_path / "AABBCCDDEEFF.lock").write_text("not json")
+    holder = AdapterLock(MAC, tmp_path)
+    assert await holder.outcome_since_acquire() is None
+    assert await holder.acquire(1)
+    assert await holder.outcome_since_acquire() is None
+    await holder.release()
+    await holder.release()
+
+
+@pytest.mark.asyncio
+async def test_unwritable_lock_dir(tmp_path: Path) -> None:
+    (tmp_path / "file").write_text("")
+    with pytest.raises(OSError):  # noqa: PT011
+        await AdapterLock(MAC, tmp_path / "file").acquire(1)
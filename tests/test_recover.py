@@ -3,18 +3,26 @@
 from __future__ import annotations
 
 import asyncio
+from contextlib import contextmanager
+from dataclasses import replace
 import errno
+import itertools
 import logging
+import threading
 import time
-from typing import cast
+from typing import TYPE_CHECKING, cast
 from unittest.mock import AsyncMock, MagicMock, call, patch
 
 import pytest
 
-from bluetooth_auto_recovery import recover
+from bluetooth_auto_recovery import history, lock, recover, tuning
+from bluetooth_auto_recovery.breaker import CircuitBreaker
+from bluetooth_auto_recovery.escalation import NO_PLAN, EscalationHistory
+from bluetooth_auto_recovery.lock import AdapterLock
 from bluetooth_auto_recovery.recover import (
     BluetoothMGMTProtocol,
     MGMTBluetoothCtl,
+    RecoveryConfig,
     RFKillInfo,
     hci_name_to_number,
     raw_close,
@@ -23,7 +31,26 @@ from bluetooth_auto_recovery.recover import (
     rfkill_unblock,
 )
 
-from .conftest import adapter_cm, make_send_response
+from .conftest import (
+    adapter_cm,
+    cmd_complete,
+    cmd_status,
+    controller_info,
+    make_send_response,
+    mgmt_event,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from btsocket import btmgmt_protocol
+
+_BUSY = recover.MGMTCommandError(
+    recover.btmgmt_protocol.Commands.SetPowered,
+    0,
+    recover.btmgmt_protocol.ErrorCodes.Busy,
+)
 
 # ---------------------------------------------------------------------------
 # Pure helpers
@@ -194,6 +221,32 @@ async def test_set_powered_success(adapter: MGMTBluetoothCtl) -> None:
     assert await adapter.set_powered(True) is True
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("powered", [True, False])
+async def test_set_powered_records_reply_settings(
+    adapter: MGMTBluetoothCtl, powered: bool
+) -> None:
+    response = make_send_response(status=0x00)
+    response.cmd_response_frame.current_settings = {
+        recover.btmgmt_protocol.SupportedSettings.Powered: powered
+    }
+    cast("AsyncMock", adapter.protocol).send.return_value = response
+    assert await adapter.set_powered(powered) is True
+    assert adapter.powered_after_set is powered
+
+
+@pytest.mark.asyncio
+async def test_set_powered_failure_clears_reply_settings(
+    adapter: MGMTBluetoothCtl,
+) -> None:
+    adapter.powered_after_set = True
+    cast("AsyncMock", adapter.protocol).send.return_value = make_send_response(
+        status=0x01
+    )
+    assert await adapter.set_powered(True) is False
+    assert adapter.powered_after_set is None
+
+
 @pytest.mark.asyncio
 async def test_set_powered_failure(adapter: MGMTBluetoothCtl) -> None:
     cast("AsyncMock", adapter.protocol).send.return_value = make_send_response(
@@ -203,16 +256,167 @@ async def test_set_powered_failure(adapter: MGMTBluetoothCtl) -> None:
 
 
 @pytest.mark.asyncio
-async def test_wait_for_power_state_reaches_target(adapter: MGMTBluetoothCtl) -> None:
-    with patch.object(adapter, "get_powered", AsyncMock(return_value=True)):
-        assert await adapter.wait_for_power_state(True, 1) is True
+async def test_set_powered_command_status_error(adapter: MGMTBluetoothCtl) -> None:
+    cast("AsyncMock", adapter.protocol).send.side_effect = _BUSY
+    assert await adapter.set_powered(True) is False
+
+
+@pytest.mark.asyncio
+async def test_wait_for_power_state_reaches_target() -> None:
+    ctl = _event_adapter()
+    with patch.object(ctl, "get_powered", AsyncMock(return_value=True)):
+        assert await ctl.wait_for_power_state(True, 1) is True
 
 
 @pytest.mark.asyncio
-async def test_wait_for_power_state_times_out(adapter: MGMTBluetoothCtl) -> None:
-    with patch.object(adapter, "get_powered", AsyncMock(return_value=False)):
+async def test_wait_for_power_state_times_out() -> None:
+    ctl = _event_adapter()
+    with patch.object(ctl, "get_powered", AsyncMock(return_value=False)):
         # Never reaches True -> returns last observed state on timeout.
-        assert await adapter.wait_for_power_state(True, 0.05) is False
+        assert await ctl.wait_for_power_state(True, 0.05) is False
+
+
+def _event_adapter() -> MGMTBluetoothCtl:
+    """Return a resolved adapter backed by a real protocol that delivers events."""
+    ctl = MGMTBluetoothCtl("hci0", "AA:BB:CC:DD:EE:FF", 5)
+    ctl.idx = 0
+    ctl.hci_name = "hci0"
+    ctl.mac = "AA:BB:CC:DD:EE:FF"
+    ctl.protocol = _make_protocol()
+    return ctl
+
+
+def _new_settings(idx: int, powered: bool) -> bytes:
+    return mgmt_event(0x0006, idx, int(powered).to_bytes(4, "little"))
+
+
+@pytest.mark.asyncio
+async def test_wait_for_power_state_resolves_on_new_settings_event() -> None:
+    ctl = _event_adapter()
+    get_powered = AsyncMock(return_value=False)
+    with patch.object(ctl, "get_powered", get_powered):
+        task = asyncio.ensure_future(ctl.wait_for_power_state(True, 5))
+        await asyncio.sleep(0)
+        assert not task.done()
+        # Settings of another controller do not count.
+        cast("BluetoothMGMTProtocol", ctl.protocol).data_received(
+            _new_settings(1, True)
+        )
+        await asyncio.sleep(0)
+        assert not task.done()
+        cast("BluetoothMGMTProtocol", ctl.protocol).data_received(
+            _new_settings(0, True)
+        )
+        assert await task is True
+    # One read to cover a change that raced the subscription; no polling.
+    get_powered.assert_awaited_once()
+    assert not any(cast("BluetoothMGMTProtocol", ctl.protocol).listeners.values())
+
+
+@pytest.mark.asyncio
+async def test_wait_for_power_state_fails_fast_on_index_removed() -> None:
+    ctl = _event_adapter()
+    proto = cast("BluetoothMGMTProtocol", ctl.protocol)
+    with patch.object(ctl, "get_powered", AsyncMock(return_value=False)):
+        task = asyncio.ensure_future(ctl.wait_for_power_state(True, 5))
+        await asyncio.sleep(0)
+        proto.data_received(mgmt_event(0x0005, 1))
+        await asyncio.sleep(0)
+        assert not task.done()
+        proto.data_received(mgmt_event(0x0005, 0))
+        with pytest.raises(recover.ControllerRemovedError) as exc_info:
+            await task
+    assert exc_info.value.controller_idx == 0
+    assert not any(proto.listeners.values())
+
+
+@pytest.mark.asyncio
+async def test_wait_for_power_state_event_already_reached() -> None:
+    ctl = _event_adapter()
+    with patch.object(ctl, "get_powered", AsyncMock(return_value=False)):
+        assert await ctl.wait_for_power_state(False, 5) is False
+
+
+@pytest.mark.asyncio
+async def test_wait_for_power_state_event_times_out() -> None:
+    ctl = _event_adapter()
+    with patch.object(ctl, "get_powered", AsyncMock(return_value=False)):
+        task = asyncio.ensure_future(ctl.wait_for_power_state(True, 0.05))
+        await asyncio.sleep(0)
+        # A New Settings event that keeps the adapter off does not resolve it.
+        cast("BluetoothMGMTProtocol", ctl.protocol).data_received(
+            _new_settings(0, False)
+        )
+        assert await task is False
+
+
+@pytest.mark.asyncio
+async def test_wait_for_power_state_rereads_without_an_event() -> None:
+    ctl = _event_adapter()
+    # The change was made on this socket, so no New Settings event arrives.
+    get_powered = AsyncMock(side_effect=[False, False, True])
+    with (
+        patch.object(ctl, "get_powered", get_powered),
+        patch.object(recover, "POWER_STATE_POLL_INTERVAL", 0.01),
+    ):
+        assert await ctl.wait_for_power_state(True, 5) is True
+    assert get_powered.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_wait_for_power_state_timeout_returns_latest_reading() -> None:
+    ctl = _event_adapter()
+    # Powered on, but not on time; the value from the last re-read is returned.
+    get_powered = AsyncMock(
+        side_effect=itertools.chain([False], itertools.repeat(None))
+    )
+    with (
+        patch.object(ctl, "get_powered", get_powered),
+        patch.object(recover, "POWER_STATE_POLL_INTERVAL", 0.01),
+    ):
+        assert await ctl.wait_for_power_state(True, 0.05) is None
+
+
+@pytest.mark.asyncio
+async def test_protocol_subscribe_and_unsubscribe() -> None:
+    proto = _make_protocol()
+    listener = MagicMock()
+    unsubscribe = proto.subscribe(
+        recover.btmgmt_protocol.Events.NewSettingsEvent, listener
+    )
+    proto.data_received(_new_settings(2, True))
+    idx, event_frame = listener.call_args.args
+    assert idx == 2
+    assert (
+        event_frame.current_settings[recover.btmgmt_protocol.SupportedSettings.Powered]
+        is True
+    )
+    unsubscribe()
+    unsubscribe()
+    proto.data_received(_new_settings(2, False))
+    listener.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_protocol_dispatches_index_events() -> None:
+    proto = _make_protocol()
+    added = MagicMock()
+    removed = MagicMock()
+    proto.subscribe(recover.btmgmt_protocol.Events.IndexAddedEvent, added)
+    proto.subscribe(recover.btmgmt_protocol.Events.IndexRemovedEvent, removed)
+    proto.data_received(mgmt_event(0x0004, 3))
+    proto.data_received(mgmt_event(0x0005, 1))
+    added.assert_called_once_with(3, None)
+    removed.assert_called_once_with(1, None)
+
+
+@pytest.mark.asyncio
+async def test_protocol_ignores_truncated_frames() -> None:
+    proto = _make_protocol()
+    listener = MagicMock()
+    proto.subscribe(recover.btmgmt_protocol.Events.IndexAddedEvent, listener)
+    proto.data_received(b"\x04\x00")
+    listener.assert_not_called()
 
 
 # ---------------------------------------------------------------------------
@@ -220,24 +424,113 @@ async def test_wait_for_power_state_times_out(adapter: MGMTBluetoothCtl) -> None
 # ---------------------------------------------------------------------------
 
 
+_INVALID_INDEX = recover.btmgmt_protocol.ErrorCodes.InvalidIndex
+
+
 def _ctl() -> MGMTBluetoothCtl:
     ctl = MGMTBluetoothCtl("hci0", "AA:BB:CC:DD:EE:FF", 5)
     ctl.protocol = AsyncMock()
     return ctl
 
 
+async def _never_replies(*_args: object) -> MagicMock:
+    """Stand in for an MGMT request that is never answered."""
+    await asyncio.get_running_loop().create_future()
+    raise AssertionError  # pragma: no cover
+
+
+def _index_list(*idxs: int, status: int = 0x00) -> MagicMock:
+    idx_response = MagicMock()
+    idx_response.event_frame.status.value = status
+    idx_response.cmd_response_frame.num_controllers = len(idxs)
+    setattr(idx_response.cmd_response_frame, "controller_index[i]", list(idxs))
+    return idx_response
+
+
+def _mgmt_send(
+    index_list: object, controllers: dict[int, object] | None = None
+) -> AsyncMock:
+    """Answer MGMT requests by command and controller index.
+
+    ``controllers`` maps an index to its address, an exception to raise or
+    ``_never_replies``; unlisted indexes fail with Invalid Index.
+    """
+    controllers = controllers or {}
+
+    async def send(command: str, idx: int | None) -> object:
+        if command == "ReadControllerIndexList":
+            reply = index_list
+        else:
+            assert idx is not None
+            reply = controllers.get(
+                idx,
+                recover.MGMTCommandError(
+                    recover.btmgmt_protocol.Commands.ReadControllerInformation,
+                    idx,
+                    _INVALID_INDEX,
+                ),
+            )
+        if reply is _never_replies:
+            return await _never_replies()
+        if isinstance(reply, BaseException):
+            raise reply
+        if isinstance(reply, str):
+            info_response = make_send_response()
+            info_response.cmd_response_frame.address = reply
+            info_response.cmd_response_frame.current_settings = {}
+            return info_response
+        return reply
+
+    return AsyncMock(side_effect=send)
+
+
+@pytest.mark.asyncio
+async def test_find_controller_probe_hit_skips_enumeration() -> None:
+    ctl = _ctl()
+    send = _mgmt_send(_never_replies, {0: "aa:bb:cc:dd:ee:ff"})
+    cast("AsyncMock", ctl.protocol).send = send
+    hci = MagicMock()
+    with patch.object(recover, "get_adapters_from_hci", hci):
+        await ctl._find_controller()
+    assert (ctl.idx, ctl.hci_name, ctl.mac) == (0, "hci0", "AA:BB:CC:DD:EE:FF")
+    send.assert_awaited_once_with("ReadControllerInformation", 0)
+    hci.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "probe",
+    [
+        "99:99:99:99:99:99",
+        asyncio.TimeoutError(),
+        None,  # Invalid Index
+        make_send_response(status=0x11),
+    ],
+    ids=["moved", "timeout", "invalid-index", "error-status"],
+)
+async def test_find_controller_probe_miss_enumerates(probe: object) -> None:
+    ctl = _ctl()
+    controllers: dict[int, object] = {5: "aa:bb:cc:dd:ee:ff"}
+    if probe is not None:
+        controllers[0] = probe
+    cast("AsyncMock", ctl.protocol).send = _mgmt_send(_index_list(0, 5), controllers)
+    with patch.object(recover, "get_adapters_from_hci", return_value={}):
+        await ctl._find_controller()
+    assert ctl.idx == 5
+
+
 @pytest.mark.asyncio
 async def test_find_controller_match_by_mac_from_hci() -> None:
     ctl = _ctl()
     adapters = {
-        "hci0": {"dev_id": 0, "name": "hci0", "bdaddr": "AA:BB:CC:DD:EE:FF"},
+        "hci1": {"dev_id": 1, "name": "hci1", "bdaddr": "AA:BB:CC:DD:EE:FF"},
     }
+    cast("AsyncMock", ctl.protocol).send = _mgmt_send(_never_replies)
     with patch.object(recover, "get_adapters_from_hci", return_value=adapters):
         await ctl._find_controller()
-    assert ctl.idx == 0
-    assert ctl.hci_name == "hci0"
+    assert ctl.idx == 1
+    assert ctl.hci_name == "hci1"
     assert ctl.mac == "AA:BB:CC:DD:EE:FF"
-    cast("AsyncMock", ctl.protocol).send.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -246,6 +539,7 @@ async def test_find_controller_match_by_name_from_hci() -> None:
     adapters = {
         "hci0": {"dev_id": 3, "name": "hci0", "bdaddr": "11:22:33:44:55:66"},
     }
+    cast("AsyncMock", ctl.protocol).send = _mgmt_send(_index_list())
     with patch.object(recover, "get_adapters_from_hci", return_value=adapters):
         await ctl._find_controller()
     # MAC did not match, but the hci name did.
@@ -257,16 +551,8 @@ async def test_find_controller_match_by_name_from_hci() -> None:
 @pytest.mark.asyncio
 async def test_find_controller_match_by_mac_via_controller_info() -> None:
     ctl = _ctl()
-    idx_response = MagicMock()
-    idx_response.event_frame.status.value = 0x00
-    idx_response.cmd_response_frame.num_controllers = 1
-    setattr(idx_response.cmd_response_frame, "controller_index[i]", [5])
-
-    info_response = MagicMock()
-    info_response.cmd_response_frame.address = "aa:bb:cc:dd:ee:ff"
-
-    cast("AsyncMock", ctl.protocol).send = AsyncMock(
-        side_effect=[idx_response, info_response]
+    cast("AsyncMock", ctl.protocol).send = _mgmt_send(
+        _index_list(5), {5: "aa:bb:cc:dd:ee:ff"}
     )
     with patch.object(recover, "get_adapters_from_hci", return_value={}):
         await ctl._find_controller()
@@ -278,17 +564,9 @@ async def test_find_controller_match_by_mac_via_controller_info() -> None:
 @pytest.mark.asyncio
 async def test_find_controller_fallback_by_hci_number() -> None:
     ctl = _ctl()
-    idx_response = MagicMock()
-    idx_response.event_frame.status.value = 0x00
-    idx_response.cmd_response_frame.num_controllers = 1
-    setattr(idx_response.cmd_response_frame, "controller_index[i]", [0])
-
-    info_response = MagicMock()
     # MAC differs from expected, so it falls back to matching by hci number 0.
-    info_response.cmd_response_frame.address = "99:99:99:99:99:99"
-
-    cast("AsyncMock", ctl.protocol).send = AsyncMock(
-        side_effect=[idx_response, info_response]
+    cast("AsyncMock", ctl.protocol).send = _mgmt_send(
+        _index_list(0), {0: "99:99:99:99:99:99"}
     )
     with patch.object(recover, "get_adapters_from_hci", return_value={}):
         await ctl._find_controller()
@@ -300,21 +578,38 @@ async def test_find_controller_fallback_by_hci_number() -> None:
 @pytest.mark.asyncio
 async def test_find_controller_index_list_error_status() -> None:
     ctl = _ctl()
-    idx_response = MagicMock()
-    idx_response.event_frame.status.value = 0x01  # non-success
-    cast("AsyncMock", ctl.protocol).send = AsyncMock(return_value=idx_response)
+    cast("AsyncMock", ctl.protocol).send = _mgmt_send(_index_list(status=0x01))
+    with patch.object(recover, "get_adapters_from_hci", return_value={}):
+        await ctl._find_controller()
+    assert ctl.idx is None
+
+
+@pytest.mark.asyncio
+async def test_find_controller_index_list_command_status_error() -> None:
+    ctl = _ctl()
+    cast("AsyncMock", ctl.protocol).send = _mgmt_send(_BUSY)
     with patch.object(recover, "get_adapters_from_hci", return_value={}):
         await ctl._find_controller()
     assert ctl.idx is None
 
 
+@pytest.mark.asyncio
+async def test_find_controller_skips_rejected_index() -> None:
+    ctl = _ctl()
+    # Index 3 vanished between listing and reading (Invalid Index).
+    cast("AsyncMock", ctl.protocol).send = _mgmt_send(
+        _index_list(3, 5), {5: "aa:bb:cc:dd:ee:ff"}
+    )
+    with patch.object(recover, "get_adapters_from_hci", return_value={}):
+        await ctl._find_controller()
+    assert ctl.idx == 5
+    assert 3 not in ctl.presented_list
+
+
 @pytest.mark.asyncio
 async def test_find_controller_no_controllers() -> None:
     ctl = _ctl()
-    idx_response = MagicMock()
-    idx_response.event_frame.status.value = 0x00
-    idx_response.cmd_response_frame.num_controllers = 0
-    cast("AsyncMock", ctl.protocol).send = AsyncMock(return_value=idx_response)
+    cast("AsyncMock", ctl.protocol).send = _mgmt_send(_index_list())
     with patch.object(recover, "get_adapters_from_hci", return_value={}):
         await ctl._find_controller()
     assert ctl.idx is None
@@ -330,33 +625,82 @@ async def test_find_controller_hci_adapters_present_but_no_match() -> None:
         "hci1": {"dev_id": 1, "name": "hci1", "bdaddr": "11:11:11:11:11:11"},
         "hci2": {"dev_id": 2, "name": "hci2", "bdaddr": "22:22:22:22:22:22"},
     }
-    idx_response = MagicMock()
-    idx_response.event_frame.status.value = 0x00
-    idx_response.cmd_response_frame.num_controllers = 0
-    cast("AsyncMock", ctl.protocol).send = AsyncMock(return_value=idx_response)
+    send = _mgmt_send(_index_list())
+    cast("AsyncMock", ctl.protocol).send = send
     with patch.object(recover, "get_adapters_from_hci", return_value=adapters):
         await ctl._find_controller()
     assert ctl.idx is None
-    cast("AsyncMock", ctl.protocol).send.assert_awaited_once_with(
-        "ReadControllerIndexList", None
+    assert send.await_args_list == [
+        call("ReadControllerInformation", 0),
+        call("ReadControllerIndexList", None),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_find_controller_mgmt_match_does_not_wait_for_hci() -> None:
+    ctl = _ctl()
+    cast("AsyncMock", ctl.protocol).send = _mgmt_send(
+        _index_list(5), {5: "aa:bb:cc:dd:ee:ff"}
     )
+    release = threading.Event()
+
+    def blocked_hci() -> dict[int, dict[str, object]]:
+        release.wait(5)
+        return {}
+
+    try:
+        with patch.object(recover, "get_adapters_from_hci", blocked_hci):
+            await asyncio.wait_for(ctl._find_controller(), 1)
+    finally:
+        release.set()
+    assert ctl.idx == 5
 
 
 @pytest.mark.asyncio
-async def test_find_controller_no_fallback_when_hci_number_absent() -> None:
+async def test_find_controller_queries_indexes_concurrently() -> None:
     ctl = _ctl()
-    idx_response = MagicMock()
-    idx_response.event_frame.status.value = 0x00
-    idx_response.cmd_response_frame.num_controllers = 1
-    setattr(idx_response.cmd_response_frame, "controller_index[i]", [5])
+    # Phantom indexes never answer; the match on 7 must not wait for them.
+    send = _mgmt_send(
+        _index_list(1, 2, 7),
+        {1: _never_replies, 2: _never_replies, 7: "aa:bb:cc:dd:ee:ff"},
+    )
+    cast("AsyncMock", ctl.protocol).send = send
+    with patch.object(recover, "get_adapters_from_hci", return_value={}):
+        await asyncio.wait_for(ctl._find_controller(), 1)
+    assert ctl.idx == 7
+    assert [args.args[1] for args in send.await_args_list] == [0, None, 1, 2, 7]
+
+
+@pytest.mark.asyncio
+async def test_find_controller_hci_name_match_ignores_scan_error() -> None:
+    ctl = _ctl()
+    adapters = {
+        "hci0": {"dev_id": 0, "name": "hci0", "bdaddr": "11:22:33:44:55:66"},
+    }
+    cast("AsyncMock", ctl.protocol).send = _mgmt_send(asyncio.TimeoutError())
+    with patch.object(recover, "get_adapters_from_hci", return_value=adapters):
+        await ctl._find_controller()
+    assert ctl.idx == 0
+
+
+@pytest.mark.asyncio
+async def test_find_controller_scan_error_without_hci_match() -> None:
+    ctl = _ctl()
+    cast("AsyncMock", ctl.protocol).send = _mgmt_send(asyncio.TimeoutError())
+    with (
+        patch.object(recover, "get_adapters_from_hci", return_value={}),
+        pytest.raises(asyncio.TimeoutError),
+    ):
+        await ctl._find_controller()
+
 
-    info_response = MagicMock()
+@pytest.mark.asyncio
+async def test_find_controller_no_fallback_when_hci_number_absent() -> None:
+    ctl = _ctl()
     # MAC differs and the only presented controller is index 5, while the
     # expected hci name resolves to index 0 — so the hci-number fallback misses.
-    info_response.cmd_response_frame.address = "99:99:99:99:99:99"
-
-    cast("AsyncMock", ctl.protocol).send = AsyncMock(
-        side_effect=[idx_response, info_response]
+    cast("AsyncMock", ctl.protocol).send = _mgmt_send(
+        _index_list(5), {5: "99:99:99:99:99:99"}
     )
     with patch.object(recover, "get_adapters_from_hci", return_value={}):
         await ctl._find_controller()
@@ -497,11 +841,20 @@ async def test_check_or_unblock_soft_block_clears_on_later_attempt(
 # _power_cycle_adapter
 # ---------------------------------------------------------------------------
 
+_CYCLED = recover.PowerCycleOutcome.SUCCEEDED
+_NOT_CYCLED = recover.PowerCycleOutcome.FAILED
+
 
 @pytest.mark.asyncio
 async def test_power_cycle_success(adapter: MGMTBluetoothCtl) -> None:
     with patch.object(recover, "_execute_reset", AsyncMock(return_value=True)):
-        assert await recover._power_cycle_adapter(adapter) is True
+        assert await recover._power_cycle_adapter(adapter) is _CYCLED
+
+
+@pytest.mark.asyncio
+async def test_power_cycle_failure(adapter: MGMTBluetoothCtl) -> None:
+    with patch.object(recover, "_execute_reset", AsyncMock(return_value=False)):
+        assert await recover._power_cycle_adapter(adapter) is _NOT_CYCLED
 
 
 @pytest.mark.asyncio
@@ -517,7 +870,26 @@ async def test_power_cycle_handles_errors(
     adapter: MGMTBluetoothCtl, exc: Exception
 ) -> None:
     with patch.object(recover, "_execute_reset", AsyncMock(side_effect=exc)):
-        assert await recover._power_cycle_adapter(adapter) is False
+        assert await recover._power_cycle_adapter(adapter) is _NOT_CYCLED
+
+
+@pytest.mark.asyncio
+async def test_power_cycle_controller_removed(
+    adapter: MGMTBluetoothCtl, caplog: pytest.LogCaptureFixture
+) -> None:
+    with (
+        patch.object(
+            recover,
+            "_execute_reset",
+            AsyncMock(side_effect=recover.ControllerRemovedError(0)),
+        ),
+        caplog.at_level(logging.WARNING),
+    ):
+        assert (
+            await recover._power_cycle_adapter(adapter)
+            is recover.PowerCycleOutcome.REMOVED
+        )
+    assert "was removed while it was being reset" in caplog.text
 
 
 @pytest.mark.asyncio
@@ -530,7 +902,7 @@ async def test_power_cycle_timeout_logs_timeout_message(
         ),
         caplog.at_level(logging.WARNING),
     ):
-        assert await recover._power_cycle_adapter(adapter) is False
+        assert await recover._power_cycle_adapter(adapter) is _NOT_CYCLED
     assert "due to timeout" in caplog.text
 
 
@@ -604,6 +976,26 @@ async def test_execute_power_on_success(adapter: MGMTBluetoothCtl) -> None:
         )
 
 
+@pytest.mark.asyncio
+async def test_execute_power_on_uses_set_powered_reply(
+    adapter: MGMTBluetoothCtl,
+) -> None:
+    async def set_powered(new_state: bool) -> bool:
+        adapter.powered_after_set = new_state
+        return True
+
+    wait = AsyncMock()
+    with (
+        patch.object(adapter, "set_powered", side_effect=set_powered),
+        patch.object(adapter, "wait_for_power_state", wait),
+    ):
+        assert (
+            await recover._execute_power_on(adapter, power_state_before_reset=False)
+            is True
+        )
+    wait.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_execute_power_on_was_already_on(adapter: MGMTBluetoothCtl) -> None:
     # power_state_before_reset is True: takes the "is ON after power cycle" branch.
@@ -654,6 +1046,20 @@ async def test_execute_power_on_set_powered_attribute_error(
         )
 
 
+@pytest.mark.asyncio
+async def test_execute_power_on_rejected_skips_wait(adapter: MGMTBluetoothCtl) -> None:
+    wait = AsyncMock(return_value=True)
+    with (
+        patch.object(adapter, "set_powered", AsyncMock(return_value=False)),
+        patch.object(adapter, "wait_for_power_state", wait),
+    ):
+        assert (
+            await recover._execute_power_on(adapter, power_state_before_reset=True)
+            is False
+        )
+    wait.assert_not_called()
+
+
 # ---------------------------------------------------------------------------
 # _execute_power_off
 # ---------------------------------------------------------------------------
@@ -673,6 +1079,42 @@ async def test_execute_power_off_when_on(adapter: MGMTBluetoothCtl) -> None:
     set_powered.assert_awaited_once_with(False)
 
 
+@pytest.mark.asyncio
+async def test_execute_power_off_uses_set_powered_reply(
+    adapter: MGMTBluetoothCtl,
+) -> None:
+    async def set_powered(new_state: bool) -> bool:
+        adapter.powered_after_set = new_state
+        return True
+
+    wait = AsyncMock()
+    with (
+        patch.object(adapter, "set_powered", side_effect=set_powered),
+        patch.object(adapter, "wait_for_power_state", wait),
+    ):
+        assert (
+            await recover._execute_power_off(adapter, power_state_before_reset=True)
+            is True
+        )
+    wait.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_execute_power_off_rejected_skips_wait(
+    adapter: MGMTBluetoothCtl,
+) -> None:
+    wait = AsyncMock(return_value=False)
+    with (
+        patch.object(adapter, "set_powered", AsyncMock(return_value=False)),
+        patch.object(adapter, "wait_for_power_state", wait),
+    ):
+        assert (
+            await recover._execute_power_off(adapter, power_state_before_reset=True)
+            is False
+        )
+    wait.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_execute_power_off_when_off(adapter: MGMTBluetoothCtl) -> None:
     set_powered = AsyncMock()
@@ -874,7 +1316,9 @@ async def test_execute_reset_final_bounce_unexpected_error(
 
 
 @pytest.mark.asyncio
-@pytest.mark.parametrize("exc", [AttributeError("gone"), RuntimeError("unexpected")])
+@pytest.mark.parametrize(
+    "exc", [AttributeError("gone"), _BUSY, RuntimeError("unexpected")]
+)
 async def test_execute_reset_get_powered_error_continues(
     adapter: MGMTBluetoothCtl, exc: Exception
 ) -> None:
@@ -892,7 +1336,7 @@ async def test_execute_reset_get_powered_error_continues(
 
 
 @pytest.mark.asyncio
-@pytest.mark.parametrize("exc", [asyncio.TimeoutError(), RuntimeError("boom")])
+@pytest.mark.parametrize("exc", [asyncio.TimeoutError(), _BUSY, RuntimeError("boom")])
 async def test_execute_reset_power_off_error_is_swallowed(
     adapter: MGMTBluetoothCtl, exc: Exception
 ) -> None:
@@ -906,6 +1350,66 @@ async def test_execute_reset_power_off_error_is_swallowed(
         assert await recover._execute_reset(adapter) is True
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("step", ["get_powered", "power_off", "power_on"])
+async def test_execute_reset_controller_removed_aborts(
+    adapter: MGMTBluetoothCtl, step: str
+) -> None:
+    removed = recover.ControllerRemovedError(0)
+    bounce = AsyncMock()
+    with (
+        patch.object(
+            adapter,
+            "get_powered",
+            AsyncMock(side_effect=removed if step == "get_powered" else None),
+        ),
+        patch.object(
+            recover,
+            "_execute_power_off",
+            AsyncMock(side_effect=removed if step == "power_off" else None),
+        ),
+        patch.object(recover, "_bounce_adapter_interface", bounce),
+        patch.object(
+            recover,
+            "_execute_power_on",
+            AsyncMock(side_effect=removed if step == "power_on" else None),
+        ),
+        pytest.raises(recover.ControllerRemovedError),
+    ):
+        await recover._execute_reset(adapter)
+    assert bounce.called is (step == "power_on")
+
+
+@pytest.mark.asyncio
+async def test_execute_reset_finishes_when_cancelled_with_the_adapter_down(
+    adapter: MGMTBluetoothCtl,
+) -> None:
+    taken_down = asyncio.Event()
+    calls: list[str] = []
+
+    async def bounce(_adapter: MGMTBluetoothCtl, *, down: bool, up: bool) -> None:
+        calls.append("down" if down else "up")
+        if down:
+            taken_down.set()
+            await asyncio.sleep(0.05)
+
+    power_on = AsyncMock(return_value=True)
+    with (
+        patch.object(adapter, "get_powered", AsyncMock(return_value=True)),
+        patch.object(recover, "_execute_power_off", AsyncMock(return_value=True)),
+        patch.object(recover, "_bounce_adapter_interface", bounce),
+        patch.object(recover, "_execute_power_on", power_on),
+    ):
+        task = asyncio.ensure_future(recover._execute_reset(adapter))
+        await taken_down.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+    # The deadline did not leave the adapter down and off.
+    assert calls == ["down", "up"]
+    power_on.assert_awaited_once_with(adapter, True)
+
+
 @pytest.mark.asyncio
 async def test_execute_reset_first_bounce_error_is_swallowed(
     adapter: MGMTBluetoothCtl,
@@ -925,7 +1429,7 @@ async def test_execute_reset_first_bounce_error_is_swallowed(
 
 
 @pytest.mark.asyncio
-@pytest.mark.parametrize("exc", [asyncio.TimeoutError(), RuntimeError("boom")])
+@pytest.mark.parametrize("exc", [asyncio.TimeoutError(), _BUSY, RuntimeError("boom")])
 async def test_execute_reset_power_on_error_fails(
     adapter: MGMTBluetoothCtl, exc: Exception
 ) -> None:
@@ -998,6 +1502,7 @@ async def test_get_adapter_yields_none_when_idx_missing() -> None:
     "exc",
     [
         recover.btmgmt_socket.BluetoothSocketError("no socket"),
+        recover.ControllerRemovedError(0),
         OSError("io"),
         asyncio.TimeoutError(),
     ],
@@ -1070,29 +1575,158 @@ async def test_protocol_connection_made_resolves_future() -> None:
     assert proto.connection_mode_future.done()
 
 
+async def _pending(
+    proto: BluetoothMGMTProtocol, *args: object
+) -> asyncio.Task[btmgmt_protocol.Response]:
+    """Start a send and let it register its waiter."""
+    task = asyncio.ensure_future(proto.send(*args))
+    await asyncio.sleep(0)
+    return task
+
+
 @pytest.mark.asyncio
 async def test_protocol_data_received_resolves_future() -> None:
     proto = _make_protocol()
-    loop = asyncio.get_running_loop()
-    proto.future = loop.create_future()
-    response = MagicMock()
-    response.cmd_response_frame = MagicMock()
-    with patch.object(recover.btmgmt_protocol, "reader", return_value=response):
-        proto.data_received(b"payload")
-    assert proto.future.result() is response
+    proto.transport = MagicMock()
+    task = await _pending(proto, "SetPowered", 0, 1)
+    proto.data_received(cmd_complete(0x0005, 0, params=b"\x01\x00\x00\x00"))
+    response = await task
+    assert response.event_frame.status.value == 0x00
+    assert (
+        response.cmd_response_frame.current_settings[
+            recover.btmgmt_protocol.SupportedSettings.Powered
+        ]
+        is True
+    )
+    assert proto.requests == {}
 
 
 @pytest.mark.asyncio
 async def test_protocol_data_received_ignores_value_error() -> None:
     proto = _make_protocol()
-    loop = asyncio.get_running_loop()
-    proto.future = loop.create_future()
+    proto.transport = MagicMock()
+    task = await _pending(proto, "SetPowered", 0, 1)
     with patch.object(
         recover.btmgmt_protocol, "reader", side_effect=ValueError("bad event")
     ):
-        proto.data_received(b"payload")
+        proto.data_received(cmd_complete(0x0005, 0, params=b"\x01\x00\x00\x00"))
     # Malformed event must not crash or resolve the pending future.
-    assert not proto.future.done()
+    assert not task.done()
+    task.cancel()
+
+
+@pytest.mark.asyncio
+async def test_protocol_routes_replies_by_opcode_and_index() -> None:
+    proto = _make_protocol()
+    proto.transport = MagicMock()
+    first = await _pending(proto, "ReadControllerInformation", 0)
+    second = await _pending(proto, "ReadControllerInformation", 1)
+    power = await _pending(proto, "SetPowered", 1, 1)
+    # Replies arrive out of order and back to back before any waiter runs.
+    proto.data_received(cmd_complete(0x0005, 1, params=b"\x01\x00\x00\x00"))
+    proto.data_received(
+        cmd_complete(0x0004, 1, params=controller_info("11:22:33:44:55:66"))
+    )
+    proto.data_received(
+        cmd_complete(0x0004, 0, params=controller_info("AA:BB:CC:DD:EE:FF"))
+    )
+    assert (await first).cmd_response_frame.address == "AA:BB:CC:DD:EE:FF"
+    assert (await second).cmd_response_frame.address == "11:22:33:44:55:66"
+    assert (await power).header.controller_idx == 1
+    assert proto.requests == {}
+
+
+@pytest.mark.asyncio
+async def test_protocol_resolves_same_key_in_order() -> None:
+    proto = _make_protocol()
+    proto.transport = MagicMock()
+    first = await _pending(proto, "ReadControllerInformation", 0)
+    second = await _pending(proto, "ReadControllerInformation", 0)
+    proto.data_received(
+        cmd_complete(0x0004, 0, params=controller_info("AA:BB:CC:DD:EE:01"))
+    )
+    proto.data_received(
+        cmd_complete(0x0004, 0, params=controller_info("AA:BB:CC:DD:EE:02"))
+    )
+    assert (await first).cmd_response_frame.address == "AA:BB:CC:DD:EE:01"
+    assert (await second).cmd_response_frame.address == "AA:BB:CC:DD:EE:02"
+
+
+@pytest.mark.asyncio
+async def test_protocol_skips_cancelled_waiter() -> None:
+    proto = _make_protocol()
+    proto.transport = MagicMock()
+    first = await _pending(proto, "SetPowered", 0, 1)
+    second = await _pending(proto, "SetPowered", 0, 1)
+    # A waiter that is done but not yet unregistered is skipped.
+    proto.requests[(0x0005, 0)][0].cancel()
+    proto.data_received(cmd_complete(0x0005, 0, params=b"\x01\x00\x00\x00"))
+    assert (await second).header.controller_idx == 0
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+
+@pytest.mark.asyncio
+async def test_protocol_command_status_error_fails_fast() -> None:
+    proto = _make_protocol()
+    proto.transport = MagicMock()
+    task = await _pending(proto, "SetPowered", 2, 1)
+    proto.data_received(cmd_status(0x0005, 2, 0x0A))
+    with pytest.raises(recover.MGMTCommandError) as exc_info:
+        await task
+    err = exc_info.value
+    assert err.command is recover.btmgmt_protocol.Commands.SetPowered
+    assert err.controller_idx == 2
+    assert err.status is recover.btmgmt_protocol.ErrorCodes.Busy
+    assert "Busy (0x0a)" in str(err)
+    assert proto.requests == {}
+
+
+@pytest.mark.asyncio
+async def test_protocol_command_status_success_resolves() -> None:
+    proto = _make_protocol()
+    proto.transport = MagicMock()
+    task = await _pending(proto, "SetPowered", 0, 1)
+    proto.data_received(cmd_status(0x0005, 0, 0x00))
+    assert (await task).event_frame.status.value == 0x00
+
+
+@pytest.mark.asyncio
+async def test_protocol_counts_round_trips() -> None:
+    proto = _make_protocol()
+    proto.transport = MagicMock()
+    with recover.count_mgmt_round_trips() as outer:
+        first = await _pending(proto, "SetPowered", 0, 1)
+        with recover.count_mgmt_round_trips() as inner:
+            second = await _pending(proto, "ReadControllerInformation", 0)
+        third = await _pending(proto, "ReadControllerInformation", 1)
+    fourth = await _pending(proto, "ReadControllerInformation", 2)
+    assert (outer.count, inner.count) == (3, 1)
+    for task in (first, second, third, fourth):
+        task.cancel()
+
+
+@pytest.mark.asyncio
+async def test_protocol_drops_unsolicited_reply() -> None:
+    proto = _make_protocol()
+    proto.transport = MagicMock()
+    task = await _pending(proto, "ReadControllerInformation", 0)
+    # A reply for another controller must not complete this request.
+    proto.data_received(
+        cmd_complete(0x0004, 3, params=controller_info("11:22:33:44:55:66"))
+    )
+    assert not task.done()
+    task.cancel()
+
+
+@pytest.mark.asyncio
+async def test_protocol_connection_lost_fails_outstanding_requests() -> None:
+    proto = _make_protocol()
+    proto.transport = MagicMock()
+    task = await _pending(proto, "ReadControllerInformation", 0)
+    proto.connection_lost(OSError("dropped"))
+    with pytest.raises(recover.btmgmt_socket.BluetoothSocketError):
+        await task
 
 
 @pytest.mark.asyncio
@@ -1113,10 +1747,8 @@ async def test_protocol_send_writes_to_socket_directly() -> None:
     frame = MagicMock()
     frame.octets = b"data"
     with patch.object(recover.btmgmt_protocol, "command", return_value=[frame]):
-        task = asyncio.ensure_future(proto.send("SetPowered", 0, 1))
-        await asyncio.sleep(0)
-        assert proto.future is not None
-        proto.future.set_result("RESPONSE")
+        task = await _pending(proto, "SetPowered", 0, 1)
+        proto.requests[(0x0005, 0)][0].set_result("RESPONSE")
         result = await task
     # The kernel-ABI workaround writes to the raw socket, not the transport.
     cast("MagicMock", proto.sock).send.assert_called_once_with(b"data")
@@ -1136,6 +1768,8 @@ async def test_protocol_send_times_out() -> None:
         pytest.raises(asyncio.TimeoutError),
     ):
         await proto.send("ReadControllerInformation", 0)
+    # The timed out waiter is unregistered.
+    assert proto.requests == {}
 
 
 @pytest.mark.asyncio
@@ -1170,10 +1804,59 @@ async def test_protocol_connection_made_with_resolved_future() -> None:
 @pytest.mark.asyncio
 async def test_protocol_data_received_without_pending_future() -> None:
     proto = _make_protocol()
-    proto.future = None
-    # With no pending future, incoming data is parsed and discarded silently.
-    proto.data_received(b"payload")
-    assert proto.future is None
+    # With no pending request, incoming replies are parsed and discarded silently.
+    proto.data_received(cmd_complete(0x0005, 0, params=b"\x01\x00\x00\x00"))
+    assert proto.requests == {}
+
+
+@pytest.mark.asyncio
+async def test_protocol_skips_decoding_unwanted_frames() -> None:
+    proto = _make_protocol()
+    proto.transport = MagicMock()
+    task = await _pending(proto, "SetPowered", 0, 1)
+    device_found = mgmt_event(0x0012, 0, bytes(14))
+    with patch.object(recover.btmgmt_protocol, "reader") as reader:
+        # Unsubscribed events, unknown event codes and replies nobody waits
+        # for are dropped on the header alone.
+        proto.data_received(device_found)
+        proto.data_received(mgmt_event(0x00FF, 0))
+        proto.data_received(cmd_complete(0x0004, 0))
+        proto.data_received(cmd_complete(0x0005, 1))
+        reader.assert_not_called()
+        proto.subscribe(recover.btmgmt_protocol.Events.DeviceFoundEvent, MagicMock())
+        proto.data_received(device_found)
+        reader.assert_called_once_with(device_found)
+    task.cancel()
+
+
+@pytest.mark.asyncio
+async def test_protocol_ignores_truncated_reply() -> None:
+    proto = _make_protocol()
+    proto.transport = MagicMock()
+    task = await _pending(proto, "SetPowered", 0, 1)
+    proto.data_received(mgmt_event(0x0001, 0, b"\x05"))
+    assert not task.done()
+    task.cancel()
+
+
+@pytest.mark.asyncio
+async def test_protocol_index_removed_fails_requests_for_that_index() -> None:
+    proto = _make_protocol()
+    proto.transport = MagicMock()
+    loop = asyncio.get_running_loop()
+    removed = await _pending(proto, "SetPowered", 1, 1)
+    other = await _pending(proto, "SetPowered", 0, 1)
+    index_list = await _pending(proto, "ReadControllerIndexList", None)
+    start = loop.time()
+    # Nobody subscribed to Index Removed; the requests fail all the same.
+    proto.data_received(mgmt_event(0x0005, 1))
+    with pytest.raises(recover.ControllerRemovedError, match="index 1 was removed"):
+        await removed
+    assert loop.time() - start < 1
+    assert not other.done()
+    assert not index_list.done()
+    other.cancel()
+    index_list.cancel()
 
 
 @pytest.mark.asyncio
@@ -1197,6 +1880,107 @@ async def test_protocol_connection_lost_without_exc() -> None:
     assert proto.transport is None
 
 
+@pytest.mark.asyncio
+async def test_protocol_connection_lost_notifies_owner() -> None:
+    loop = asyncio.get_running_loop()
+    on_lost = MagicMock()
+    proto = BluetoothMGMTProtocol(5, loop.create_future(), MagicMock(), on_lost)
+    err = OSError("dropped")
+    proto.connection_lost(err)
+    on_lost.assert_called_once_with(err)
+
+
+@pytest.mark.asyncio
+async def test_protocol_data_received_ignores_parameterless_events() -> None:
+    proto = _make_protocol()
+    proto.transport = MagicMock()
+    task = await _pending(proto, "ReadControllerInformation", 1)
+    # btsocket has no frame shape for Index Added and raises AttributeError;
+    # it must not escape and close the transport.
+    proto.data_received(mgmt_event(0x0004, 1))
+    assert not task.done()
+    task.cancel()
+
+
+# ---------------------------------------------------------------------------
+# Waiting for an adapter to be added back after a USB reset
+# ---------------------------------------------------------------------------
+
+
+def _info_reply(address: str, status: int = 0x00) -> MagicMock:
+    reply = MagicMock()
+    reply.event_frame.status.value = status
+    reply.cmd_response_frame.address = address
+    return reply
+
+
+@pytest.mark.asyncio
+async def test_reappearance_watcher_resolves_on_matching_index() -> None:
+    proto = _make_protocol()
+    replies = {
+        2: _info_reply("11:22:33:44:55:66"),
+        4: _info_reply("aa:bb:cc:dd:ee:ff", status=0x11),
+        5: _info_reply("aa:bb:cc:dd:ee:ff"),
+    }
+
+    async def send(_command: str, idx: int) -> MagicMock:
+        if idx == 3:
+            raise asyncio.TimeoutError
+        if idx == 6:
+            raise _BUSY
+        return replies[idx]
+
+    with patch.object(proto, "send", side_effect=send):
+        watcher = recover._ReappearanceWatcher(proto, "AA:BB:CC:DD:EE:FF")
+        for idx in (2, 3, 6, 4, 5):
+            proto.data_received(mgmt_event(0x0004, idx))
+        assert await watcher.wait(1) == 5
+        watcher.close()
+    assert proto.listeners[recover.btmgmt_protocol.Events.IndexAddedEvent] == []
+
+
+@pytest.mark.asyncio
+async def test_reappearance_watcher_times_out() -> None:
+    proto = _make_protocol()
+    watcher = recover._ReappearanceWatcher(proto, "AA:BB:CC:DD:EE:FF")
+    assert await watcher.wait(0.01) is None
+    watcher.close()
+
+
+@pytest.mark.asyncio
+async def test_reappearance_watcher_close_cancels_lookups() -> None:
+    proto = _make_protocol()
+    proto.transport = MagicMock()
+    watcher = recover._ReappearanceWatcher(proto, "AA:BB:CC:DD:EE:FF")
+    proto.data_received(mgmt_event(0x0004, 1))
+    await asyncio.sleep(0)
+    (lookup,) = watcher._lookups
+    watcher.close()
+    with pytest.raises(asyncio.CancelledError):
+        await lookup
+
+
+@pytest.mark.asyncio
+async def test_watch_for_reappearance_disabled() -> None:
+    ctl = _event_adapter()
+    with recover._watch_for_reappearance(ctl, "AA:BB:CC:DD:EE:FF") as watcher:
+        assert watcher is None
+    assert not any(cast("BluetoothMGMTProtocol", ctl.protocol).listeners.values())
+
+
+@pytest.mark.asyncio
+async def test_watch_for_reappearance_subscribes_when_enabled() -> None:
+    ctl = _event_adapter()
+    proto = cast("BluetoothMGMTProtocol", ctl.protocol)
+    with (
+        patch.object(recover, "POST_RESET_WAIT_FOR_INDEX_ADDED", True),
+        recover._watch_for_reappearance(ctl, "AA:BB:CC:DD:EE:FF") as watcher,
+    ):
+        assert isinstance(watcher, recover._ReappearanceWatcher)
+        assert proto.listeners[recover.btmgmt_protocol.Events.IndexAddedEvent]
+    assert proto.listeners[recover.btmgmt_protocol.Events.IndexAddedEvent] == []
+
+
 # ---------------------------------------------------------------------------
 # MGMTBluetoothCtl.setup
 # ---------------------------------------------------------------------------
@@ -1223,6 +2007,54 @@ async def test_setup_success() -> None:
     assert isinstance(ctl.protocol, BluetoothMGMTProtocol)
 
 
+@pytest.mark.asyncio
+async def test_setup_filters_socket() -> None:
+    ctl = MGMTBluetoothCtl("hci0", "AA:BB:CC:DD:EE:FF", 5)
+    sock = MagicMock()
+    loop = asyncio.get_running_loop()
+
+    async def fake_create(sock_arg, factory, *args, **kwargs):
+        proto = factory()
+        proto.connection_made(MagicMock())
+        return (MagicMock(), proto)
+
+    with (
+        patch.object(recover, "MGMT_SOCKET_FILTER", True),
+        patch.object(recover.btmgmt_socket, "open", return_value=sock),
+        patch.object(loop, "_create_connection_transport", fake_create),
+        patch.object(ctl, "_find_controller", AsyncMock()),
+        patch.object(recover, "attach_filter") as attach,
+    ):
+        await ctl.setup()
+    attach.assert_called_once_with(
+        sock, recover.mgmt_event_filter(recover._FILTERED_EVENTS)
+    )
+
+
+@pytest.mark.asyncio
+async def test_attach_mgmt_filter_is_opt_in_and_best_effort(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    sock = MagicMock()
+    with patch.object(recover, "attach_filter") as attach:
+        recover._attach_mgmt_filter(sock)
+    attach.assert_not_called()
+    with (
+        patch.object(recover, "MGMT_SOCKET_FILTER", True),
+        patch.object(recover, "attach_filter", side_effect=OSError("EINVAL")),
+        caplog.at_level(logging.DEBUG),
+    ):
+        recover._attach_mgmt_filter(sock)
+    assert "Could not attach a filter" in caplog.text
+    token = recover._RECOVERY_CONFIG.set(RecoveryConfig(mgmt_socket_filter=True))
+    try:
+        with patch.object(recover, "attach_filter") as attach:
+            recover._attach_mgmt_filter(sock)
+    finally:
+        recover._RECOVERY_CONFIG.reset(token)
+    attach.assert_called_once()
+
+
 @pytest.mark.asyncio
 async def test_setup_raises_on_unexpected_protocol_type() -> None:
     ctl = MGMTBluetoothCtl("hci0", "AA:BB:CC:DD:EE:FF", 5)
@@ -1266,159 +2098,643 @@ async def test_setup_timeout_closes_socket() -> None:
 
 
 # ---------------------------------------------------------------------------
-# recover_adapter — top-level state machine
+# MGMTSession pool
 # ---------------------------------------------------------------------------
 
 
-def _resolved_adapter() -> MagicMock:
-    ctl = MagicMock()
-    ctl.idx = 0
-    ctl.hci_name = "hci0"
-    ctl.mac = "AA:BB:CC:DD:EE:FF"
-    ctl.name = "hci0 [AA:BB:CC:DD:EE:FF] (0)"
-    return ctl
+def _connected_protocol() -> MagicMock:
+    proto = MagicMock()
+    proto.transport.is_closing.return_value = False
+    return proto
 
 
 @pytest.mark.asyncio
-async def test_recover_adapter_not_found() -> None:
-    with patch.object(recover, "_get_adapter", return_value=adapter_cm(None)):
-        assert await recover.recover_adapter(0, "AA:BB:CC:DD:EE:FF") is False
+async def test_acquire_session_is_shared_per_loop() -> None:
+    first = recover._acquire_session()
+    second = recover._acquire_session()
+    assert first is second
+    assert first.refcount == 2
+    first.release()
+    second.release()
+    # Never connected, so the last release drops it from the pool.
+    assert asyncio.get_running_loop() not in recover._SESSIONS
 
 
 @pytest.mark.asyncio
-async def test_recover_adapter_power_cycle_success() -> None:
-    ctl = _resolved_adapter()
-    with (
-        patch.object(recover, "_get_adapter", return_value=adapter_cm(ctl)),
-        patch.object(recover, "_check_or_unblock_rfkill", AsyncMock(return_value=True)),
-        patch.object(recover, "_power_cycle_adapter", AsyncMock(return_value=True)),
-        patch.object(recover.asyncio, "sleep", AsyncMock()),
-    ):
-        # Power cycle succeeds and the adapter has not gone silent: short-circuits True.
-        assert await recover.recover_adapter(0, "AA:BB:CC:DD:EE:FF") is True
+async def test_session_ensure_connected_reuses_healthy_socket() -> None:
+    session = recover.MGMTSession(5)
+    proto = _connected_protocol()
+    sock = MagicMock()
+    opener = AsyncMock(return_value=(sock, proto))
+    with patch.object(recover, "_open_mgmt_connection", opener):
+        assert await session.ensure_connected() is proto
+        assert await session.ensure_connected() is proto
+    opener.assert_awaited_once()
+    assert session.sock is sock
 
 
 @pytest.mark.asyncio
-async def test_recover_adapter_usb_reset_path() -> None:
-    first = _resolved_adapter()
-    second = _resolved_adapter()
+async def test_session_ensure_connected_replaces_unhealthy_socket() -> None:
+    session = recover.MGMTSession(5)
+    stale = _connected_protocol()
+    stale.transport.is_closing.return_value = True
+    stale_sock = MagicMock()
+    session.protocol = stale
+    session.sock = stale_sock
+    fresh = _connected_protocol()
     with (
         patch.object(
             recover,
-            "_get_adapter",
-            side_effect=[adapter_cm(first), adapter_cm(second)],
-        ),
-        patch.object(recover, "_check_or_unblock_rfkill", AsyncMock(return_value=True)),
-        patch.object(recover, "_power_cycle_adapter", AsyncMock(return_value=False)),
-        patch.object(
-            recover,
-            "_usb_reset_adapter",
-            AsyncMock(return_value=recover.USBResetOutcome.SUCCEEDED),
+            "_open_mgmt_connection",
+            AsyncMock(return_value=(MagicMock(), fresh)),
         ),
-        patch.object(recover.asyncio, "sleep", AsyncMock()),
+        patch.object(recover.btmgmt_socket, "close") as mock_close,
     ):
-        assert await recover.recover_adapter(0, "AA:BB:CC:DD:EE:FF") is True
+        assert await session.ensure_connected() is fresh
+    mock_close.assert_called_once_with(stale_sock)
 
 
 @pytest.mark.asyncio
-async def test_recover_adapter_usb_reset_fails() -> None:
-    ctl = _resolved_adapter()
+async def test_session_idle_close_after_last_release() -> None:
+    session = recover._acquire_session()
+    proto = _connected_protocol()
     with (
-        patch.object(recover, "_get_adapter", return_value=adapter_cm(ctl)),
-        patch.object(recover, "_check_or_unblock_rfkill", AsyncMock(return_value=True)),
-        patch.object(recover, "_power_cycle_adapter", AsyncMock(return_value=False)),
         patch.object(
             recover,
-            "_usb_reset_adapter",
-            AsyncMock(return_value=recover.USBResetOutcome.FAILED),
+            "_open_mgmt_connection",
+            AsyncMock(return_value=(MagicMock(), proto)),
         ),
-        patch.object(recover.asyncio, "sleep", AsyncMock()),
+        patch.object(recover, "MGMT_SESSION_IDLE_TIME", 0.01),
+        patch.object(recover.btmgmt_socket, "close"),
     ):
-        assert await recover.recover_adapter(0, "AA:BB:CC:DD:EE:FF") is False
-
+        await session.ensure_connected()
+        session.release()
+        # Re-borrowing within the idle window keeps the socket open.
+        assert recover._acquire_session() is session
+        session.release()
+        await asyncio.sleep(0.05)
+    proto.transport.close.assert_called_once()
+    assert session.sock is None
+    assert asyncio.get_running_loop() not in recover._SESSIONS
+
+
+def test_sessions_of_closed_loops_are_closed() -> None:
+    socks = [MagicMock() for _ in range(3)]
+    opener = AsyncMock(side_effect=[(sock, _connected_protocol()) for sock in socks])
+
+    async def _recover_once() -> None:
+        session = recover._acquire_session()
+        await session.ensure_connected()
+        # Released with the idle timer pending, then asyncio.run closes the loop.
+        session.release()
 
-@pytest.mark.asyncio
-async def test_recover_adapter_gone_silent_forces_usb_reset() -> None:
-    first = _resolved_adapter()
-    second = _resolved_adapter()
-    power_cycle = AsyncMock(return_value=True)
-    usb_reset = AsyncMock(return_value=recover.USBResetOutcome.SUCCEEDED)
     with (
-        patch.object(
-            recover,
-            "_get_adapter",
-            side_effect=[adapter_cm(first), adapter_cm(second)],
-        ),
-        patch.object(recover, "_check_or_unblock_rfkill", AsyncMock(return_value=True)),
-        patch.object(recover, "_power_cycle_adapter", power_cycle),
-        patch.object(recover, "_usb_reset_adapter", usb_reset),
-        patch.object(recover.asyncio, "sleep", AsyncMock()),
+        patch.object(recover, "_open_mgmt_connection", opener),
+        patch.object(recover.btmgmt_socket, "close") as mock_close,
     ):
-        # gone_silent=True: even a successful power cycle still triggers a USB reset.
-        assert (
-            await recover.recover_adapter(0, "AA:BB:CC:DD:EE:FF", gone_silent=True)
-            is True
-        )
-    usb_reset.assert_awaited_once()
+        for _ in range(3):
+            asyncio.run(_recover_once())
+        # Each run closed the session the previous one left behind.
+        assert mock_close.call_args_list == [call(socks[0]), call(socks[1])]
+        assert len(recover._SESSIONS) == 1
+        recover._drop_closed_loop_sessions()
+    assert not recover._SESSIONS
+    mock_close.assert_called_with(socks[2])
 
 
 @pytest.mark.asyncio
-async def test_recover_adapter_gone_silent_non_usb_power_cycle_ok() -> None:
-    # gone_silent forces a USB reset, but the adapter is not a USB device
-    # (USB reset is not applicable). The power cycle succeeded, so a non-USB
-    # adapter is still recovered and recover_adapter must report success.
-    ctl = _resolved_adapter()
+async def test_session_idle_close_skipped_when_borrowed_again() -> None:
+    session = recover.MGMTSession(5)
+    session.refcount = 1
+    session.sock = MagicMock()
+    session._idle_close()
+    assert session.sock is not None
+
+
+@pytest.mark.asyncio
+async def test_session_reconnects_when_connection_lost_while_borrowed() -> None:
+    session = recover.MGMTSession(5)
+    session.acquire()
+    lost = _connected_protocol()
+    fresh = _connected_protocol()
+    opener = AsyncMock(side_effect=[(MagicMock(), lost), (MagicMock(), fresh)])
     with (
-        patch.object(recover, "_get_adapter", return_value=adapter_cm(ctl)),
-        patch.object(recover, "_check_or_unblock_rfkill", AsyncMock(return_value=True)),
-        patch.object(recover, "_power_cycle_adapter", AsyncMock(return_value=True)),
-        patch.object(
-            recover,
-            "_usb_reset_adapter",
-            AsyncMock(return_value=recover.USBResetOutcome.NOT_APPLICABLE),
-        ),
-        patch.object(recover.asyncio, "sleep", AsyncMock()),
+        patch.object(recover, "_open_mgmt_connection", opener),
+        patch.object(recover.btmgmt_socket, "close"),
     ):
-        assert (
-            await recover.recover_adapter(0, "AA:BB:CC:DD:EE:FF", gone_silent=True)
-            is True
-        )
+        await session.ensure_connected()
+        session._connection_lost(OSError("dropped"))
+        assert not session.connected
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+    assert session.protocol is fresh
+    session.close()
 
 
 @pytest.mark.asyncio
-async def test_recover_adapter_non_usb_power_cycle_failed() -> None:
-    # USB reset not applicable AND the power cycle failed: nothing recovered
-    # the adapter, so recover_adapter must report failure.
-    ctl = _resolved_adapter()
+async def test_session_does_not_reconnect_when_idle() -> None:
+    session = recover.MGMTSession(5)
+    session.sock = MagicMock()
+    with patch.object(recover.btmgmt_socket, "close"):
+        session._connection_lost(None)
+    assert session._reconnect_task is None
+    assert session.sock is None
+
+
+@pytest.mark.asyncio
+async def test_session_ignores_connection_lost_while_closing() -> None:
+    session = recover.MGMTSession(5)
+    proto = _connected_protocol()
+    session.protocol = proto
+    session._closing = True
+    session._connection_lost(None)
+    assert session.protocol is proto
+
+
+@pytest.mark.asyncio
+async def test_session_reconnect_failure_is_logged(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    session = recover.MGMTSession(5)
     with (
-        patch.object(recover, "_get_adapter", return_value=adapter_cm(ctl)),
-        patch.object(recover, "_check_or_unblock_rfkill", AsyncMock(return_value=True)),
-        patch.object(recover, "_power_cycle_adapter", AsyncMock(return_value=False)),
         patch.object(
-            recover,
-            "_usb_reset_adapter",
-            AsyncMock(return_value=recover.USBResetOutcome.NOT_APPLICABLE),
+            recover, "_open_mgmt_connection", AsyncMock(side_effect=OSError("nope"))
         ),
-        patch.object(recover.asyncio, "sleep", AsyncMock()),
+        caplog.at_level(logging.WARNING),
     ):
-        assert await recover.recover_adapter(0, "AA:BB:CC:DD:EE:FF") is False
+        await session._reconnect()
+    assert "Reconnecting Bluetooth management socket failed" in caplog.text
+    assert session._reconnect_task is None
 
 
 @pytest.mark.asyncio
-async def test_recover_adapter_second_lookup_fails() -> None:
-    first = _resolved_adapter()
-    calls = {"n": 0}
+async def test_session_close_cancels_reconnect() -> None:
+    session = recover.MGMTSession(5)
+    task = MagicMock()
+    session._reconnect_task = task
+    sock = MagicMock()
+    session.sock = sock
+    with patch.object(recover.btmgmt_socket, "close", side_effect=OSError("gone")):
+        session.close()
+    task.cancel.assert_called_once()
+    assert session.sock is None
 
-    def get_adapter(*_args: object, **_kwargs: object) -> object:
-        calls["n"] += 1
-        # First lookup (pre-reset) resolves; every post-reset lookup misses.
-        return adapter_cm(first if calls["n"] == 1 else None)
 
+@pytest.mark.asyncio
+async def test_setup_with_session_borrows_pooled_socket() -> None:
+    ctl = MGMTBluetoothCtl("hci0", "AA:BB:CC:DD:EE:FF", 5)
+    session = recover.MGMTSession(5)
+    proto = _connected_protocol()
+    session.protocol = proto
+    session.sock = MagicMock()
     with (
-        patch.object(recover, "_get_adapter", side_effect=get_adapter),
-        patch.object(recover, "_check_or_unblock_rfkill", AsyncMock(return_value=True)),
-        patch.object(recover, "_power_cycle_adapter", AsyncMock(return_value=False)),
-        patch.object(
+        patch.object(recover.MGMTBluetoothCtl, "_find_controller", AsyncMock()),
+        patch.object(recover.btmgmt_socket, "close") as mock_close,
+    ):
+        await ctl.setup(session)
+        assert ctl.protocol is proto
+        assert ctl.sock is session.sock
+        await ctl.close()
+    # The pooled socket is left open for the next borrower.
+    mock_close.assert_not_called()
+    proto.transport.close.assert_not_called()
+    assert ctl.session is None
+
+
+def test_require_protocol_follows_session_reconnect() -> None:
+    ctl = MGMTBluetoothCtl("hci0", "AA:BB:CC:DD:EE:FF", 5)
+    session = recover.MGMTSession(5)
+    ctl.session = session
+    ctl.protocol = MagicMock()
+    fresh = MagicMock()
+    session.protocol = fresh
+    assert ctl._require_protocol is fresh
+    session.protocol = None
+    with pytest.raises(recover.btmgmt_socket.BluetoothSocketError):
+        _ = ctl._require_protocol
+
+
+# ---------------------------------------------------------------------------
+# ControllerRegistry
+# ---------------------------------------------------------------------------
+
+_POWERED = recover.btmgmt_protocol.SupportedSettings.Powered
+
+
+@pytest.mark.asyncio
+async def test_registry_seeds_once() -> None:
+    proto = _make_protocol()
+    send = _mgmt_send(
+        _index_list(0, 1, 4),
+        {0: "aa:bb:cc:dd:ee:ff", 1: "11:22:33:44:55:66", 4: _BUSY},
+    )
+    with patch.object(proto, "send", send):
+        registry = recover.ControllerRegistry(proto)
+        assert await registry.seed() is True
+        assert await registry.seed() is True
+    assert send.await_count == 4
+    assert registry.index_of("AA:BB:CC:DD:EE:FF") == 0
+    assert registry.index_of("11:22:33:44:55:66") == 1
+    assert registry.mac_by_index == {0: "AA:BB:CC:DD:EE:FF", 1: "11:22:33:44:55:66"}
+    assert registry.settings == {0: {}, 1: {}}
+    registry.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "index_list", [asyncio.TimeoutError(), _BUSY, _index_list(status=0x01)]
+)
+async def test_registry_seed_failure_is_retried(index_list: object) -> None:
+    proto = _make_protocol()
+    with patch.object(proto, "send", _mgmt_send(index_list)):
+        registry = recover.ControllerRegistry(proto)
+        assert await registry.seed() is False
+    assert registry.seeded is False
+    with patch.object(proto, "send", _mgmt_send(_index_list())):
+        assert await registry.seed() is True
+    registry.close()
+
+
+async def _until_requested(proto: BluetoothMGMTProtocol, opcode: int, idx: int) -> None:
+    """Let the loop run until a request for ``opcode`` on ``idx`` is sent."""
+    for _ in range(20):
+        if (opcode, idx) in proto.requests:
+            return
+        await asyncio.sleep(0)
+    raise AssertionError  # pragma: no cover
+
+
+@pytest.mark.asyncio
+async def test_get_adapter_skips_another_controller_removed_mid_enumeration() -> None:
+    proto = _make_protocol()
+    proto.transport = MagicMock()
+    proto.transport.is_closing.return_value = False
+
+    async def _found_idx() -> int | None:
+        async with recover._get_adapter("hci0", "AA:BB:CC:DD:EE:FF") as adapter:
+            return None if adapter is None else adapter.idx
+
+    with (
+        patch.object(
+            recover,
+            "_open_mgmt_connection",
+            AsyncMock(return_value=(MagicMock(), proto)),
+        ),
+        patch.object(recover.btmgmt_socket, "close"),
+    ):
+        task = asyncio.ensure_future(_found_idx())
+        await _until_requested(proto, 0x0003, 0xFFFF)
+        proto.data_received(
+            cmd_complete(0x0003, 0xFFFF, params=b"\x02\x00\x00\x00\x01\x00")
+        )
+        await _until_requested(proto, 0x0004, 1)
+        # hci1 is unplugged before it answers; hci0 is still found.
+        proto.data_received(mgmt_event(0x0005, 1))
+        proto.data_received(
+            cmd_complete(0x0004, 0, params=controller_info("AA:BB:CC:DD:EE:FF"))
+        )
+        assert await task == 0
+        recover._SESSIONS[asyncio.get_running_loop()].close()
+
+
+@pytest.mark.asyncio
+async def test_registry_follows_index_events() -> None:
+    proto = _make_protocol()
+    controllers: dict[int, object] = {0: "aa:bb:cc:dd:ee:ff"}
+    with patch.object(proto, "send", _mgmt_send(_index_list(0), controllers)):
+        registry = recover.ControllerRegistry(proto)
+        await registry.seed()
+        # The adapter drops off the bus and comes back as hci3.
+        proto.data_received(mgmt_event(0x0005, 0))
+        assert registry.index_of("AA:BB:CC:DD:EE:FF") is None
+        assert registry.settings == {}
+        controllers[3] = "aa:bb:cc:dd:ee:ff"
+        proto.data_received(mgmt_event(0x0004, 3))
+        await asyncio.sleep(0)
+    assert registry.index_of("AA:BB:CC:DD:EE:FF") == 3
+    registry.close()
+
+
+@pytest.mark.asyncio
+async def test_registry_index_removed_cancels_pending_lookup() -> None:
+    proto = _make_protocol()
+    with patch.object(proto, "send", _mgmt_send(_index_list(), {2: _never_replies})):
+        registry = recover.ControllerRegistry(proto)
+        proto.data_received(mgmt_event(0x0004, 2))
+        await asyncio.sleep(0)
+        lookup = registry._lookups[2]
+        proto.data_received(mgmt_event(0x0005, 2))
+        await asyncio.sleep(0)
+    assert lookup.cancelled()
+    assert registry._lookups == {}
+    assert registry.mac_by_index == {}
+    registry.close()
+
+
+@pytest.mark.asyncio
+async def test_registry_tracks_new_settings_of_known_controllers() -> None:
+    proto = _make_protocol()
+    with patch.object(
+        proto, "send", _mgmt_send(_index_list(0), {0: "aa:bb:cc:dd:ee:ff"})
+    ):
+        registry = recover.ControllerRegistry(proto)
+        await registry.seed()
+    proto.data_received(_new_settings(0, True))
+    proto.data_received(_new_settings(7, True))
+    assert registry.settings[0][_POWERED] is True
+    assert 7 not in registry.settings
+    registry.close()
+    proto.data_received(_new_settings(0, False))
+    assert registry.settings[0][_POWERED] is True
+
+
+def _tracked_adapter(powered: bool | None) -> tuple[MGMTBluetoothCtl, AsyncMock]:
+    """Return an adapter on a session whose registry tracks controller 0."""
+    ctl = _event_adapter()
+    session = recover.MGMTSession(5)
+    session.protocol = cast("BluetoothMGMTProtocol", ctl.protocol)
+    ctl.session = session
+    registry = session.controller_registry()
+    assert registry is not None
+    registry.mac_by_index[0] = "AA:BB:CC:DD:EE:FF"
+    registry.index_by_mac["AA:BB:CC:DD:EE:FF"] = 0
+    if powered is not None:
+        registry.update_settings(0, {_POWERED: powered})
+    reply = make_send_response()
+    reply.cmd_response_frame.current_settings = {_POWERED: False}
+    send = AsyncMock(return_value=reply)
+    return ctl, send
+
+
+@pytest.mark.asyncio
+async def test_registry_update_settings_ignores_untracked_controllers() -> None:
+    registry = recover.ControllerRegistry(_make_protocol())
+    registry.update_settings(3, {_POWERED: True})
+    assert registry.settings == {}
+    assert registry.powered(3) is None
+    registry.close()
+
+
+@pytest.mark.asyncio
+async def test_get_powered_cached_ok_served_from_registry() -> None:
+    ctl, send = _tracked_adapter(powered=True)
+    with patch.object(cast("BluetoothMGMTProtocol", ctl.protocol), "send", send):
+        assert await ctl.get_powered(cached_ok=True) is True
+        send.assert_not_called()
+        # Without cached_ok the read goes to the kernel and refreshes the mirror.
+        assert await ctl.get_powered() is False
+        assert await ctl.get_powered(cached_ok=True) is False
+    send.assert_awaited_once_with("ReadControllerInformation", 0)
+
+
+@pytest.mark.asyncio
+async def test_get_powered_cached_ok_reads_through_on_miss() -> None:
+    ctl, send = _tracked_adapter(powered=None)
+    with patch.object(cast("BluetoothMGMTProtocol", ctl.protocol), "send", send):
+        assert await ctl.get_powered(cached_ok=True) is False
+        assert await ctl.get_powered(cached_ok=True) is False
+    send.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_set_powered_reply_updates_registry() -> None:
+    ctl, send = _tracked_adapter(powered=True)
+    with patch.object(cast("BluetoothMGMTProtocol", ctl.protocol), "send", send):
+        assert await ctl.set_powered(False) is True
+    registry = ctl.session.controller_registry() if ctl.session else None
+    assert registry is not None
+    assert registry.powered(0) is False
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("use_cache", [True, False])
+async def test_read_power_state_for_reset_cache_is_opt_in(use_cache: bool) -> None:
+    ctl, send = _tracked_adapter(powered=True)
+    with (
+        patch.object(cast("BluetoothMGMTProtocol", ctl.protocol), "send", send),
+        patch.object(recover, "PRE_RESET_USE_CACHED_POWER_STATE", use_cache),
+    ):
+        state = await recover._read_power_state_for_reset(ctl)
+    assert state.power_state is use_cache
+    assert send.called is not use_cache
+
+
+@pytest.mark.asyncio
+async def test_session_registry_is_bound_to_the_connection() -> None:
+    session = recover.MGMTSession(5)
+    assert session.controller_registry() is None
+    session.protocol = _make_protocol()
+    session.protocol.transport = MagicMock()
+    registry = session.controller_registry()
+    assert registry is not None
+    assert session.controller_registry() is registry
+    with patch.object(registry, "close", wraps=registry.close) as close:
+        session._connection_lost(OSError("dropped"))
+    close.assert_called_once()
+    assert session.controller_registry() is None
+
+
+@pytest.mark.asyncio
+async def test_find_controller_answers_from_registry() -> None:
+    ctl = _ctl()
+    session = recover.MGMTSession(5)
+    session.protocol = _make_protocol()
+    ctl.session = session
+    registry = session.controller_registry()
+    assert registry is not None
+    send = _mgmt_send(_index_list(2), {2: "aa:bb:cc:dd:ee:ff"})
+    with patch.object(session.protocol, "send", send):
+        await registry.seed()
+        send.reset_mock()
+        hci = MagicMock()
+        with patch.object(recover, "get_adapters_from_hci", hci):
+            await ctl._find_controller()
+    assert (ctl.idx, ctl.hci_name, ctl.mac) == (2, "hci2", "AA:BB:CC:DD:EE:FF")
+    send.assert_not_called()
+    hci.assert_not_called()
+    session.close()
+
+
+@pytest.mark.asyncio
+async def test_find_controller_registry_miss_probes() -> None:
+    ctl = _ctl()
+    session = recover.MGMTSession(5)
+    session.protocol = _make_protocol()
+    ctl.session = session
+    # The registry is seeded before the adapter shows up in the index list.
+    send = _mgmt_send(_index_list(), {0: "aa:bb:cc:dd:ee:ff"})
+    with patch.object(session.protocol, "send", send):
+        await ctl._find_controller()
+    assert ctl.idx == 0
+    assert send.await_args_list == [
+        call("ReadControllerIndexList", None),
+        call("ReadControllerInformation", 0),
+    ]
+    session.close()
+
+
+# ---------------------------------------------------------------------------
+# recover_adapter — top-level state machine
+# ---------------------------------------------------------------------------
+
+
+def _resolved_adapter() -> MagicMock:
+    ctl = MagicMock()
+    ctl.idx = 0
+    ctl.hci_name = "hci0"
+    ctl.mac = "AA:BB:CC:DD:EE:FF"
+    ctl.name = "hci0 [AA:BB:CC:DD:EE:FF] (0)"
+    return ctl
+
+
+@pytest.mark.asyncio
+async def test_recover_adapter_not_found() -> None:
+    with patch.object(recover, "_get_adapter", return_value=adapter_cm(None)):
+        assert await recover.recover_adapter(0, "AA:BB:CC:DD:EE:FF") is False
+
+
+@pytest.mark.asyncio
+async def test_recover_adapter_power_cycle_success() -> None:
+    ctl = _resolved_adapter()
+    with (
+        patch.object(recover, "_get_adapter", return_value=adapter_cm(ctl)),
+        patch.object(recover, "_check_or_unblock_rfkill", AsyncMock(return_value=True)),
+        patch.object(recover, "_power_cycle_adapter", AsyncMock(return_value=_CYCLED)),
+        patch.object(recover.asyncio, "sleep", AsyncMock()),
+    ):
+        # Power cycle succeeds and the adapter has not gone silent: short-circuits True.
+        assert await recover.recover_adapter(0, "AA:BB:CC:DD:EE:FF") is True
+
+
+@pytest.mark.asyncio
+async def test_recover_adapter_usb_reset_path() -> None:
+    first = _resolved_adapter()
+    second = _resolved_adapter()
+    with (
+        patch.object(
+            recover,
+            "_get_adapter",
+            side_effect=[adapter_cm(first), adapter_cm(second)],
+        ),
+        patch.object(recover, "_check_or_unblock_rfkill", AsyncMock(return_value=True)),
+        patch.object(
+            recover, "_power_cycle_adapter", AsyncMock(return_value=_NOT_CYCLED)
+        ),
+        patch.object(
+            recover,
+            "_usb_reset_adapter",
+            AsyncMock(return_value=recover.USBResetOutcome.SUCCEEDED),
+        ),
+        patch.object(recover.asyncio, "sleep", AsyncMock()),
+    ):
+        assert await recover.recover_adapter(0, "AA:BB:CC:DD:EE:FF") is True
+
+
+@pytest.mark.asyncio
+async def test_recover_adapter_usb_reset_fails() -> None:
+    ctl = _resolved_adapter()
+    with (
+        patch.object(recover, "_get_adapter", return_value=adapter_cm(ctl)),
+        patch.object(recover, "_check_or_unblock_rfkill", AsyncMock(return_value=True)),
+        patch.object(
+            recover, "_power_cycle_adapter", AsyncMock(return_value=_NOT_CYCLED)
+        ),
+        patch.object(
+            recover,
+            "_usb_reset_adapter",
+            AsyncMock(return_value=recover.USBResetOutcome.FAILED),
+        ),
+        patch.object(recover.asyncio, "sleep", AsyncMock()),
+    ):
+        assert await recover.recover_adapter(0, "AA:BB:CC:DD:EE:FF") is False
+
+
+@pytest.mark.asyncio
+async def test_recover_adapter_gone_silent_forces_usb_reset() -> None:
+    first = _resolved_adapter()
+    second = _resolved_adapter()
+    power_cycle = AsyncMock(return_value=_CYCLED)
+    usb_reset = AsyncMock(return_value=recover.USBResetOutcome.SUCCEEDED)
+    with (
+        patch.object(
+            recover,
+            "_get_adapter",
+            side_effect=[adapter_cm(first), adapter_cm(second)],
+        ),
+        patch.object(recover, "_check_or_unblock_rfkill", AsyncMock(return_value=True)),
+        patch.object(recover, "_power_cycle_adapter", power_cycle),
+        patch.object(recover, "_usb_reset_adapter", usb_reset),
+        patch.object(recover.asyncio, "sleep", AsyncMock()),
+    ):
+        # gone_silent=True: even a successful power cycle still triggers a USB reset.
+        assert (
+            await recover.recover_adapter(0, "AA:BB:CC:DD:EE:FF", gone_silent=True)
+            is True
+        )
+    usb_reset.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_recover_adapter_gone_silent_non_usb_power_cycle_ok() -> None:
+    # gone_silent forces a USB reset, but the adapter is not a USB device
+    # (USB reset is not applicable). The power cycle succeeded, so a non-USB
+    # adapter is still recovered and recover_adapter must report success.
+    ctl = _resolved_adapter()
+    with (
+        patch.object(recover, "_get_adapter", return_value=adapter_cm(ctl)),
+        patch.object(recover, "_check_or_unblock_rfkill", AsyncMock(return_value=True)),
+        patch.object(recover, "_power_cycle_adapter", AsyncMock(return_value=_CYCLED)),
+        patch.object(
+            recover,
+            "_usb_reset_adapter",
+            AsyncMock(return_value=recover.USBResetOutcome.NOT_APPLICABLE),
+        ),
+        patch.object(recover.asyncio, "sleep", AsyncMock()),
+    ):
+        assert (
+            await recover.recover_adapter(0, "AA:BB:CC:DD:EE:FF", gone_silent=True)
+            is True
+        )
+
+
+@pytest.mark.asyncio
+async def test_recover_adapter_non_usb_power_cycle_failed() -> None:
+    # USB reset not applicable AND the power cycle failed: nothing recovered
+    # the adapter, so recover_adapter must report failure.
+    ctl = _resolved_adapter()
+    with (
+        patch.object(recover, "_get_adapter", return_value=adapter_cm(ctl)),
+        patch.object(recover, "_check_or_unblock_rfkill", AsyncMock(return_value=True)),
+        patch.object(
+            recover, "_power_cycle_adapter", AsyncMock(return_value=_NOT_CYCLED)
+        ),
+        patch.object(
+            recover,
+            "_usb_reset_adapter",
+            AsyncMock(return_value=recover.USBResetOutcome.NOT_APPLICABLE),
+        ),
+        patch.object(recover.asyncio, "sleep", AsyncMock()),
+    ):
+        assert await recover.recover_adapter(0, "AA:BB:CC:DD:EE:FF") is False
+
+
+@pytest.mark.asyncio
+async def test_recover_adapter_second_lookup_fails() -> None:
+    first = _resolved_adapter()
+    calls = {"n": 0}
+
+    def get_adapter(*_args: object, **_kwargs: object) -> object:
+        calls["n"] += 1
+        # First lookup (pre-reset) resolves; every post-reset lookup misses.
+        return adapter_cm(first if calls["n"] == 1 else None)
+
+    with (
+        patch.object(recover, "_get_adapter", side_effect=get_adapter),
+        patch.object(recover, "_check_or_unblock_rfkill", AsyncMock(return_value=True)),
+        patch.object(
+            recover, "_power_cycle_adapter", AsyncMock(return_value=_NOT_CYCLED)
+        ),
+        patch.object(
             recover,
             "_usb_reset_adapter",
             AsyncMock(return_value=recover.USBResetOutcome.SUCCEEDED),
@@ -1452,7 +2768,9 @@ async def test_recover_adapter_second_lookup_succeeds_after_retry() -> None:
             ],
         ),
         patch.object(recover, "_check_or_unblock_rfkill", AsyncMock(return_value=True)),
-        patch.object(recover, "_power_cycle_adapter", AsyncMock(return_value=False)),
+        patch.object(
+            recover, "_power_cycle_adapter", AsyncMock(return_value=_NOT_CYCLED)
+        ),
         patch.object(recover, "_usb_reset_adapter", AsyncMock(return_value=True)),
         patch.object(recover.asyncio, "sleep", sleep),
     ):
@@ -1479,7 +2797,7 @@ async def test_recover_adapter_handles_moved_hci_and_resolved_mac() -> None:
     with (
         patch.object(recover, "_get_adapter", return_value=adapter_cm(ctl)),
         patch.object(recover, "_check_or_unblock_rfkill", AsyncMock(return_value=True)),
-        patch.object(recover, "_power_cycle_adapter", AsyncMock(return_value=True)),
+        patch.object(recover, "_power_cycle_adapter", AsyncMock(return_value=_CYCLED)),
         patch.object(recover.asyncio, "sleep", AsyncMock()),
     ):
         assert await recover.recover_adapter(0, "AA:BB:CC:DD:EE:FF") is True
@@ -1494,7 +2812,7 @@ async def test_recover_adapter_first_rfkill_block_is_non_fatal() -> None:
         patch.object(
             recover, "_check_or_unblock_rfkill", AsyncMock(return_value=False)
         ),
-        patch.object(recover, "_power_cycle_adapter", AsyncMock(return_value=True)),
+        patch.object(recover, "_power_cycle_adapter", AsyncMock(return_value=_CYCLED)),
         patch.object(recover.asyncio, "sleep", AsyncMock()),
     ):
         assert await recover.recover_adapter(0, "AA:BB:CC:DD:EE:FF") is True
@@ -1516,7 +2834,9 @@ async def test_recover_adapter_post_reset_rfkill_blocked() -> None:
             "_check_or_unblock_rfkill",
             AsyncMock(side_effect=[True, False]),
         ),
-        patch.object(recover, "_power_cycle_adapter", AsyncMock(return_value=False)),
+        patch.object(
+            recover, "_power_cycle_adapter", AsyncMock(return_value=_NOT_CYCLED)
+        ),
         patch.object(
             recover,
             "_usb_reset_adapter",
@@ -1544,8 +2864,1701 @@ async def test_recover_adapter_post_reset_moved_hci() -> None:
             side_effect=[adapter_cm(first), adapter_cm(moved)],
         ),
         patch.object(recover, "_check_or_unblock_rfkill", AsyncMock(return_value=True)),
-        patch.object(recover, "_power_cycle_adapter", AsyncMock(return_value=False)),
+        patch.object(
+            recover, "_power_cycle_adapter", AsyncMock(return_value=_NOT_CYCLED)
+        ),
         patch.object(recover, "_usb_reset_adapter", AsyncMock(return_value=True)),
         patch.object(recover.asyncio, "sleep", AsyncMock()),
     ):
         assert await recover.recover_adapter(0, "AA:BB:CC:DD:EE:FF") is True
+
+
+def _fake_watch(idx: int | None) -> MagicMock:
+    watcher = MagicMock()
+    watcher.wait = AsyncMock(return_value=idx)
+
+    @contextmanager
+    def watch(*_args: object) -> Iterator[MagicMock]:
+        yield watcher
+
+    return MagicMock(side_effect=watch)
+
+
+@pytest.mark.asyncio
+async def test_recover_adapter_resumes_on_index_added() -> None:
+    first = _resolved_adapter()
+    moved = _resolved_adapter()
+    moved.idx = 2
+    moved.hci_name = "hci2"
+    get_adapter = MagicMock(side_effect=[adapter_cm(first), adapter_cm(moved)])
+    sleep = AsyncMock()
+    with (
+        patch.object(recover, "_get_adapter", get_adapter),
+        patch.object(recover, "_watch_for_reappearance", _fake_watch(2)),
+        patch.object(recover, "_check_or_unblock_rfkill", AsyncMock(return_value=True)),
+        patch.object(
+            recover, "_power_cycle_adapter", AsyncMock(return_value=_NOT_CYCLED)
+        ),
+        patch.object(
+            recover,
+            "_usb_reset_adapter",
+            AsyncMock(return_value=recover.USBResetOutcome.SUCCEEDED),
+        ),
+        patch.object(recover.asyncio, "sleep", sleep),
+    ):
+        assert await recover.recover_adapter(0, "AA:BB:CC:DD:EE:FF") is True
+    # No fixed Dbus wait or retry gaps; the lookup goes straight to the new index.
+    sleep.assert_not_awaited()
+    assert get_adapter.call_args_list[1] == call("hci2", "AA:BB:CC:DD:EE:FF")
+
+
+@pytest.mark.asyncio
+async def test_recover_adapter_index_added_deadline_single_lookup() -> None:
+    first = _resolved_adapter()
+    get_adapter = MagicMock(side_effect=[adapter_cm(first), adapter_cm(None)])
+    with (
+        patch.object(recover, "_get_adapter", get_adapter),
+        patch.object(recover, "_watch_for_reappearance", _fake_watch(None)),
+        patch.object(recover, "_check_or_unblock_rfkill", AsyncMock(return_value=True)),
+        patch.object(
+            recover, "_power_cycle_adapter", AsyncMock(return_value=_NOT_CYCLED)
+        ),
+        patch.object(
+            recover,
+            "_usb_reset_adapter",
+            AsyncMock(return_value=recover.USBResetOutcome.SUCCEEDED),
+        ),
+        patch.object(recover.asyncio, "sleep", AsyncMock()),
+    ):
+        assert await recover.recover_adapter(0, "AA:BB:CC:DD:EE:FF") is False
+    # The deadline passing replaces the retry loop with one final lookup.
+    assert get_adapter.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_recover_adapter_waits_for_a_controller_removed_mid_reset() -> None:
+    first = _resolved_adapter()
+    moved = _resolved_adapter()
+    moved.idx = 2
+    moved.hci_name = "hci2"
+    get_adapter = MagicMock(side_effect=[adapter_cm(first), adapter_cm(moved)])
+    usb_reset = AsyncMock()
+    with (
+        patch.object(recover, "_get_adapter", get_adapter),
+        patch.object(recover, "_watch_for_reappearance", _fake_watch(2)),
+        patch.object(recover, "_check_or_unblock_rfkill", AsyncMock(return_value=True)),
+        patch.object(
+            recover,
+            "_execute_reset",
+            AsyncMock(side_effect=recover.ControllerRemovedError(0)),
+        ),
+        patch.object(recover, "_usb_reset_adapter", usb_reset),
+        patch.object(recover.asyncio, "sleep", AsyncMock()),
+    ):
+        assert await recover.recover_adapter(0, "AA:BB:CC:DD:EE:FF") is True
+    # Nothing is left to USB reset; the adapter is looked up where it came back.
+    usb_reset.assert_not_awaited()
+    assert get_adapter.call_args_list[1] == call("hci2", "AA:BB:CC:DD:EE:FF")
+
+
+@pytest.mark.asyncio
+async def test_recover_adapter_removed_mid_reset_without_the_watcher() -> None:
+    first = _resolved_adapter()
+    get_adapter = MagicMock(
+        side_effect=[adapter_cm(first), adapter_cm(None), adapter_cm(first)]
+    )
+    usb_reset = AsyncMock()
+    with (
+        patch.object(recover, "_get_adapter", get_adapter),
+        patch.object(recover, "_check_or_unblock_rfkill", AsyncMock(return_value=True)),
+        patch.object(
+            recover,
+            "_execute_reset",
+            AsyncMock(side_effect=recover.ControllerRemovedError(0)),
+        ),
+        patch.object(recover, "_usb_reset_adapter", usb_reset),
+        patch.object(recover.asyncio, "sleep", AsyncMock()),
+    ):
+        # Even with USB resets disabled the adapter is waited for.
+        assert await recover.recover_adapter(
+            0, "AA:BB:CC:DD:EE:FF", True, config=RecoveryConfig(usb_reset=False)
+        )
+    usb_reset.assert_not_awaited()
+    # The post-reset lookups retry until it is back.
+    assert get_adapter.call_count == 3
+
+
+# ---------------------------------------------------------------------------
+# Recovery budget
+# ---------------------------------------------------------------------------
+
+
+@contextmanager
+def _budget(seconds: float) -> Iterator[None]:
+    loop = asyncio.get_running_loop()
+    token = recover._RECOVERY_BUDGET.set(recover.RecoveryBudget(loop.time() + seconds))
+    try:
+        yield
+    finally:
+        recover._RECOVERY_BUDGET.reset(token)
+
+
+@pytest.mark.asyncio
+async def test_waits_are_unchanged_without_a_budget() -> None:
+    assert recover._budgeted(recover.DBUS_REGISTER_TIME) == recover.DBUS_REGISTER_TIME
+    assert recover._budget_allows(1000)
+    assert not recover._budget_exhausted()
+
+
+@pytest.mark.asyncio
+async def test_waits_are_capped_by_the_budget() -> None:
+    with _budget(1):
+        assert recover._budgeted(recover.DBUS_REGISTER_TIME) <= 1
+        assert not recover._budget_allows(recover.POWER_OFF_TIME)
+    with _budget(-1):
+        assert recover._budgeted(recover.DBUS_REGISTER_TIME) == 0
+        assert recover._budget_exhausted()
+
+
+@pytest.mark.asyncio
+async def test_recover_adapter_budget_caps_dbus_wait() -> None:
+    ctl = _resolved_adapter()
+    sleep = AsyncMock()
+    with (
+        patch.object(recover, "_get_adapter", return_value=adapter_cm(ctl)),
+        patch.object(recover, "_check_or_unblock_rfkill", AsyncMock(return_value=True)),
+        patch.object(recover, "_power_cycle_adapter", AsyncMock(return_value=_CYCLED)),
+        patch.object(recover.asyncio, "sleep", sleep),
+    ):
+        outcome = await recover.recover_adapter_outcome(
+            0, "AA:BB:CC:DD:EE:FF", budget=1
+        )
+    assert outcome is recover.RecoveryOutcome.SUCCEEDED
+    assert sleep.await_args is not None
+    assert 0 < sleep.await_args.args[0] <= 1
+    assert recover._RECOVERY_BUDGET.get() is None
+
+
+@pytest.mark.asyncio
+async def test_recover_adapter_stops_when_budget_runs_out_mid_stage() -> None:
+    ctl = _resolved_adapter()
+    started = 0
+    cancelled = 0
+
+    async def _stuck_power_cycle(_adapter: MagicMock) -> recover.PowerCycleOutcome:
+        nonlocal started, cancelled
+        started += 1
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled += 1
+            raise
+        return _CYCLED
+
+    with (
+        patch.object(
+            recover, "_get_adapter", side_effect=lambda *_args: adapter_cm(ctl)
+        ),
+        patch.object(recover, "_check_or_unblock_rfkill", AsyncMock(return_value=True)),
+        patch.object(recover, "_power_cycle_adapter", _stuck_power_cycle),
+    ):
+        outcome = await recover.recover_adapter_outcome(
+            0, "AA:BB:CC:DD:EE:FF", budget=0.05
+        )
+        assert outcome is recover.RecoveryOutcome.BUDGET_EXHAUSTED
+        assert (
+            await recover.recover_adapter(0, "AA:BB:CC:DD:EE:FF", budget=0.05) is False
+        )
+    # Both recoveries got as far as the stage, which the deadline cancelled.
+    assert started == 2
+    assert cancelled == 2
+
+
+@pytest.mark.asyncio
+async def test_recover_adapter_exhausted_budget_skips_usb_reset() -> None:
+    ctl = _resolved_adapter()
+
+    async def _slow_power_cycle(_adapter: MagicMock) -> recover.PowerCycleOutcome:
+        budget = recover._RECOVERY_BUDGET.get()
+        assert budget is not None
+        budget.deadline = 0
+        return _NOT_CYCLED
+
+    usb_reset = AsyncMock()
+    with (
+        patch.object(recover, "_get_adapter", return_value=adapter_cm(ctl)),
+        patch.object(recover, "_check_or_unblock_rfkill", AsyncMock(return_value=True)),
+        patch.object(recover, "_power_cycle_adapter", _slow_power_cycle),
+        patch.object(recover, "_usb_reset_adapter", usb_reset),
+    ):
+        outcome = await recover.recover_adapter_outcome(
+            0, "AA:BB:CC:DD:EE:FF", budget=30
+        )
+    assert outcome is recover.RecoveryOutcome.BUDGET_EXHAUSTED
+    usb_reset.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_recover_adapter_failure_within_budget_is_failed() -> None:
+    with patch.object(recover, "_get_adapter", return_value=adapter_cm(None)):
+        outcome = await recover.recover_adapter_outcome(
+            0, "AA:BB:CC:DD:EE:FF", budget=30
+        )
+    assert outcome is recover.RecoveryOutcome.FAILED
+
+
+@pytest.mark.asyncio
+async def test_power_off_skipped_without_budget_to_power_back_on() -> None:
+    ctl = _resolved_adapter()
+    power_off = AsyncMock()
+    pre_reset = recover.PreResetPowerState(True, timed_out=False)
+    # Powering off and on, and bouncing the interface down and up.
+    needed = (
+        recover.POWER_OFF_TIME
+        + recover.POWER_ON_TIME
+        + 2 * recover.RecoveryConfig().interface_bounce_time
+    )
+    with patch.object(recover, "_execute_power_off", power_off):
+        with _budget(needed - 0.1):
+            await recover._power_off_for_reset(ctl, pre_reset)
+        power_off.assert_not_awaited()
+        with _budget(needed + 1):
+            await recover._power_off_for_reset(ctl, pre_reset)
+        power_off.assert_awaited_once_with(ctl, True)
+
+
+@pytest.mark.asyncio
+async def test_post_reset_lookup_stops_retrying_when_budget_runs_out() -> None:
+    get_adapter = MagicMock(return_value=adapter_cm(None))
+    sleep = AsyncMock()
+    with (
+        patch.object(recover, "_get_adapter", get_adapter),
+        patch.object(recover.asyncio, "sleep", sleep),
+        _budget(-1),
+    ):
+        assert (
+            await recover._await_adapter_after_usb_reset("hci0", "AA:BB:CC:DD:EE:FF")
+            is False
+        )
+    assert get_adapter.call_count == 1
+    sleep.assert_not_awaited()
+
+
+# ---------------------------------------------------------------------------
+# Recovery config
+# ---------------------------------------------------------------------------
+
+
+def test_config_without_recovery_follows_module_constants() -> None:
+    with patch.object(recover, "DBUS_REGISTER_TIME", 9):
+        assert recover._config().dbus_register_time == 9
+
+
+@pytest.mark.asyncio
+async def test_recover_adapter_uses_given_config() -> None:
+    ctl = _resolved_adapter()
+    sleep = AsyncMock()
+    config = RecoveryConfig(dbus_register_time=0.25)
+    with (
+        patch.object(recover, "_get_adapter", return_value=adapter_cm(ctl)),
+        patch.object(recover, "_check_or_unblock_rfkill", AsyncMock(return_value=True)),
+        patch.object(recover, "_power_cycle_adapter", AsyncMock(return_value=_CYCLED)),
+        patch.object(recover.asyncio, "sleep", sleep),
+    ):
+        assert await recover.recover_adapter(0, "AA:BB:CC:DD:EE:FF", config=config)
+    sleep.assert_awaited_once_with(0.25)
+    assert recover._RECOVERY_CONFIG.get() is None
+
+
+@pytest.mark.asyncio
+async def test_recover_adapter_config_disables_steps() -> None:
+    ctl = _resolved_adapter()
+    rfkill = AsyncMock(return_value=True)
+    power_cycle = AsyncMock(return_value=_CYCLED)
+    usb_reset = AsyncMock()
+    config = RecoveryConfig(unblock_rfkill=False, power_cycle=False, usb_reset=False)
+    with (
+        patch.object(recover, "_get_adapter", return_value=adapter_cm(ctl)),
+        patch.object(recover, "_check_or_unblock_rfkill", rfkill),
+        patch.object(recover, "_power_cycle_adapter", power_cycle),
+        patch.object(recover, "_usb_reset_adapter", usb_reset),
+    ):
+        assert (
+            await recover.recover_adapter(0, "AA:BB:CC:DD:EE:FF", config=config)
+            is False
+        )
+    rfkill.assert_not_awaited()
+    power_cycle.assert_not_awaited()
+    usb_reset.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_recover_adapter_gone_silent_without_usb_reset_keeps_power_cycle() -> (
+    None
+):
+    ctl = _resolved_adapter()
+    usb_reset = AsyncMock()
+    with (
+        patch.object(recover, "_get_adapter", return_value=adapter_cm(ctl)),
+        patch.object(recover, "_check_or_unblock_rfkill", AsyncMock(return_value=True)),
+        patch.object(recover, "_power_cycle_adapter", AsyncMock(return_value=_CYCLED)),
+        patch.object(recover, "_usb_reset_adapter", usb_reset),
+        patch.object(recover.asyncio, "sleep", AsyncMock()),
+    ):
+        assert await recover.recover_adapter(
+            0,
+            "AA:BB:CC:DD:EE:FF",
+            gone_silent=True,
+            config=RecoveryConfig(usb_reset=False),
+        )
+    usb_reset.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_post_reset_lookup_uses_config_retries() -> None:
+    get_adapter = MagicMock(side_effect=lambda *_args: adapter_cm(None))
+    sleep = AsyncMock()
+    config = RecoveryConfig(
+        post_reset_lookup_attempts=2, post_reset_lookup_retry_time=1
+    )
+    token = recover._RECOVERY_CONFIG.set(config)
+    try:
+        with (
+            patch.object(recover, "_get_adapter", get_adapter),
+            patch.object(recover.asyncio, "sleep", sleep),
+        ):
+            assert not await recover._await_adapter_after_usb_reset(
+                "hci0", "AA:BB:CC:DD:EE:FF"
+            )
+    finally:
+        recover._RECOVERY_CONFIG.reset(token)
+    assert get_adapter.call_count == 2
+    sleep.assert_awaited_once_with(1)
+
+
+# ---------------------------------------------------------------------------
+# D-Bus readiness probe
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_dbus_registration_ends_when_adapter_is_ready() -> None:
+    probe = AsyncMock(return_value=True)
+    sleep = AsyncMock()
+    token = recover._RECOVERY_CONFIG.set(RecoveryConfig(dbus_readiness_probe=True))
+    try:
+        with (
+            patch.object(recover, "wait_for_adapter", probe),
+            patch.object(recover.asyncio, "sleep", sleep),
+        ):
+            await recover._wait_for_dbus_registration(
+                "successful power cycle", "hci0", "AA:BB:CC:DD:EE:FF"
+            )
+    finally:
+        recover._RECOVERY_CONFIG.reset(token)
+    probe.assert_awaited_once_with(
+        "hci0", "AA:BB:CC:DD:EE:FF", recover.DBUS_REGISTER_TIME, reappearing=False
+    )
+    sleep.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_dbus_registration_falls_back_to_sleep() -> None:
+    sleep = AsyncMock()
+    token = recover._RECOVERY_CONFIG.set(RecoveryConfig(dbus_readiness_probe=True))
+    try:
+        with (
+            patch.object(recover, "wait_for_adapter", AsyncMock(return_value=None)),
+            patch.object(recover.asyncio, "sleep", sleep),
+        ):
+            await recover._wait_for_dbus_registration(
+                "successful power cycle", "hci0", "AA:BB:CC:DD:EE:FF"
+            )
+    finally:
+        recover._RECOVERY_CONFIG.reset(token)
+    sleep.assert_awaited_once_with(recover.DBUS_REGISTER_TIME)
+
+
+@pytest.mark.asyncio
+async def test_dbus_registration_probe_is_opt_in() -> None:
+    probe = AsyncMock()
+    with (
+        patch.object(recover, "wait_for_adapter", probe),
+        patch.object(recover.asyncio, "sleep", AsyncMock()),
+    ):
+        await recover._wait_for_dbus_registration(
+            "successful power cycle", "hci0", "AA:BB:CC:DD:EE:FF"
+        )
+    probe.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_recover_adapter_probes_for_reappearance_after_usb_reset() -> None:
+    first = _resolved_adapter()
+    second = _resolved_adapter()
+    probe = AsyncMock(return_value=True)
+    with (
+        patch.object(
+            recover,
+            "_get_adapter",
+            side_effect=[adapter_cm(first), adapter_cm(second)],
+        ),
+        patch.object(recover, "_check_or_unblock_rfkill", AsyncMock(return_value=True)),
+        patch.object(
+            recover, "_power_cycle_adapter", AsyncMock(return_value=_NOT_CYCLED)
+        ),
+        patch.object(
+            recover,
+            "_usb_reset_adapter",
+            AsyncMock(return_value=recover.USBResetOutcome.SUCCEEDED),
+        ),
+        patch.object(recover, "wait_for_adapter", probe),
+        patch.object(recover.asyncio, "sleep", AsyncMock()),
+    ):
+        assert await recover.recover_adapter(
+            0,
+            "AA:BB:CC:DD:EE:FF",
+            config=RecoveryConfig(dbus_readiness_probe=True),
+        )
+    assert probe.await_args is not None
+    assert probe.await_args.kwargs == {"reappearing": True}
+
+
+@pytest.mark.asyncio
+async def test_dbus_registration_skipped_without_bluez() -> None:
+    probe = AsyncMock()
+    sleep = AsyncMock()
+    token = recover._RECOVERY_CONFIG.set(
+        RecoveryConfig(dbus_readiness_probe=True, skip_dbus_wait_without_bluez=True)
+    )
+    try:
+        with (
+            patch.object(recover, "bluez_running", AsyncMock(return_value=False)),
+            patch.object(recover, "wait_for_adapter", probe),
+            patch.object(recover.asyncio, "sleep", sleep),
+        ):
+            await recover._wait_for_dbus_registration(
+                "successful USB reset", "hci0", "AA:BB:CC:DD:EE:FF", reappearing=True
+            )
+    finally:
+        recover._RECOVERY_CONFIG.reset(token)
+    probe.assert_not_awaited()
+    sleep.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_dbus_registration_waits_when_bluez_is_running() -> None:
+    sleep = AsyncMock()
+    token = recover._RECOVERY_CONFIG.set(
+        RecoveryConfig(skip_dbus_wait_without_bluez=True)
+    )
+    try:
+        with (
+            patch.object(recover, "bluez_running", AsyncMock(return_value=True)),
+            patch.object(recover.asyncio, "sleep", sleep),
+        ):
+            await recover._wait_for_dbus_registration(
+                "successful power cycle", "hci0", "AA:BB:CC:DD:EE:FF"
+            )
+    finally:
+        recover._RECOVERY_CONFIG.reset(token)
+    sleep.assert_awaited_once_with(recover.DBUS_REGISTER_TIME)
+
+
+# ---------------------------------------------------------------------------
+# Single-flight recoveries
+# ---------------------------------------------------------------------------
+
+
+def _blocked_recovery(result: bool = True) -> tuple[AsyncMock, asyncio.Event]:
+    release = asyncio.Event()
+
+    async def _recover(_hci_name: str, _mac: str, _gone_silent: bool) -> bool:
+        await release.wait()
+        return result
+
+    return AsyncMock(side_effect=_recover), release
+
+
+@pytest.mark.asyncio
+async def test_concurrent_recoveries_of_one_adapter_share_the_outcome() -> None:
+    recover_mock, release = _blocked_recovery()
+    with patch.object(recover, "_recover_adapter", recover_mock):
+        first = asyncio.create_task(recover.recover_adapter(0, "aa:bb:cc:dd:ee:ff"))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(
+            recover.recover_adapter(0, "AA:BB:CC:DD:EE:FF", gone_silent=True)
+        )
+        await asyncio.sleep(0)
+        release.set()
+        assert await first is True
+        assert await second is True
+        recover_mock.assert_awaited_once()
+        assert not recover._IN_FLIGHT
+
+        # Once finished, the next call recovers again.
+        assert await recover.recover_adapter(0, "AA:BB:CC:DD:EE:FF") is True
+    assert recover_mock.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_recoveries_of_different_adapters_run_separately() -> None:
+    recover_mock, release = _blocked_recovery()
+    with patch.object(recover, "_recover_adapter", recover_mock):
+        first = asyncio.create_task(recover.recover_adapter(0, "AA:BB:CC:DD:EE:FF"))
+        second = asyncio.create_task(recover.recover_adapter(1, "11:22:33:44:55:66"))
+        await asyncio.sleep(0)
+        release.set()
+        assert await asyncio.gather(first, second) == [True, True]
+    assert recover_mock.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_joined_recovery_is_bounded_by_its_own_budget() -> None:
+    recover_mock, release = _blocked_recovery()
+    with patch.object(recover, "_recover_adapter", recover_mock):
+        first = asyncio.create_task(recover.recover_adapter(0, "AA:BB:CC:DD:EE:FF"))
+        await asyncio.sleep(0)
+        outcome = await recover.recover_adapter_outcome(
+            0, "AA:BB:CC:DD:EE:FF", budget=0.01
+        )
+        assert outcome is recover.RecoveryOutcome.BUDGET_EXHAUSTED
+        assert not first.done()
+        release.set()
+        assert await first is True
+
+
+@pytest.mark.asyncio
+async def test_joined_recovery_sees_the_error() -> None:
+    release = asyncio.Event()
+
+    async def _recover(_hci_name: str, _mac: str, _gone_silent: bool) -> bool:
+        await release.wait()
+        msg = "boom"
+        raise RuntimeError(msg)
+
+    with patch.object(recover, "_recover_adapter", _recover):
+        first = asyncio.create_task(recover.recover_adapter(0, "AA:BB:CC:DD:EE:FF"))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(recover.recover_adapter(0, "AA:BB:CC:DD:EE:FF"))
+        await asyncio.sleep(0)
+        release.set()
+        for task in (first, second):
+            with pytest.raises(RuntimeError, match="boom"):
+                await task
+    assert not recover._IN_FLIGHT
+
+
+@pytest.mark.asyncio
+async def test_joined_callers_recover_again_when_the_recovery_is_cancelled() -> None:
+    recover_mock, release = _blocked_recovery()
+    with patch.object(recover, "_recover_adapter", recover_mock):
+        first = asyncio.create_task(recover.recover_adapter(0, "AA:BB:CC:DD:EE:FF"))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(recover.recover_adapter(0, "AA:BB:CC:DD:EE:FF"))
+        third = asyncio.create_task(recover.recover_adapter(0, "AA:BB:CC:DD:EE:FF"))
+        await asyncio.sleep(0)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        await asyncio.sleep(0)
+        # One of the joined callers took over; the other joined it.
+        assert not second.done()
+        assert not third.done()
+        release.set()
+        assert await second is True
+        assert await third is True
+    assert recover_mock.await_count == 2
+    assert not recover._IN_FLIGHT
+
+
+@pytest.mark.asyncio
+async def test_cancelled_joined_caller_does_not_recover_again() -> None:
+    recover_mock, release = _blocked_recovery()
+    with patch.object(recover, "_recover_adapter", recover_mock):
+        first = asyncio.create_task(recover.recover_adapter(0, "AA:BB:CC:DD:EE:FF"))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(recover.recover_adapter(0, "AA:BB:CC:DD:EE:FF"))
+        await asyncio.sleep(0)
+        second.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await second
+        release.set()
+        assert await first is True
+    recover_mock.assert_awaited_once()
+    assert not recover._IN_FLIGHT
+
+
+# ---------------------------------------------------------------------------
+# Bulk recovery
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_recover_adapters_returns_outcome_per_adapter() -> None:
+    async def _recover(_hci_name: str, mac: str, _gone_silent: bool) -> bool:
+        if mac == "11:22:33:44:55:66":
+            msg = "boom"
+            raise RuntimeError(msg)
+        return mac == "AA:BB:CC:DD:EE:FF"
+
+    enumerate_controllers = AsyncMock()
+    with (
+        patch.object(recover, "_enumerate_controllers", enumerate_controllers),
+        patch.object(recover, "_recover_adapter", _recover),
+    ):
+        outcomes = await recover.recover_adapters(
+            [
+                (0, "aa:bb:cc:dd:ee:ff", False),
+                (1, "00:11:22:33:44:55", True),
+                (2, "11:22:33:44:55:66", False),
+            ]
+        )
+    assert outcomes == {
+        "AA:BB:CC:DD:EE:FF": recover.RecoveryOutcome.SUCCEEDED,
+        "00:11:22:33:44:55": recover.RecoveryOutcome.FAILED,
+        "11:22:33:44:55:66": recover.RecoveryOutcome.FAILED,
+    }
+    enumerate_controllers.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_recover_adapters_limits_concurrency() -> None:
+    active = 0
+    peak = 0
+
+    async def _recover(_hci_name: str, _mac: str, _gone_silent: bool) -> bool:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return True
+
+    with (
+        patch.object(recover, "_enumerate_controllers", AsyncMock()),
+        patch.object(recover, "_recover_adapter", _recover),
+    ):
+        outcomes = await recover.recover_adapters(
+            [(idx, f"AA:BB:CC:DD:EE:0{idx}", False) for idx in range(5)],
+            concurrency=2,
+        )
+    assert peak == 2
+    assert set(outcomes.values()) == {recover.RecoveryOutcome.SUCCEEDED}
+
+
+@pytest.mark.asyncio
+async def test_recover_adapters_overlaps_waits_beyond_the_limit() -> None:
+    waiting = 0
+    all_waiting = asyncio.Event()
+
+    async def _recover(_hci_name: str, _mac: str, _gone_silent: bool) -> bool:
+        nonlocal waiting
+        async with recover._work_slot_released():
+            waiting += 1
+            if waiting == 3:
+                all_waiting.set()
+            await all_waiting.wait()
+        return True
+
+    with (
+        patch.object(recover, "_enumerate_controllers", AsyncMock()),
+        patch.object(recover, "_recover_adapter", _recover),
+    ):
+        outcomes = await asyncio.wait_for(
+            recover.recover_adapters(
+                [(idx, f"AA:BB:CC:DD:EE:0{idx}", False) for idx in range(3)],
+                concurrency=1,
+            ),
+            1,
+        )
+    assert set(outcomes.values()) == {recover.RecoveryOutcome.SUCCEEDED}
+
+
+@pytest.mark.asyncio
+async def test_recover_adapters_budget_covers_waiting_for_a_slot() -> None:
+    async def _recover(_hci_name: str, _mac: str, _gone_silent: bool) -> bool:
+        await asyncio.Event().wait()
+        return True
+
+    with (
+        patch.object(recover, "_enumerate_controllers", AsyncMock()),
+        patch.object(recover, "_recover_adapter", _recover),
+    ):
+        outcomes = await recover.recover_adapters(
+            [(0, "AA:BB:CC:DD:EE:00", False), (1, "AA:BB:CC:DD:EE:01", False)],
+            concurrency=1,
+            budget=0.05,
+        )
+    assert outcomes == {
+        "AA:BB:CC:DD:EE:00": recover.RecoveryOutcome.BUDGET_EXHAUSTED,
+        "AA:BB:CC:DD:EE:01": recover.RecoveryOutcome.BUDGET_EXHAUSTED,
+    }
+
+
+@pytest.mark.asyncio
+async def test_recover_adapters_rejects_zero_concurrency() -> None:
+    with pytest.raises(ValueError, match="concurrency"):
+        await recover.recover_adapters([], concurrency=0)
+
+
+@pytest.mark.asyncio
+async def test_recover_adapters_reads_the_default_concurrency_when_called() -> None:
+    with (
+        patch.object(recover, "RECOVER_ADAPTERS_CONCURRENCY", 0),
+        pytest.raises(ValueError, match="concurrency"),
+    ):
+        await recover.recover_adapters([])
+
+
+@pytest.mark.asyncio
+async def test_recover_adapters_rejects_duplicate_mac_addresses() -> None:
+    recover_mock = AsyncMock(return_value=recover.RecoveryOutcome.SUCCEEDED)
+    with (
+        patch.object(recover, "recover_adapter_outcome", recover_mock),
+        pytest.raises(ValueError, match="AA:BB:CC:DD:EE:FF"),
+    ):
+        await recover.recover_adapters(
+            [(0, "AA:BB:CC:DD:EE:FF", False), (1, "aa:bb:cc:dd:ee:ff", True)]
+        )
+    recover_mock.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_enumerate_controllers_seeds_the_registry() -> None:
+    session = MagicMock()
+    session.ensure_connected = AsyncMock()
+    registry = session.controller_registry.return_value
+    registry.seed = AsyncMock(return_value=True)
+    await recover._enumerate_controllers(session, None)
+    registry.seed.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_enumerate_controllers_opens_the_socket_with_the_config() -> None:
+    session = recover.MGMTSession(5)
+    configs: list[RecoveryConfig] = []
+
+    async def _open(*_args: object) -> tuple[MagicMock, MagicMock]:
+        configs.append(recover._config())
+        return MagicMock(), _connected_protocol()
+
+    config = RecoveryConfig(mgmt_socket_filter=True)
+    with (
+        patch.object(recover, "_open_mgmt_connection", _open),
+        patch.object(recover.MGMTSession, "controller_registry", return_value=None),
+    ):
+        await recover._enumerate_controllers(session, config)
+    assert configs == [config]
+    assert recover._RECOVERY_CONFIG.get() is None
+
+
+@pytest.mark.asyncio
+async def test_enumerate_controllers_without_a_socket() -> None:
+    session = MagicMock()
+    session.ensure_connected = AsyncMock(
+        side_effect=recover.btmgmt_socket.BluetoothSocketError("no socket")
+    )
+    await recover._enumerate_controllers(session, None)
+    session.controller_registry.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# Cross-process adapter lock
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_recovery_records_its_outcome_under_the_lock(tmp_path: Path) -> None:
+    ctl = _resolved_adapter()
+    config = RecoveryConfig(adapter_lock=True)
+    with (
+        patch.object(lock, "ADAPTER_LOCK_DIR", tmp_path),
+        patch.object(recover, "_get_adapter", return_value=adapter_cm(ctl)),
+        patch.object(recover, "_check_or_unblock_rfkill", AsyncMock(return_value=True)),
+        patch.object(recover, "_power_cycle_adapter", AsyncMock(return_value=_CYCLED)),
+        patch.object(recover.asyncio, "sleep", AsyncMock()),
+    ):
+        assert await recover.recover_adapter(0, "AA:BB:CC:DD:EE:FF", config=config)
+    record = (tmp_path / "AABBCCDDEEFF.lock").read_text()
+    assert '"outcome": "SUCCEEDED"' in record
+
+
+@pytest.mark.asyncio
+async def test_waiting_recovery_adopts_the_holders_outcome(tmp_path: Path) -> None:
+    recover_mock = AsyncMock(return_value=True)
+    holder = AdapterLock("AA:BB:CC:DD:EE:FF", tmp_path)
+    assert await holder.acquire(1)
+    config = RecoveryConfig(adapter_lock=True, adopt_locked_outcome=True)
+    with (
+        patch.object(lock, "ADAPTER_LOCK_DIR", tmp_path),
+        patch.object(lock, "ADAPTER_LOCK_POLL_INTERVAL", 0.01),
+        patch.object(recover, "_recover_adapter", recover_mock),
+    ):
+        waiting = asyncio.create_task(
+            recover.recover_adapter_outcome(0, "AA:BB:CC:DD:EE:FF", config=config)
+        )
+        await asyncio.sleep(0.05)
+        assert not waiting.done()
+        await holder.release("FAILED")
+        assert await waiting is recover.RecoveryOutcome.FAILED
+    recover_mock.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_waiting_recovery_runs_when_the_holder_ran_out_of_budget(
+    tmp_path: Path,
+) -> None:
+    recover_mock = AsyncMock(return_value=True)
+    holder = AdapterLock("AA:BB:CC:DD:EE:FF", tmp_path)
+    assert await holder.acquire(1)
+    config = RecoveryConfig(adapter_lock=True, adopt_locked_outcome=True)
+    with (
+        patch.object(lock, "ADAPTER_LOCK_DIR", tmp_path),
+        patch.object(lock, "ADAPTER_LOCK_POLL_INTERVAL", 0.01),
+        patch.object(recover, "_recover_adapter", recover_mock),
+    ):
+        waiting = asyncio.create_task(
+            recover.recover_adapter_outcome(0, "AA:BB:CC:DD:EE:FF", config=config)
+        )
+        await asyncio.sleep(0.05)
+        # Another process's budget says nothing about this one's.
+        await holder.release("BUDGET_EXHAUSTED")
+        assert await waiting is recover.RecoveryOutcome.SUCCEEDED
+    recover_mock.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_exhausted_budget_is_not_recorded_under_the_lock(
+    tmp_path: Path,
+) -> None:
+    async def _recover(*_args: object) -> bool:
+        await asyncio.sleep(1)
+        return True  # pragma: no cover
+
+    previous = AdapterLock("AA:BB:CC:DD:EE:FF", tmp_path)
+    assert await previous.acquire(1)
+    await previous.release("SUCCEEDED")
+    config = RecoveryConfig(adapter_lock=True)
+    with (
+        patch.object(lock, "ADAPTER_LOCK_DIR", tmp_path),
+        patch.object(recover, "_recover_adapter", _recover),
+    ):
+        outcome = await recover.recover_adapter_outcome(
+            0, "AA:BB:CC:DD:EE:FF", budget=0.01, config=config
+        )
+    assert outcome is recover.RecoveryOutcome.BUDGET_EXHAUSTED
+    record = (tmp_path / "AABBCCDDEEFF.lock").read_text()
+    assert "BUDGET_EXHAUSTED" not in record
+
+
+@pytest.mark.asyncio
+async def test_waiting_recovery_repeats_the_work_without_adopting(
+    tmp_path: Path,
+) -> None:
+    recover_mock = AsyncMock(return_value=True)
+    holder = AdapterLock("AA:BB:CC:DD:EE:FF", tmp_path)
+    assert await holder.acquire(1)
+    with (
+        patch.object(lock, "ADAPTER_LOCK_DIR", tmp_path),
+        patch.object(lock, "ADAPTER_LOCK_POLL_INTERVAL", 0.01),
+        patch.object(recover, "_recover_adapter", recover_mock),
+    ):
+        waiting = asyncio.create_task(
+            recover.recover_adapter_outcome(
+                0, "AA:BB:CC:DD:EE:FF", config=RecoveryConfig(adapter_lock=True)
+            )
+        )
+        await asyncio.sleep(0.05)
+        await holder.release("FAILED")
+        assert await waiting is recover.RecoveryOutcome.SUCCEEDED
+    recover_mock.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("budget", "expected"),
+    [
+        (None, recover.RecoveryOutcome.FAILED),
+        (0.05, recover.RecoveryOutcome.BUDGET_EXHAUSTED),
+    ],
+)
+async def test_recovery_gives_up_on_a_held_lock(
+    tmp_path: Path, budget: float | None, expected: recover.RecoveryOutcome
+) -> None:
+    recover_mock = AsyncMock(return_value=True)
+    holder = AdapterLock("AA:BB:CC:DD:EE:FF", tmp_path)
+    assert await holder.acquire(1)
+    config = RecoveryConfig(adapter_lock=True, adapter_lock_timeout=0.05)
+    with (
+        patch.object(lock, "ADAPTER_LOCK_DIR", tmp_path),
+        patch.object(lock, "ADAPTER_LOCK_POLL_INTERVAL", 0.01),
+        patch.object(recover, "_recover_adapter", recover_mock),
+    ):
+        outcome = await recover.recover_adapter_outcome(
+            0, "AA:BB:CC:DD:EE:FF", budget=budget, config=config
+        )
+    await holder.release()
+    assert outcome is expected
+    recover_mock.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_recovery_runs_unlocked_when_the_lock_cannot_be_opened(
+    tmp_path: Path,
+) -> None:
+    recover_mock = AsyncMock(return_value=True)
+    (tmp_path / "file").write_text("")
+    with (
+        patch.object(lock, "ADAPTER_LOCK_DIR", tmp_path / "file"),
+        patch.object(recover, "_recover_adapter", recover_mock),
+    ):
+        assert await recover.recover_adapter(
+            0, "AA:BB:CC:DD:EE:FF", config=RecoveryConfig(adapter_lock=True)
+        )
+    recover_mock.assert_awaited_once()
+
+
+def test_parse_outcome() -> None:
+    assert recover._parse_outcome("SUCCEEDED") is recover.RecoveryOutcome.SUCCEEDED
+    assert recover._parse_outcome("BOGUS") is None
+    assert recover._parse_outcome(None) is None
+
+
+# ---------------------------------------------------------------------------
+# Circuit breaker
+# ---------------------------------------------------------------------------
+
+_BREAKER_CONFIG = RecoveryConfig(circuit_breaker=True, circuit_breaker_failures=2)
+
+
+@pytest.mark.asyncio
+async def test_failing_adapter_cools_down() -> None:
+    recover_mock = AsyncMock(return_value=False)
+    with (
+        patch.object(recover, "_CIRCUIT_BREAKER", CircuitBreaker()),
+        patch.object(recover, "_recover_adapter", recover_mock),
+    ):
+        for expected in (
+            recover.RecoveryOutcome.FAILED,
+            recover.RecoveryOutcome.FAILED,
+            recover.RecoveryOutcome.COOLING_DOWN,
+            recover.RecoveryOutcome.COOLING_DOWN,
+        ):
+            outcome = await recover.recover_adapter_outcome(
+                0, "aa:bb:cc:dd:ee:ff", config=_BREAKER_CONFIG
+            )
+            assert outcome is expected
+        assert recover_mock.await_count == 2
+        # The adapter came back as another controller.
+        assert (
+            await recover.recover_adapter_outcome(
+                1, "AA:BB:CC:DD:EE:FF", config=_BREAKER_CONFIG
+            )
+            is recover.RecoveryOutcome.FAILED
+        )
+    assert recover_mock.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_is_opt_in() -> None:
+    recover_mock = AsyncMock(return_value=False)
+    with (
+        patch.object(recover, "_CIRCUIT_BREAKER", CircuitBreaker()),
+        patch.object(recover, "_recover_adapter", recover_mock),
+    ):
+        for _ in range(3):
+            assert not await recover.recover_adapter(0, "AA:BB:CC:DD:EE:FF")
+    assert recover_mock.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_success_and_exhausted_budget_do_not_count() -> None:
+    with (
+        patch.object(recover, "_CIRCUIT_BREAKER", CircuitBreaker()),
+        patch.object(
+            recover,
+            "_run_locked_recovery",
+            AsyncMock(
+                side_effect=[
+                    recover.RecoveryOutcome.FAILED,
+                    recover.RecoveryOutcome.SUCCEEDED,
+                    recover.RecoveryOutcome.FAILED,
+                    recover.RecoveryOutcome.BUDGET_EXHAUSTED,
+                    recover.RecoveryOutcome.FAILED,
+                ]
+            ),
+        ) as run_mock,
+    ):
+        for _ in range(5):
+            await recover.recover_adapter_outcome(
+                0, "AA:BB:CC:DD:EE:FF", config=_BREAKER_CONFIG
+            )
+        assert (
+            await recover.recover_adapter_outcome(
+                0, "AA:BB:CC:DD:EE:FF", config=_BREAKER_CONFIG
+            )
+            is recover.RecoveryOutcome.COOLING_DOWN
+        )
+    assert run_mock.await_count == 5
+
+
+@pytest.mark.asyncio
+async def test_index_added_ends_the_cooldown() -> None:
+    circuit = CircuitBreaker()
+    for _ in range(2):
+        circuit.record_failure(0, "AA:BB:CC:DD:EE:FF", _BREAKER_CONFIG)
+    proto = _make_protocol()
+    controllers: dict[int, object] = {0: "aa:bb:cc:dd:ee:ff"}
+    with (
+        patch.object(recover, "_CIRCUIT_BREAKER", circuit),
+        patch.object(proto, "send", _mgmt_send(_index_list(), controllers)),
+    ):
+        registry = recover.ControllerRegistry(proto)
+        # Coming back from our own USB reset does not count.
+        recover._IN_FLIGHT[(proto.loop, "AA:BB:CC:DD:EE:FF")] = MagicMock()
+        try:
+            proto.data_received(mgmt_event(0x0004, 0))
+            await asyncio.sleep(0)
+        finally:
+            del recover._IN_FLIGHT[(proto.loop, "AA:BB:CC:DD:EE:FF")]
+        assert circuit.cooldown_remaining(0, "AA:BB:CC:DD:EE:FF") > 0
+        proto.data_received(mgmt_event(0x0004, 0))
+        await asyncio.sleep(0)
+    assert circuit.cooldown_remaining(0, "AA:BB:CC:DD:EE:FF") == 0
+    registry.close()
+
+
+# ---------------------------------------------------------------------------
+# Recent-success short circuit
+# ---------------------------------------------------------------------------
+
+_SHORT_CIRCUIT_CONFIG = RecoveryConfig(recent_success_short_circuit=True)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("healthy", "recoveries"), [(True, 1), (False, 2), (asyncio.Event, 2)]
+)
+async def test_recent_success_is_reused_while_adapter_looks_healthy(
+    healthy: object, recoveries: int
+) -> None:
+    async def _probe(_hci_name: str, _mac: str) -> bool:
+        if healthy is asyncio.Event:
+            await asyncio.Event().wait()
+        return healthy is True
+
+    recover_mock = AsyncMock(return_value=True)
+    with (
+        patch.dict(recover._RECENT_SUCCESSES, clear=True),
+        patch.object(recover, "_probe_adapter_health", _probe),
+        patch.object(recover, "_recover_adapter", recover_mock),
+    ):
+        for _ in range(2):
+            assert await recover.recover_adapter(
+                0,
+                "aa:bb:cc:dd:ee:ff",
+                config=replace(
+                    _SHORT_CIRCUIT_CONFIG, recent_success_probe_timeout=0.05
+                ),
+            )
+    assert recover_mock.await_count == recoveries
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("healthy", "recoveries"), [(True, 0), (False, 1)])
+async def test_callers_during_the_probe_join_one_recovery(
+    healthy: bool, recoveries: int
+) -> None:
+    probed = asyncio.Event()
+    release = asyncio.Event()
+    probe_calls = 0
+
+    async def _probe(_hci_name: str, _mac: str) -> bool:
+        nonlocal probe_calls
+        probe_calls += 1
+        probed.set()
+        await release.wait()
+        return healthy
+
+    recover_mock = AsyncMock(return_value=True)
+    with (
+        patch.dict(recover._RECENT_SUCCESSES, clear=True),
+        patch.object(recover, "_probe_adapter_health", _probe),
+        patch.object(recover, "_recover_adapter", recover_mock),
+    ):
+        recover._RECENT_SUCCESSES["AA:BB:CC:DD:EE:FF"] = (
+            asyncio.get_running_loop().time()
+        )
+        first = asyncio.create_task(
+            recover.recover_adapter(
+                0, "AA:BB:CC:DD:EE:FF", config=_SHORT_CIRCUIT_CONFIG
+            )
+        )
+        await probed.wait()
+        second = asyncio.create_task(
+            recover.recover_adapter(
+                0, "AA:BB:CC:DD:EE:FF", config=_SHORT_CIRCUIT_CONFIG
+            )
+        )
+        await asyncio.sleep(0)
+        release.set()
+        assert await first is True
+        assert await second is True
+    assert probe_calls == 1
+    assert recover_mock.await_count == recoveries
+    assert not recover._IN_FLIGHT
+
+
+@pytest.mark.asyncio
+async def test_recent_success_expires() -> None:
+    probe_mock = AsyncMock(return_value=True)
+    recover_mock = AsyncMock(return_value=True)
+    with (
+        patch.dict(recover._RECENT_SUCCESSES, clear=True),
+        patch.object(recover, "_probe_adapter_health", probe_mock),
+        patch.object(recover, "_recover_adapter", recover_mock),
+    ):
+        assert await recover.recover_adapter(
+            0, "AA:BB:CC:DD:EE:FF", config=_SHORT_CIRCUIT_CONFIG
+        )
+        recover._RECENT_SUCCESSES["AA:BB:CC:DD:EE:FF"] -= 11
+        assert await recover.recover_adapter(
+            0, "AA:BB:CC:DD:EE:FF", config=_SHORT_CIRCUIT_CONFIG
+        )
+    probe_mock.assert_not_awaited()
+    assert recover_mock.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_failure_forgets_the_recent_success() -> None:
+    probe_mock = AsyncMock(return_value=True)
+    recover_mock = AsyncMock(side_effect=[True, False])
+    with (
+        patch.dict(recover._RECENT_SUCCESSES, clear=True),
+        patch.object(recover, "_probe_adapter_health", probe_mock),
+        patch.object(recover, "_recover_adapter", recover_mock),
+    ):
+        await recover.recover_adapter(
+            0, "AA:BB:CC:DD:EE:FF", config=_SHORT_CIRCUIT_CONFIG
+        )
+        recover._RECENT_SUCCESSES["AA:BB:CC:DD:EE:FF"] -= 11
+        await recover.recover_adapter(
+            0, "AA:BB:CC:DD:EE:FF", config=_SHORT_CIRCUIT_CONFIG
+        )
+        assert recover._RECENT_SUCCESSES == {}
+
+
+@pytest.mark.asyncio
+async def test_recent_success_short_circuit_is_opt_in() -> None:
+    recover_mock = AsyncMock(return_value=True)
+    with (
+        patch.dict(recover._RECENT_SUCCESSES, clear=True),
+        patch.object(recover, "_recover_adapter", recover_mock),
+    ):
+        for _ in range(2):
+            assert await recover.recover_adapter(0, "AA:BB:CC:DD:EE:FF")
+        assert recover._RECENT_SUCCESSES == {}
+    assert recover_mock.await_count == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("powered", "rfkill", "healthy"),
+    [
+        (True, RFKillInfo(False, False, 0), True),
+        (True, RFKillInfo(None, None, None), True),
+        (True, RFKillInfo(True, False, 0), False),
+        (True, RFKillInfo(False, True, 0), False),
+        (False, RFKillInfo(False, False, 0), False),
+        (_BUSY, RFKillInfo(False, False, 0), False),
+    ],
+)
+async def test_probe_adapter_health(
+    powered: object, rfkill: RFKillInfo, healthy: bool
+) -> None:
+    ctl = _resolved_adapter()
+    if isinstance(powered, Exception):
+        ctl.get_powered = AsyncMock(side_effect=powered)
+    else:
+        ctl.get_powered = AsyncMock(return_value=powered)
+    with (
+        patch.object(recover, "_get_adapter", return_value=adapter_cm(ctl)),
+        patch.object(recover, "_check_rfkill", AsyncMock(return_value=rfkill)),
+    ):
+        assert await recover._probe_adapter_health("hci0", ctl.mac) is healthy
+    ctl.get_powered.assert_awaited_once_with(cached_ok=True)
+
+
+@pytest.mark.asyncio
+async def test_probe_adapter_health_without_adapter() -> None:
+    with patch.object(recover, "_get_adapter", return_value=adapter_cm(None)):
+        assert await recover._probe_adapter_health("hci0", "AA:BB:CC:DD:EE:FF") is False
+
+
+# ---------------------------------------------------------------------------
+# Adaptive escalation
+# ---------------------------------------------------------------------------
+
+_ADAPTIVE_CONFIG = RecoveryConfig(adaptive_escalation=True)
+
+
+@pytest.mark.asyncio
+async def test_adaptive_escalation_goes_straight_to_the_usb_reset() -> None:
+    power_cycle = AsyncMock(return_value=_NOT_CYCLED)
+    usb_reset = AsyncMock(return_value=recover.USBResetOutcome.SUCCEEDED)
+    with (
+        patch.object(recover, "_ESCALATION_HISTORY", EscalationHistory()),
+        patch.object(recover, "_read_usb_id", return_value="0a12:0001"),
+        patch.object(
+            recover,
+            "_get_adapter",
+            side_effect=lambda *_args: adapter_cm(_resolved_adapter()),
+        ),
+        patch.object(recover, "_check_or_unblock_rfkill", AsyncMock(return_value=True)),
+        patch.object(recover, "_power_cycle_adapter", power_cycle),
+        patch.object(recover, "_usb_reset_adapter", usb_reset),
+        patch.object(recover.asyncio, "sleep", AsyncMock()),
+    ):
+        for _ in range(5):
+            assert await recover.recover_adapter(
+                0, "AA:BB:CC:DD:EE:FF", config=_ADAPTIVE_CONFIG
+            )
+        # Another dongle of the same model starts with what was learned.
+        assert await recover.recover_adapter(
+            1, "11:22:33:44:55:66", config=_ADAPTIVE_CONFIG
+        )
+    assert power_cycle.await_count == 3
+    assert usb_reset.await_count == 6
+
+
+@pytest.mark.asyncio
+async def test_adaptive_escalation_keeps_power_cycling_silent_adapters() -> None:
+    power_cycle = AsyncMock(return_value=_CYCLED)
+    usb_reset = AsyncMock(return_value=recover.USBResetOutcome.SUCCEEDED)
+    with (
+        patch.object(recover, "_ESCALATION_HISTORY", EscalationHistory()),
+        patch.object(recover, "_read_usb_id", return_value=None),
+        patch.object(
+            recover,
+            "_get_adapter",
+            side_effect=lambda *_args: adapter_cm(_resolved_adapter()),
+        ),
+        patch.object(recover, "_check_or_unblock_rfkill", AsyncMock(return_value=True)),
+        patch.object(recover, "_power_cycle_adapter", power_cycle),
+        patch.object(recover, "_usb_reset_adapter", usb_reset),
+        patch.object(recover.asyncio, "sleep", AsyncMock()),
+    ):
+        for _ in range(5):
+            assert await recover.recover_adapter(
+                0, "AA:BB:CC:DD:EE:FF", gone_silent=True, config=_ADAPTIVE_CONFIG
+            )
+    # A silent adapter is USB reset after every power cycle, which says
+    # nothing about whether the power cycle worked, so it is never skipped.
+    assert power_cycle.await_count == 5
+    assert usb_reset.await_count == 5
+
+
+@pytest.mark.asyncio
+async def test_adaptive_escalation_skips_a_usb_reset_that_never_works() -> None:
+    usb_reset = AsyncMock(return_value=recover.USBResetOutcome.FAILED)
+    with (
+        patch.object(recover, "_ESCALATION_HISTORY", EscalationHistory()),
+        patch.object(recover, "_read_usb_id", return_value=None),
+        patch.object(
+            recover,
+            "_get_adapter",
+            side_effect=lambda *_args: adapter_cm(_resolved_adapter()),
+        ),
+        patch.object(recover, "_check_or_unblock_rfkill", AsyncMock(return_value=True)),
+        patch.object(recover, "_power_cycle_adapter", AsyncMock(return_value=_CYCLED)),
+        patch.object(recover, "_usb_reset_adapter", usb_reset),
+        patch.object(recover.asyncio, "sleep", AsyncMock()),
+    ):
+        # The power cycle brings the adapter back on its own; after that it
+        # goes silent and needs the USB reset, which never works.
+        outcomes = [
+            await recover.recover_adapter(
+                0,
+                "AA:BB:CC:DD:EE:FF",
+                gone_silent=gone_silent,
+                config=_ADAPTIVE_CONFIG,
+            )
+            for gone_silent in (False, False, False, True, True, True, True)
+        ]
+    assert outcomes == [True, True, True, False, False, False, True]
+    assert usb_reset.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_adaptive_escalation_is_opt_in() -> None:
+    with (
+        patch.object(recover, "_read_usb_id") as read_usb_id,
+        patch.object(recover, "_ESCALATION_HISTORY", EscalationHistory()) as history,
+    ):
+        assert await recover._escalation_plan("hci0", "AA:BB:CC:DD:EE:FF") is NO_PLAN
+        token = recover._RECOVERY_CONFIG.set(_ADAPTIVE_CONFIG)
+        try:
+            read_usb_id.return_value = "0a12:0001"
+            plan = await recover._escalation_plan("hci0", "AA:BB:CC:DD:EE:FF")
+        finally:
+            recover._RECOVERY_CONFIG.reset(token)
+    read_usb_id.assert_called_once_with("hci0")
+    assert plan.history is history
+    assert plan.keys == ("AA:BB:CC:DD:EE:FF", "0a12:0001")
+
+
+@pytest.mark.parametrize(("vendor_id", "usb_id"), [("0a12", "0a12:0001"), (None, None)])
+def test_read_usb_id(vendor_id: str | None, usb_id: str | None) -> None:
+    dev = MagicMock()
+    dev.usb_device.vendor_id = vendor_id
+    dev.usb_device.product_id = "0001"
+    with patch.object(recover, "BluetoothDevice", return_value=dev) as device:
+        assert recover._read_usb_id("hci2") == usb_id
+    device.assert_called_once_with(2)
+
+
+@pytest.mark.parametrize(
+    "exc", [recover.NotAUSBDeviceError("uart"), FileNotFoundError("gone")]
+)
+def test_read_usb_id_of_other_adapters(exc: Exception) -> None:
+    dev = MagicMock()
+    dev.setup.side_effect = exc
+    with patch.object(recover, "BluetoothDevice", return_value=dev):
+        assert recover._read_usb_id("hci0") is None
+
+
+# ---------------------------------------------------------------------------
+# Recovery history
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_recovery_is_recorded_in_the_history(tmp_path: Path) -> None:
+    path = tmp_path / "history.jsonl"
+    with (
+        patch.object(history, "RECOVERY_HISTORY_PATH", path),
+        patch.object(
+            recover,
+            "_get_adapter",
+            side_effect=lambda *_args: adapter_cm(_resolved_adapter()),
+        ),
+        patch.object(recover, "_check_or_unblock_rfkill", AsyncMock(return_value=True)),
+        patch.object(recover, "_power_cycle_adapter", AsyncMock(return_value=_CYCLED)),
+        patch.object(recover.asyncio, "sleep", AsyncMock()),
+    ):
+        assert await recover.recover_adapter(
+            0, "aa:bb:cc:dd:ee:ff", config=RecoveryConfig(recovery_history=True)
+        )
+        # Off unless asked for.
+        assert await recover.recover_adapter(0, "AA:BB:CC:DD:EE:FF")
+    (record,) = history.read_records(path)
+    assert record.mac == "AA:BB:CC:DD:EE:FF"
+    assert record.hci == 0
+    assert record.outcome == "SUCCEEDED"
+    assert list(record.steps) == ["rfkill", "power_cycle", "dbus_registration"]
+    assert record.duration >= max(record.steps.values())
+
+
+@pytest.mark.asyncio
+async def test_failed_recovery_records_the_usb_reset(tmp_path: Path) -> None:
+    path = tmp_path / "history.jsonl"
+    with (
+        patch.object(history, "RECOVERY_HISTORY_PATH", path),
+        patch.object(
+            recover, "_get_adapter", return_value=adapter_cm(_resolved_adapter())
+        ),
+        patch.object(recover, "_check_or_unblock_rfkill", AsyncMock(return_value=True)),
+        patch.object(
+            recover, "_power_cycle_adapter", AsyncMock(return_value=_NOT_CYCLED)
+        ),
+        patch.object(
+            recover,
+            "_usb_reset_adapter",
+            AsyncMock(return_value=recover.USBResetOutcome.FAILED),
+        ),
+    ):
+        assert not await recover.recover_adapter(
+            0, "AA:BB:CC:DD:EE:FF", config=RecoveryConfig(recovery_history=True)
+        )
+    (record,) = history.read_records(path)
+    assert record.outcome == "FAILED"
+    assert list(record.steps) == ["rfkill", "power_cycle", "usb_reset"]
+
+
+@pytest.mark.asyncio
+async def test_recovery_records_the_hci_the_adapter_moved_to(tmp_path: Path) -> None:
+    path = tmp_path / "history.jsonl"
+    moved = _resolved_adapter()
+    moved.idx = 2
+    moved.hci_name = "hci2"
+    with (
+        patch.object(history, "RECOVERY_HISTORY_PATH", path),
+        patch.object(
+            recover,
+            "_get_adapter",
+            side_effect=[adapter_cm(_resolved_adapter()), adapter_cm(moved)],
+        ),
+        patch.object(recover, "_watch_for_reappearance", _fake_watch(2)),
+        patch.object(recover, "_check_or_unblock_rfkill", AsyncMock(return_value=True)),
+        patch.object(
+            recover, "_power_cycle_adapter", AsyncMock(return_value=_NOT_CYCLED)
+        ),
+        patch.object(
+            recover,
+            "_usb_reset_adapter",
+            AsyncMock(return_value=recover.USBResetOutcome.SUCCEEDED),
+        ),
+    ):
+        assert await recover.recover_adapter(
+            0, "AA:BB:CC:DD:EE:FF", config=RecoveryConfig(recovery_history=True)
+        )
+    (record,) = history.read_records(path)
+    assert record.hci == 2
+
+
+@pytest.mark.asyncio
+async def test_nested_step_is_not_counted_against_the_enclosing_one() -> None:
+    steps: dict[str, float] = {}
+    token = recover._RECOVERY_STEPS.set(steps)
+    loop = asyncio.get_running_loop()
+    try:
+        with (
+            patch.object(loop, "time", side_effect=[0.0, 1.0, 3.0, 6.0]),
+            recover._timed_step("usb_reset"),
+            recover._timed_step("dbus_registration"),
+        ):
+            pass
+    finally:
+        recover._RECOVERY_STEPS.reset(token)
+    assert steps == {"usb_reset": 4.0, "dbus_registration": 2.0}
+    assert list(steps) == ["usb_reset", "dbus_registration"]
+
+
+@pytest.mark.asyncio
+async def test_dbus_wait_of_a_non_usb_adapter_is_not_booked_as_usb_reset(
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / "history.jsonl"
+
+    async def wait_for_bluez(*_args: object, **_kwargs: object) -> None:
+        await asyncio.sleep(0.05)
+
+    with (
+        patch.object(history, "RECOVERY_HISTORY_PATH", path),
+        patch.object(
+            recover, "_get_adapter", return_value=adapter_cm(_resolved_adapter())
+        ),
+        patch.object(recover, "_check_or_unblock_rfkill", AsyncMock(return_value=True)),
+        patch.object(recover, "_power_cycle_adapter", AsyncMock(return_value=_CYCLED)),
+        patch.object(
+            recover,
+            "_usb_reset_adapter",
+            AsyncMock(return_value=recover.USBResetOutcome.NOT_APPLICABLE),
+        ),
+        patch.object(recover, "_wait_for_bluez", wait_for_bluez),
+    ):
+        assert await recover.recover_adapter(
+            0,
+            "AA:BB:CC:DD:EE:FF",
+            gone_silent=True,
+            config=RecoveryConfig(recovery_history=True),
+        )
+    (record,) = history.read_records(path)
+    assert record.steps["dbus_registration"] >= 0.05
+    assert record.steps["usb_reset"] < 0.05
+    assert sum(record.steps.values()) <= record.duration
+
+
+@pytest.mark.asyncio
+async def test_unwritable_history_is_logged(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    (tmp_path / "file").write_text("")
+    with (
+        patch.object(history, "RECOVERY_HISTORY_PATH", tmp_path / "file" / "history"),
+        patch.object(recover, "_recover_adapter", AsyncMock(return_value=True)),
+    ):
+        assert await recover.recover_adapter(
+            0, "AA:BB:CC:DD:EE:FF", config=RecoveryConfig(recovery_history=True)
+        )
+    assert "Could not record the recovery of AA:BB:CC:DD:EE:FF" in caplog.text
+
+
+# ---------------------------------------------------------------------------
+# Self-tuning timeouts
+# ---------------------------------------------------------------------------
+
+
+@contextmanager
+def _stage_times() -> Iterator[dict[str, float | None]]:
+    stage_times: dict[str, float | None] = {}
+    token = recover._STAGE_TIMES.set(stage_times)
+    try:
+        yield stage_times
+    finally:
+        recover._STAGE_TIMES.reset(token)
+
+
+@pytest.mark.asyncio
+async def test_power_stages_are_timed(adapter: MGMTBluetoothCtl) -> None:
+    with (
+        _stage_times() as stage_times,
+        patch.object(adapter, "set_powered", AsyncMock(return_value=True)),
+        patch.object(
+            adapter, "wait_for_power_state", AsyncMock(side_effect=[False, True])
+        ),
+    ):
+        assert await recover._execute_power_off(adapter, power_state_before_reset=True)
+        assert await recover._execute_power_on(adapter, power_state_before_reset=True)
+    assert set(stage_times) == {"power_off", "power_on"}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("budget", "expected"),
+    [(None, {"power_off": None, "power_on": None}), (-1, {})],
+)
+async def test_power_stage_that_never_completes_is_timed_out(
+    adapter: MGMTBluetoothCtl,
+    budget: float | None,
+    expected: dict[str, float | None],
+) -> None:
+    with (
+        _stage_times() as stage_times,
+        _budget(1000 if budget is None else budget),
+        patch.object(adapter, "set_powered", AsyncMock(return_value=True)),
+        patch.object(
+            adapter, "wait_for_power_state", AsyncMock(side_effect=[True, False])
+        ),
+    ):
+        await recover._execute_power_off(adapter, power_state_before_reset=True)
+        await recover._execute_power_on(adapter, power_state_before_reset=True)
+    # Only a wait the budget did not cut short counts as timed out.
+    assert stage_times == expected
+
+
+@pytest.mark.asyncio
+async def test_rfkill_unblock_and_post_reset_lookup_can_time_out(
+    adapter: MGMTBluetoothCtl,
+) -> None:
+    blocked = RFKillInfo(soft_block=True, hard_block=False, idx=1)
+    with _stage_times() as stage_times:
+        with (
+            patch.object(recover, "_check_rfkill", AsyncMock(return_value=blocked)),
+            patch.object(recover, "_unblock_rfkill", AsyncMock(return_value=True)),
+            patch.object(recover, "RFKILL_UNBLOCK_GRACE_TIME", 0.02),
+            patch.object(recover, "RFKILL_UNBLOCK_POLL_INTERVAL", 0.005),
+        ):
+            assert not await recover._check_or_unblock_rfkill(adapter)
+        with (
+            patch.object(
+                recover, "_get_adapter", side_effect=lambda *_args: adapter_cm(None)
+            ),
+            patch.object(recover.asyncio, "sleep", AsyncMock()),
+        ):
+            assert not await recover._await_adapter_after_usb_reset(
+                "hci0", "AA:BB:CC:DD:EE:FF"
+            )
+    assert stage_times == {"rfkill_unblock": None, "post_reset_lookup": None}
+
+
+@pytest.mark.asyncio
+async def test_rfkill_unblock_and_post_reset_lookup_are_timed(
+    adapter: MGMTBluetoothCtl,
+) -> None:
+    blocked = RFKillInfo(soft_block=True, hard_block=False, idx=1)
+    cleared = RFKillInfo(soft_block=False, hard_block=False, idx=1)
+    with (
+        _stage_times() as stage_times,
+        patch.object(
+            recover,
+            "_check_rfkill",
+            AsyncMock(side_effect=[blocked, cleared, cleared]),
+        ),
+        patch.object(recover, "_unblock_rfkill", AsyncMock(return_value=True)),
+        patch.object(
+            recover,
+            "_get_adapter",
+            side_effect=[adapter_cm(None), adapter_cm(_resolved_adapter())],
+        ),
+        patch.object(recover.asyncio, "sleep", AsyncMock()),
+    ):
+        assert await recover._check_or_unblock_rfkill(adapter)
+        assert await recover._await_adapter_after_usb_reset("hci0", "AA:BB:CC:DD:EE:FF")
+    assert set(stage_times) == {"rfkill_unblock", "post_reset_lookup"}
+
+
+@pytest.mark.asyncio
+async def test_self_tuning_timeouts(tmp_path: Path) -> None:
+    seen: list[float] = []
+
+    async def _recover(_hci_name: str, _mac: str, _gone_silent: bool) -> bool:
+        seen.append(recover._config().power_off_time)
+        recover._stage_completed("power_off", 0.4)
+        return True
+
+    config = RecoveryConfig(self_tuning_timeouts=True)
+    with (
+        patch.object(tuning, "TIMEOUT_TUNING_PATH", tmp_path / "timeouts.json"),
+        patch.object(recover, "_TIMEOUT_TUNER", tuning.TimeoutTuner()),
+        patch.object(recover, "_recover_adapter", _recover),
+    ):
+        for _ in range(tuning.TIMEOUT_TUNING_MIN_SAMPLES + 1):
+            assert await recover.recover_adapter(0, "AA:BB:CC:DD:EE:FF", config=config)
+        # Off unless asked for.
+        assert await recover.recover_adapter(0, "AA:BB:CC:DD:EE:FF")
+    assert seen == [config.power_off_time] * tuning.TIMEOUT_TUNING_MIN_SAMPLES + [
+        pytest.approx(0.6),
+        recover.POWER_OFF_TIME,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_timed_out_stage_gets_its_configured_timeout_back(
+    tmp_path: Path,
+) -> None:
+    seen: list[float] = []
+    timed_out = False
+
+    async def _recover(_hci_name: str, _mac: str, _gone_silent: bool) -> bool:
+        seen.append(recover._config().power_off_time)
+        if timed_out:
+            recover._stage_timed_out("power_off")
+        else:
+            recover._stage_completed("power_off", 0.4)
+        return True
+
+    config = RecoveryConfig(self_tuning_timeouts=True)
+    with (
+        patch.object(tuning, "TIMEOUT_TUNING_PATH", tmp_path / "timeouts.json"),
+        patch.object(recover, "_TIMEOUT_TUNER", tuning.TimeoutTuner()),
+        patch.object(recover, "_recover_adapter", _recover),
+    ):
+        for _ in range(tuning.TIMEOUT_TUNING_MIN_SAMPLES):
+            await recover.recover_adapter(0, "AA:BB:CC:DD:EE:FF", config=config)
+        # A slow power off runs into the tuned timeout.
+        timed_out = True
+        await recover.recover_adapter(0, "AA:BB:CC:DD:EE:FF", config=config)
+        await recover.recover_adapter(0, "AA:BB:CC:DD:EE:FF", config=config)
+    assert seen[-2:] == [pytest.approx(0.6), config.power_off_time]
+
+
+@pytest.mark.asyncio
+async def test_unsaved_tuned_timeouts_are_logged(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    async def _recover(_hci_name: str, _mac: str, _gone_silent: bool) -> bool:
+        recover._stage_completed("power_off", 0.4)
+        return True
+
+    (tmp_path / "file").write_text("")
+    with (
+        patch.object(tuning, "TIMEOUT_TUNING_PATH", tmp_path / "file" / "t.json"),
+        patch.object(recover, "_TIMEOUT_TUNER", tuning.TimeoutTuner()),
+        patch.object(recover, "_recover_adapter", _recover),
+    ):
+        assert await recover.recover_adapter(
+            0, "AA:BB:CC:DD:EE:FF", config=RecoveryConfig(self_tuning_timeouts=True)
+        )
+    assert "Could not save the tuned timeouts of AA:BB:CC:DD:EE:FF" in caplog.text
@@ -0,0 +1,131 @@
+"""Tests for the self-tuning timeouts."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Any
+from unittest.mock import patch
+
+import pytest
+
+from bluetooth_auto_recovery import tuning
+from bluetooth_auto_recovery.config import DEFAULT_CONFIG, RecoveryConfig
+from bluetooth_auto_recovery.tuning import TimeoutTuner
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+MAC = "AA:BB:CC:DD:EE:FF"
+
+
+def _read(path: Path) -> Any:
+    return json.loads(path.read_text())
+
+
+def _write(path: Path, content: str) -> None:
+    path.parent.mkdir()
+    path.write_text(content)
+
+
+@pytest.fixture
+def tuning_path(tmp_path: Path) -> Iterator[Path]:
+    path = tmp_path / "lib" / "timeouts.json"
+    with patch.object(tuning, "TIMEOUT_TUNING_PATH", path):
+        yield path
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("tuning_path")
+async def test_untuned_until_enough_samples() -> None:
+    tuner = TimeoutTuner()
+    for _ in range(tuning.TIMEOUT_TUNING_MIN_SAMPLES - 1):
+        await tuner.observe(MAC, {tuning.POWER_ON: 0.1})
+    assert await tuner.tuned_config(MAC, DEFAULT_CONFIG) is DEFAULT_CONFIG
+    await tuner.observe(MAC, {tuning.POWER_ON: 0.1})
+    tuned = await tuner.tuned_config(MAC, DEFAULT_CONFIG)
+    assert tuned.power_on_time == tuning.TIMEOUT_TUNING_FLOORS[tuning.POWER_ON]
+    assert tuned.power_off_time == DEFAULT_CONFIG.power_off_time
+    assert await tuner.tuned_config("11:22:33:44:55:66", DEFAULT_CONFIG) is (
+        DEFAULT_CONFIG
+    )
+
+
+@pytest.mark.asyncio
+async def test_timed_out_stage_drops_its_samples(tuning_path: Path) -> None:
+    tuner = TimeoutTuner()
+    for _ in range(tuning.TIMEOUT_TUNING_MIN_SAMPLES):
+        await tuner.observe(MAC, {tuning.POWER_ON: 0.1, tuning.POWER_OFF: 0.1})
+    await tuner.observe(MAC, {tuning.POWER_ON: None})
+    tuned = await tuner.tuned_config(MAC, DEFAULT_CONFIG)
+    assert tuned.power_on_time == DEFAULT_CONFIG.power_on_time
+    assert tuned.power_off_time == tuning.TIMEOUT_TUNING_FLOORS[tuning.POWER_OFF]
+    assert set(_read(tuning_path)[MAC]) == {tuning.POWER_OFF}
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("tuning_path")
+async def test_timeouts_follow_a_high_percentile_within_bounds() -> None:
+    tuner = TimeoutTuner()
+    for took in (0.8, 0.6, 0.7, 0.9, 1.0, 0.5, 0.8, 0.7, 0.6, 0.9):
+        await tuner.observe(
+            MAC,
+            {
+                tuning.POWER_OFF: took,
+                tuning.POWER_ON: took * 2,
+                tuning.RFKILL_UNBLOCK: took * 10,
+                tuning.POST_RESET_LOOKUP: took * 2,
+            },
+        )
+    tuned = await tuner.tuned_config(MAC, RecoveryConfig(post_reset_lookup_attempts=3))
+    assert tuned.power_off_time == pytest.approx(1.5)
+    # A slow stage keeps its configured value.
+    assert tuned.power_on_time == DEFAULT_CONFIG.power_on_time
+    assert tuned.rfkill_unblock_grace_time == DEFAULT_CONFIG.rfkill_unblock_grace_time
+    # Spread over the two pauses between three lookups.
+    assert tuned.post_reset_lookup_retry_time == pytest.approx(2 * 1.5 / 2)
+    assert (
+        tuned.post_reset_lookup_retry_time
+        <= DEFAULT_CONFIG.post_reset_lookup_retry_time
+    )
+
+
+@pytest.mark.asyncio
+async def test_only_the_latest_samples_count(tuning_path: Path) -> None:
+    tuner = TimeoutTuner()
+    with patch.object(tuning, "TIMEOUT_TUNING_SAMPLES", 5):
+        for took in (2.0, 2.0, 0.4, 0.4, 0.4, 0.4, 1.3):
+            await tuner.observe(MAC, {tuning.POWER_OFF: took})
+        assert _read(tuning_path) == {
+            MAC: {tuning.POWER_OFF: [0.4, 0.4, 0.4, 0.4, 1.3]}
+        }
+        # Read back from the file by a fresh tuner, as after a restart.
+        tuned = await TimeoutTuner().tuned_config(MAC, DEFAULT_CONFIG)
+    assert tuned.power_off_time == pytest.approx(1.95)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "content",
+    [
+        "not json",
+        "[]",
+        json.dumps({MAC: []}),
+        json.dumps({MAC: {"bogus": [1] * 5, tuning.POWER_OFF: ["x"] * 5}}),
+    ],
+)
+async def test_unusable_file_is_ignored(tuning_path: Path, content: str) -> None:
+    _write(tuning_path, content)
+    tuner = TimeoutTuner()
+    assert await tuner.tuned_config(MAC, DEFAULT_CONFIG) is DEFAULT_CONFIG
+    await tuner.observe(MAC, {tuning.POWER_OFF: 0.25})
+    assert _read(tuning_path)[MAC][tuning.POWER_OFF] == [0.25]
+
+
+@pytest.mark.asyncio
+async def test_unwritable_file_raises(tmp_path: Path) -> None:
+    (tmp_path / "file").write_text("")
+    with patch.object(tuning, "TIMEOUT_TUNING_PATH", tmp_path / "file" / "t.json"):
+        tuner = TimeoutTuner()
+        with pytest.raises(OSError):  # noqa: PT011
+            await tuner.observe(MAC, {tuning.POWER_OFF: 0.25})